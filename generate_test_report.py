@@ -3,19 +3,153 @@
 Generador de reportes PDF para los tests de NutriPAE
 Archivo principal único para ejecutar tests y generar reportes
 """
+import os
 import sys
+import argparse
+import shutil
 import subprocess
 from datetime import datetime
 from pathlib import Path
 
 # Importar utilidades propias
-from utils.test_runner import run_all_tests, organize_tests_by_module, cleanup_temp_files
+from utils.test_runner import (
+    run_all_tests,
+    organize_tests_by_module,
+    cleanup_temp_files,
+    validate_metadata_only,
+)
+from utils.exporters import EXPORTERS, export_report
 from utils.pdf_generator import generate_pdf_report
-from utils.test_metadata_extractor import MetadataError
+from utils.report_cache import ReportCache
+from utils.rerun_cache import LAST_RESULTS_FILE
+from utils.results_collector import RESULTS_FILE, iter_stored_results
+from utils.services import SERVICE_TEST_PATHS
+from utils.test_metadata_extractor import (
+    DuplicateTestIdError,
+    MetadataError,
+    validate_all_tests_have_metadata,
+)
 
 
-def main():
+def parse_args(argv=None):
+    """Procesa los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Ejecuta los tests de NutriPAE y genera el reporte PDF",
+        epilog="Para generar el reporte desde resultados guardados, sin ejecutar "
+               "los tests: nutripae-tests report ARCHIVO [ARCHIVO ...]"
+    )
+    parser.add_argument(
+        "--parallel", action="store_true",
+        help="Ejecutar los servicios en paralelo (un worker de pytest-xdist por servicio)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Número de workers en modo paralelo (por defecto uno por servicio)"
+    )
+    parser.add_argument(
+        "--fast-rerun", action="store_true",
+        help="Re-ejecutar solo los tests fallidos y los de archivos modificados, "
+             "combinando con los resultados guardados del resto"
+    )
+    parser.add_argument(
+        "--no-preflight", action="store_true",
+        help="No verificar la disponibilidad de los servicios antes de ejecutar los tests"
+    )
+    parser.add_argument(
+        "--id", dest="test_ids", action="append", metavar="PATRÓN",
+        help="Ejecutar solo los tests cuyo test_id coincide con el patrón "
+             "(admite comodines, ej: 'INV-MOV-0*'; se puede repetir)"
+    )
+    parser.add_argument(
+        "--module", dest="modules", action="append", metavar="MÓDULO",
+        help="Ejecutar solo los tests del módulo indicado (ej: Compras; se puede repetir)"
+    )
+    parser.add_argument(
+        "--service", dest="services", action="append", choices=sorted(SERVICE_TEST_PATHS),
+        help="Ejecutar solo los tests del servicio indicado (se puede repetir)"
+    )
+    parser.add_argument(
+        "--cassettes", choices=["record", "replay"], default=None,
+        help="Grabar las peticiones HTTP de los tests en .nutripae/cassettes o "
+             "reproducirlas sin backends (sin verificación previa de servicios)"
+    )
+    parser.add_argument(
+        "--replay-speed", type=float, default=1.0, metavar="FACTOR",
+        help="Factor sobre la latencia grabada al reproducir (0 responde de inmediato)"
+    )
+    parser.add_argument(
+        "--fake-backends", choices=["inprocess", "ports"], default=None,
+        help="Ejecutar contra backends simulados en memoria, en el mismo proceso o "
+             "en los puertos locales 8000-8004 (sin verificación previa de servicios)"
+    )
+    _add_output_args(parser)
+    parser.add_argument(
+        "--save-results", metavar="ARCHIVO",
+        help="Guardar los resultados (NDJSON) en este archivo para generar el "
+             "reporte después con el subcomando report, en este u otro host"
+    )
+    parser.add_argument(
+        "--validate-only", action="store_true",
+        help="Solo recolectar los tests y validar su metadata (sin ejecutarlos ni generar el PDF)"
+    )
+    args = parser.parse_args(argv)
+    # La re-ejecución rápida combina con los resultados guardados de la suite
+    # completa; con una selección parcial ese estado quedaría inconsistente
+    if args.fast_rerun and (args.test_ids or args.modules or args.services):
+        parser.error("--fast-rerun no se puede combinar con --id, --module ni --service")
+    return args
+
+
+def parse_report_args(argv=None):
+    """Procesa los argumentos del subcomando report"""
+    parser = argparse.ArgumentParser(
+        prog="nutripae-tests report",
+        description="Genera el reporte desde resultados guardados, sin ejecutar los tests"
+    )
+    parser.add_argument(
+        "results", nargs="*", metavar="ARCHIVO",
+        help="Resultados NDJSON (--save-results, .nutripae/last_results.ndjson) o "
+             ".json de pytest-json-report. Con varios archivos (ejecuciones por "
+             f"partes o de otros hosts) se combinan. Por defecto: {LAST_RESULTS_FILE}"
+    )
+    _add_output_args(parser)
+    return parser.parse_args(argv)
+
+
+def _add_output_args(parser):
+    """Opciones de los reportes generados, comunes a la ejecución y a report"""
+    parser.add_argument(
+        "--format", dest="formats", action="append", choices=["pdf"] + sorted(EXPORTERS),
+        help="Formato del reporte (por defecto pdf; se puede repetir). Si no se "
+             "incluye pdf, el PDF no se genera"
+    )
+    parser.add_argument(
+        "--pdf-workers", type=int, default=1, metavar="N",
+        help="Procesos para renderizar los módulos del PDF en paralelo (0 = uno por núcleo)"
+    )
+    parser.add_argument(
+        "--pdf-cache", action="store_true",
+        help="Reutilizar las secciones del PDF de los módulos que no cambiaron "
+             "(cache en .nutripae/report_cache)"
+    )
+    parser.add_argument(
+        "--toc", action="store_true",
+        help="Incluir en el PDF una tabla de contenido con la página de cada módulo"
+    )
+
+
+def main(argv=None):
     """Función principal del generador de reportes"""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "report":
+        return report_main(argv[1:])
+
+    args = parse_args(argv)
+
+    if args.validate_only:
+        return validate_main()
+
     print("=== Generador de Reportes de Tests NutriPAE ===")
     print("Ejecutando tests de todos los servicios: Auth, Compras, Menús")
     print("Generando reporte PDF con metadata dinámica")
@@ -24,7 +158,21 @@ def main():
     try:
         # 1. Ejecutar todos los tests y validar metadata
         print("PASO 1: Ejecutando tests...")
-        test_results = run_all_tests()
+        test_results = run_all_tests(
+            parallel=args.parallel,
+            workers=args.workers,
+            preflight=not args.no_preflight,
+            fast_rerun=args.fast_rerun,
+            test_ids=args.test_ids,
+            modules=args.modules,
+            services=args.services,
+            cassettes=args.cassettes,
+            replay_speed=args.replay_speed,
+            fake_backends=args.fake_backends,
+        )
+        if args.save_results:
+            shutil.copyfile(RESULTS_FILE, args.save_results)
+            print(f"\nResultados guardados en: {args.save_results}")
         
         # 2. Organizar tests por módulo (orden alfabético)
         print("\nPASO 2: Organizando tests por módulo...")
@@ -34,72 +182,11 @@ def main():
         for module_name, tests in modules.items():
             print(f"   • {module_name}: {len(tests)} tests")
         
-        # 3. Generar PDF
-        print("\nPASO 3: Generando PDF...")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"reporte_tests_nutripae_{timestamp}.pdf"
-        
-        generate_pdf_report(modules, filename)
-        
-        # 4. Mostrar resumen final
-        print("\n" + "="*60)
-        print("REPORTE GENERADO EXITOSAMENTE")
-        print("="*60)
-        print(f"Archivo: {filename}")
-        print(f"Módulos incluidos: {len(modules)}")
-        
-        total_tests = sum(len(tests) for tests in modules.values())
-        total_passed = sum(1 for tests in modules.values() for test in tests if test['outcome'] == 'passed')
-        total_failed = sum(1 for tests in modules.values() for test in tests if test['outcome'] == 'failed')
-        
-        print(f"Total de tests: {total_tests}")
-        print(f"Pasaron: {total_passed}")
-        print(f"Fallaron: {total_failed}")
-        print(f"Porcentaje de éxito: {(total_passed/total_tests)*100:.1f}%")
-        
-        print("\nCaracterísticas del reporte:")
-        print("   • Metadata extraída dinámicamente del código")
-        print("   • Resumen ejecutivo en primera página")
-        print("   • Detalles por módulo en orden alfabético")
-        print("   • Una página por módulo con salto de página")
-        print("   • Tablas con información completa de cada test")
-        
-        print("\nEstructura del PDF:")
-        print("   Página 1: Resumen ejecutivo (todos los servicios)")
-        for i, module_name in enumerate(modules.keys(), 2):
-            print(f"   Página {i}: Módulo {module_name}")
-            
-        print("="*60)
-        
-        # 5. Intentar abrir el PDF automáticamente
-        print("\nIntentando abrir el PDF automáticamente...")
-        try:
-            subprocess.run(['xdg-open', str(filename)], check=False)
-            print("PDF abierto (si tienes un visor PDF instalado)")
-        except Exception as e:
-            print(f"No se pudo abrir automáticamente: {e}")
-            print(f"Abre manually el archivo: {filename}")
+        # 3. Generar los reportes
+        _write_reports(modules, test_results, args)
         
     except MetadataError as e:
-        print("\nERROR DE METADATA:")
-        print(str(e))
-        print("\nSolución:")
-        print("   Agrega @test_info o docstring estructurado a todos los tests")
-        print("   Ejemplo usando decorador:")
-        print("   @test_info(")
-        print("       description='Descripción del test',")
-        print("       expected_result='Status Code: 200',")
-        print("       module='Nombre del módulo',")
-        print("       test_id='ID-001'")
-        print("   )")
-        print("\n   Ejemplo usando docstring:")
-        print("   def test_ejemplo():")
-        print("       '''")
-        print("       Descripción del test")
-        print("       Expected: Status Code: 200")
-        print("       Module: Nombre del módulo")
-        print("       ID: ID-001")
-        print("       '''")
+        _print_metadata_error(e)
         sys.exit(1)
         
     except Exception as e:
@@ -112,5 +199,168 @@ def main():
         cleanup_temp_files()
 
 
+def validate_main():
+    """Valida la metadata de los tests sin ejecutarlos (--validate-only)"""
+    print("=== Validación de Metadata de Tests NutriPAE ===")
+    print()
+    try:
+        validate_metadata_only()
+    except DuplicateTestIdError as e:
+        _print_duplicate_error(e)
+        sys.exit(1)
+    except MetadataError as e:
+        _print_metadata_error(e)
+        sys.exit(1)
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
+        sys.exit(1)
+
+
+def report_main(argv=None):
+    """
+    Subcomando report: genera el reporte desde resultados guardados
+
+    No ejecuta tests ni accede a los servicios, y no borra los archivos de
+    entrada, por lo que la ejecución puede hacerse en otro host.
+    """
+    args = parse_report_args(argv)
+    paths = args.results or [str(LAST_RESULTS_FILE)]
+
+    print("=== Generador de Reportes de Tests NutriPAE ===")
+    print(f"Generando reporte desde resultados guardados: {', '.join(paths)}")
+    print()
+
+    try:
+        # 1. Combinar los resultados y validar la metadata
+        print("PASO 1: Leyendo resultados guardados...")
+        test_results = validate_all_tests_have_metadata(iter_stored_results(paths))
+        if not len(test_results):
+            raise RuntimeError("Los archivos de resultados no contienen tests")
+        print(f"Tests leídos: {len(test_results)}")
+
+        # 2. Organizar tests por módulo (orden alfabético)
+        print("\nPASO 2: Organizando tests por módulo...")
+        modules = organize_tests_by_module(test_results)
+        for module_name, tests in modules.items():
+            print(f"   • {module_name}: {len(tests)} tests")
+
+        # 3. Generar los reportes
+        _write_reports(modules, test_results, args)
+
+    except MetadataError as e:
+        _print_metadata_error(e)
+        sys.exit(1)
+
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
+        sys.exit(1)
+
+
+def _write_reports(modules, test_results, args):
+    """Genera los reportes seleccionados con --format y abre el PDF"""
+    formats = args.formats or ["pdf"]
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    basename = f"reporte_tests_nutripae_{timestamp}"
+    filename = f"{basename}.pdf"
+
+    exports = [fmt for fmt in formats if fmt != "pdf"]
+    if exports:
+        print(f"\nPASO 3: Exportando reportes ({', '.join(exports)})...")
+        export_report(modules, exports, basename)
+
+    if "pdf" not in formats:
+        _print_totals(test_results)
+        return
+
+    print("\nPASO 3: Generando PDF...")
+    pdf_workers = args.pdf_workers or os.cpu_count() or 1
+    report_cache = None
+    if args.pdf_cache:
+        report_cache = ReportCache()
+        report_cache.prune()
+    generate_pdf_report(modules, filename, workers=pdf_workers, toc=args.toc, cache=report_cache)
+    
+    # 4. Mostrar resumen final
+    print("\n" + "="*60)
+    print("REPORTE GENERADO EXITOSAMENTE")
+    print("="*60)
+    print(f"Archivo: {filename}")
+    print(f"Módulos incluidos: {len(modules)}")
+    _print_totals(test_results)
+    
+    print("\nCaracterísticas del reporte:")
+    print("   • Metadata extraída dinámicamente del código")
+    print("   • Resumen ejecutivo en primera página")
+    print("   • Detalles por módulo en orden alfabético")
+    print("   • Una página por módulo con salto de página")
+    print("   • Tablas con información completa de cada test")
+    
+    print("\nEstructura del PDF:")
+    print("   Página 1: Resumen ejecutivo (todos los servicios)")
+    for i, module_name in enumerate(modules.keys(), 2):
+        print(f"   Página {i}: Módulo {module_name}")
+        
+    print("="*60)
+    
+    # 5. Intentar abrir el PDF automáticamente
+    print("\nIntentando abrir el PDF automáticamente...")
+    try:
+        subprocess.run(['xdg-open', str(filename)], check=False)
+        print("PDF abierto (si tienes un visor PDF instalado)")
+    except Exception as e:
+        print(f"No se pudo abrir automáticamente: {e}")
+        print(f"Abre manually el archivo: {filename}")
+
+
+def _print_metadata_error(e):
+    """Muestra un error de metadata con ejemplos de cómo corregirlo"""
+    print("\nERROR DE METADATA:")
+    print(str(e))
+    print("\nSolución:")
+    print("   Agrega @test_info o docstring estructurado a todos los tests")
+    print("   Ejemplo usando decorador:")
+    print("   @test_info(")
+    print("       description='Descripción del test',")
+    print("       expected_result='Status Code: 200',")
+    print("       module='Nombre del módulo',")
+    print("       test_id='ID-001'")
+    print("   )")
+    print("\n   Ejemplo usando docstring:")
+    print("   def test_ejemplo():")
+    print("       '''")
+    print("       Descripción del test")
+    print("       Expected: Status Code: 200")
+    print("       Module: Nombre del módulo")
+    print("       ID: ID-001")
+    print("       '''")
+
+
+def _print_duplicate_error(e):
+    """Muestra los test_id repetidos dentro de un servicio y cómo corregirlos"""
+    print("\nERROR DE METADATA:")
+    print(str(e))
+    print("\nSolución:")
+    print("   Cada test_id debe ser único dentro de su servicio (puede repetirse")
+    print("   entre servicios distintos). Asigna un test_id nuevo en @add_test_info")
+    print("   o en el docstring de todos los tests listados menos uno:")
+    for (service, test_id), nodeids in e.duplicates.items():
+        print(f"   • {test_id} ({service}): {len(nodeids)} tests")
+
+
+def _print_totals(test_results):
+    """Muestra los totales de la ejecución"""
+    counts = test_results.counts()
+    total_tests = len(test_results)
+    total_passed = counts['passed']
+    total_failed = counts['failed']
+    total_unavailable = counts['unavailable']
+    
+    print(f"Total de tests: {total_tests}")
+    print(f"Pasaron: {total_passed}")
+    print(f"Fallaron: {total_failed}")
+    print(f"Servicio no disponible: {total_unavailable}")
+    print(f"Porcentaje de éxito: {(total_passed/total_tests)*100:.1f}%")
+
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -3,10 +3,10 @@ Integration tests for Authentication Controller Endpoints
 Test cases: AUTH-004 to AUTH-009
 """
 import pytest
-import httpx
 import time
 
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 # Helper to create unique user data for each test run
@@ -31,7 +31,7 @@ async def test_register_success():
     """Test successful user registration"""
     user_data = unique_user_data("register_success")
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/auth/register", json=user_data)
     
     assert response.status_code == 201
@@ -56,7 +56,7 @@ async def test_register_duplicate_email():
         "password": "Password123!"
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/auth/register", json=user_data)
     
     assert response.status_code == 400
@@ -74,7 +74,7 @@ async def test_change_password_success():
     original_password = settings.BASE_USER_PASSWORD
     new_password = "NewPassword456!"
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         # 1. Login with original password to get token
         login_data = {"email": settings.BASE_USER_EMAIL, "password": original_password}
         login_response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/auth/login", json=login_data)
@@ -120,7 +120,7 @@ async def test_change_password_success():
 )
 async def test_change_password_wrong_old_password():
     """Test password change with incorrect old password should return 400"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         # Login to get token
         login_data = {"email": settings.BASE_USER_EMAIL, "password": settings.BASE_USER_PASSWORD}
         login_response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/auth/login", json=login_data)
@@ -146,7 +146,7 @@ async def test_change_password_wrong_old_password():
 )
 async def test_forgot_password_success():
     """Test forgot password endpoint (always returns success for security)"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/auth/forgot-password", params={"email": settings.ADMIN_USER_EMAIL})
     
     assert response.status_code == 200
@@ -161,7 +161,7 @@ async def test_forgot_password_success():
 )
 async def test_forgot_password_nonexistent_email():
     """Test forgot password with non-existent email (should still return success for security)"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/auth/forgot-password", params={"email": "nonexistent.user.test@example.com"})
     
     assert response.status_code == 200
@@ -3,9 +3,9 @@ Integration tests for Authorization Controller Endpoints
 Test cases: AUTH-010 to AUTH-023
 """
 import pytest
-import httpx
 
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 
@@ -24,7 +24,7 @@ async def test_check_authorization_success(auth_token: str):
         "required_permissions": ["user:list"]
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/authorization/check-authorization", json=auth_request, headers=headers)
     
     assert response.status_code == 200
@@ -47,7 +47,7 @@ async def test_check_authorization_insufficient_permissions(basic_user_token: st
         "required_permissions": ["user:create"]  # Basic user doesn't have this permission
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/authorization/check-authorization", json=auth_request, headers=headers)
     
     assert response.status_code == 200
@@ -70,7 +70,7 @@ async def test_check_authorization_no_token():
         "required_permissions": ["user:list"]
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/authorization/check-authorization", json=auth_request)
     
     assert response.status_code == 403
@@ -91,7 +91,7 @@ async def test_check_authorization_invalid_token():
         "required_permissions": ["user:list"]
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/authorization/check-authorization", json=auth_request, headers=headers)
     
     assert response.status_code == 401
@@ -107,7 +107,7 @@ async def test_get_user_permissions_success(auth_token: str):
     """Test successful retrieval of user permissions with valid token"""
     headers = {"Authorization": f"Bearer {auth_token}"}
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/authorization/user-permissions", headers=headers)
     
     assert response.status_code == 200
@@ -125,7 +125,7 @@ async def test_get_user_permissions_success(auth_token: str):
 )
 async def test_get_user_permissions_no_token():
     """Test user permissions retrieval without token should return 403"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/authorization/user-permissions")
     
     assert response.status_code == 403
@@ -141,7 +141,7 @@ async def test_get_user_permissions_invalid_token():
     """Test user permissions retrieval with invalid token should return 401"""
     headers = {"Authorization": "Bearer invalid_token_123"}
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/authorization/user-permissions", headers=headers)
     
     assert response.status_code == 401
@@ -157,7 +157,7 @@ async def test_get_user_info_success(auth_token: str):
     """Test successful retrieval of user info with valid token"""
     headers = {"Authorization": f"Bearer {auth_token}"}
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/auth/me", headers=headers)
     
     assert response.status_code == 200
@@ -175,7 +175,7 @@ async def test_get_user_info_success(auth_token: str):
 )
 async def test_get_user_info_no_token():
     """Test user info retrieval without token should return 403"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/auth/me")
     
     assert response.status_code == 403
@@ -191,7 +191,7 @@ async def test_get_user_info_invalid_token():
     """Test user info retrieval with invalid token should return 401"""
     headers = {"Authorization": "Bearer invalid_token_123"}
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/auth/me", headers=headers)
     
     assert response.status_code == 401
\ No newline at end of file
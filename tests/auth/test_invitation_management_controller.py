@@ -3,10 +3,10 @@ Integration tests for Invitation Management Controller Endpoints
 Test cases: AUTH-045 and onwards
 """
 import pytest
-import httpx
 import time
 
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 # Helper for unique email
@@ -30,7 +30,7 @@ async def test_create_invitation_success(auth_token: str):
     }
     headers = {"Authorization": f"Bearer {auth_token}"}
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/invitations/", json=invitation_data, headers=headers)
     
     assert response.status_code == 201
@@ -55,7 +55,7 @@ async def test_create_invitation_non_existent_role(auth_token: str):
     }
     headers = {"Authorization": f"Bearer {auth_token}"}
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/invitations/", json=invitation_data, headers=headers)
         
     # NOTE: The API currently returns 201 even for non-existent roles.
@@ -73,7 +73,7 @@ async def test_create_invitation_non_existent_role(auth_token: str):
 async def test_list_invitations_success(auth_token: str):
     """Test successful listing of invitations"""
     headers = {"Authorization": f"Bearer {auth_token}"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/invitations/", headers=headers)
     
     assert response.status_code == 200
@@ -92,12 +92,12 @@ async def test_validate_invitation_code_success(auth_token: str):
     # First, create an invitation to get a valid code
     invitation_data = {"email": unique_email("validate_success"), "role_ids": [2]}
     headers = {"Authorization": f"Bearer {auth_token}"}
-    create_response = await httpx.AsyncClient().post(f"{settings.BASE_AUTH_BACKEND_URL}/invitations/", json=invitation_data, headers=headers)
+    create_response = await pooled_client().post(f"{settings.BASE_AUTH_BACKEND_URL}/invitations/", json=invitation_data, headers=headers)
     assert create_response.status_code == 201
     invitation_code = create_response.json()["code"]
 
     # Now, validate it (no auth needed)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/invitations/validate/{invitation_code}")
     
     assert response.status_code == 200
@@ -118,7 +118,7 @@ async def test_validate_invitation_code_success(auth_token: str):
 async def test_validate_invitation_code_not_found():
     """Test validation of a non-existent invitation code"""
     invalid_code = "this-code-does-not-exist"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/invitations/validate/{invalid_code}")
         
     assert response.status_code == 200
@@ -137,12 +137,12 @@ async def test_cancel_invitation_success(auth_token: str):
     # Create an invitation to cancel
     invitation_data = {"email": unique_email("cancel_success"), "role_ids": [2]}
     headers = {"Authorization": f"Bearer {auth_token}"}
-    create_response = await httpx.AsyncClient().post(f"{settings.BASE_AUTH_BACKEND_URL}/invitations/", json=invitation_data, headers=headers)
+    create_response = await pooled_client().post(f"{settings.BASE_AUTH_BACKEND_URL}/invitations/", json=invitation_data, headers=headers)
     assert create_response.status_code == 201
     invitation_id = create_response.json()["id"]
 
     # Cancel the invitation
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(f"{settings.BASE_AUTH_BACKEND_URL}/invitations/{invitation_id}/cancel", headers=headers)
 
     assert response.status_code == 200
@@ -3,9 +3,9 @@ Integration tests for Parametric Data Controller Endpoints
 Test cases: AUTH-051 and onwards
 """
 import pytest
-import httpx
 
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 # PARAMETRIC DATA TESTS
@@ -19,7 +19,7 @@ from ..test_metadata import add_test_info
 async def test_list_user_statuses_success(auth_token: str):
     """Test successful listing of user statuses"""
     headers = {"Authorization": f"Bearer {auth_token}"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/parametric/user-statuses/", headers=headers)
     
     assert response.status_code == 200
@@ -36,7 +36,7 @@ async def test_list_user_statuses_success(auth_token: str):
 )
 async def test_list_user_statuses_no_auth(auth_token: str):
     """Test listing user statuses fails without a token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/parametric/user-statuses/")
     
     assert response.status_code == 403
@@ -50,7 +50,7 @@ async def test_list_user_statuses_no_auth(auth_token: str):
 async def test_list_invitation_statuses_success(auth_token: str):
     """Test successful listing of invitation statuses"""
     headers = {"Authorization": f"Bearer {auth_token}"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/parametric/invitation-statuses/", headers=headers)
     
     assert response.status_code == 200
@@ -67,7 +67,7 @@ async def test_list_invitation_statuses_success(auth_token: str):
 async def test_list_api_versions_success(auth_token: str):
     """Test successful listing of API versions"""
     headers = {"Authorization": f"Bearer {auth_token}"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/parametric/api-versions/", headers=headers)
     
     assert response.status_code == 200
@@ -84,7 +84,7 @@ async def test_list_api_versions_success(auth_token: str):
 async def test_list_http_methods_success(auth_token: str):
     """Test successful listing of HTTP methods"""
     headers = {"Authorization": f"Bearer {auth_token}"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/parametric/http-methods/", headers=headers)
     
     assert response.status_code == 200
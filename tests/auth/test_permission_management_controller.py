@@ -3,9 +3,9 @@ Integration tests for Permission Management Controller Endpoints
 Test cases: AUTH-040 and onwards
 """
 import pytest
-import httpx
 
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 # PERMISSION MANAGEMENT TESTS
@@ -19,7 +19,7 @@ from ..test_metadata import add_test_info
 async def test_list_permissions_success(auth_token: str):
     """Test successful listing of all system permissions"""
     headers = {"Authorization": f"Bearer {auth_token}"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/permissions/", headers=headers)
     
     assert response.status_code == 200
@@ -36,7 +36,7 @@ async def test_list_permissions_success(auth_token: str):
 )
 async def test_list_permissions_no_auth(auth_token: str):
     """Test listing permissions fails without token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/permissions/")
     
     assert response.status_code == 403
@@ -52,7 +52,7 @@ async def test_get_permission_by_id_success(auth_token: str):
     """Test successful retrieval of a permission by ID"""
     headers = {"Authorization": f"Bearer {auth_token}"}
     permission_id = 1 # Assuming a permission with ID 1 exists
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/permissions/{permission_id}", headers=headers)
     
     assert response.status_code == 200
@@ -71,7 +71,7 @@ async def test_get_permission_by_name_success(auth_token: str):
     headers = {"Authorization": f"Bearer {auth_token}"}
     # Assuming a common permission like 'user:list' exists
     permission_name = "user:list"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/permissions/by-name/{permission_name}", headers=headers)
     
     assert response.status_code == 200
@@ -89,7 +89,7 @@ async def test_get_permission_by_name_not_found(auth_token: str):
     """Test getting a non-existent permission by name returns 404"""
     headers = {"Authorization": f"Bearer {auth_token}"}
     permission_name = "non:existent:permission"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/permissions/by-name/{permission_name}", headers=headers)
     
     assert response.status_code == 404 
\ No newline at end of file
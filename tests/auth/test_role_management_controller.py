@@ -3,10 +3,10 @@ Integration tests for Role Management Controller Endpoints
 Test cases: AUTH-032 and onwards
 """
 import pytest
-import httpx
 import time
 
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 # Helper to create unique role data
@@ -31,7 +31,7 @@ async def test_create_role_success(auth_token: str):
     role_data = unique_role_data("create_success")
     headers = {"Authorization": f"Bearer {auth_token}"}
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/roles/", json=role_data, headers=headers)
     
     assert response.status_code == 201
@@ -41,7 +41,7 @@ async def test_create_role_success(auth_token: str):
 
     # Cleanup
     role_id = data["id"]
-    await httpx.AsyncClient().delete(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{role_id}", headers=headers)
+    await pooled_client().delete(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{role_id}", headers=headers)
 
 
 @add_test_info(
@@ -56,19 +56,19 @@ async def test_create_role_duplicate_name(auth_token: str):
     headers = {"Authorization": f"Bearer {auth_token}"}
 
     # Create the role first
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response1 = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/roles/", json=role_data, headers=headers)
     assert response1.status_code == 201
     role_id = response1.json()["id"]
 
     # Try to create it again
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response2 = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/roles/", json=role_data, headers=headers)
     
     assert response2.status_code == 400
 
     # Cleanup
-    await httpx.AsyncClient().delete(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{role_id}", headers=headers)
+    await pooled_client().delete(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{role_id}", headers=headers)
 
 
 @add_test_info(
@@ -80,7 +80,7 @@ async def test_create_role_duplicate_name(auth_token: str):
 async def test_list_roles_success(auth_token: str):
     """Test successful listing of roles"""
     headers = {"Authorization": f"Bearer {auth_token}"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/roles/", headers=headers)
     
     assert response.status_code == 200
@@ -100,11 +100,11 @@ async def test_get_role_by_id_success(auth_token: str):
     
     # Create a role to fetch
     role_data = unique_role_data("get_success")
-    create_response = await httpx.AsyncClient().post(f"{settings.BASE_AUTH_BACKEND_URL}/roles/", json=role_data, headers=headers)
+    create_response = await pooled_client().post(f"{settings.BASE_AUTH_BACKEND_URL}/roles/", json=role_data, headers=headers)
     assert create_response.status_code == 201
     role_id = create_response.json()["id"]
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{role_id}", headers=headers)
         
     assert response.status_code == 200
@@ -113,7 +113,7 @@ async def test_get_role_by_id_success(auth_token: str):
     assert data["name"] == role_data["name"]
 
     # Cleanup
-    await httpx.AsyncClient().delete(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{role_id}", headers=headers)
+    await pooled_client().delete(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{role_id}", headers=headers)
 
 
 @add_test_info(
@@ -128,13 +128,13 @@ async def test_update_role_success(auth_token: str):
     
     # Create a role to update
     role_data = unique_role_data("update_success")
-    create_response = await httpx.AsyncClient().post(f"{settings.BASE_AUTH_BACKEND_URL}/roles/", json=role_data, headers=headers)
+    create_response = await pooled_client().post(f"{settings.BASE_AUTH_BACKEND_URL}/roles/", json=role_data, headers=headers)
     assert create_response.status_code == 201
     role_id = create_response.json()["id"]
 
     # Update data
     update_data = {"description": "Updated Description"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{role_id}", json=update_data, headers=headers)
         
     assert response.status_code == 200
@@ -142,7 +142,7 @@ async def test_update_role_success(auth_token: str):
     assert data["description"] == "Updated Description"
 
     # Cleanup
-    await httpx.AsyncClient().delete(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{role_id}", headers=headers)
+    await pooled_client().delete(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{role_id}", headers=headers)
 
 
 @add_test_info(
@@ -157,17 +157,17 @@ async def test_delete_role_success(auth_token: str):
     
     # Create a role to delete
     role_data = unique_role_data("delete_success")
-    create_response = await httpx.AsyncClient().post(f"{settings.BASE_AUTH_BACKEND_URL}/roles/", json=role_data, headers=headers)
+    create_response = await pooled_client().post(f"{settings.BASE_AUTH_BACKEND_URL}/roles/", json=role_data, headers=headers)
     assert create_response.status_code == 201
     role_id = create_response.json()["id"]
 
     # Delete it
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{role_id}", headers=headers)
     assert response.status_code == 200
 
     # Verify it's gone
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         verify_response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{role_id}", headers=headers)
     assert verify_response.status_code == 404
 
@@ -183,7 +183,7 @@ async def test_get_role_users_success(auth_token: str):
     headers = {"Authorization": f"Bearer {auth_token}"}
     admin_role_id = 1 # Assuming admin role is ID 1
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{admin_role_id}/users", headers=headers)
 
     assert response.status_code == 200
@@ -203,7 +203,7 @@ async def test_get_role_users_not_found(auth_token: str):
     """Test getting users for a non-existent role"""
     headers = {"Authorization": f"Bearer {auth_token}"}
     non_existent_role_id = 999999
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/roles/{non_existent_role_id}/users", headers=headers)
 
     assert response.status_code == 404 
\ No newline at end of file
@@ -3,10 +3,10 @@ Integration tests for User Management Controller Endpoints
 Test cases: AUTH-024 and onwards
 """
 import pytest
-import httpx
 import time
 
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 # Helper to create unique user data for each test run
@@ -33,7 +33,7 @@ async def test_create_user_success(auth_token: str):
     user_data = unique_user_data("create_success")
     headers = {"Authorization": f"Bearer {auth_token}"}
 
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/users/", json=user_data, headers=headers)
 
     assert response.status_code == 201
@@ -43,7 +43,7 @@ async def test_create_user_success(auth_token: str):
 
     # Cleanup
     user_id = data["id"]
-    await httpx.AsyncClient().delete(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", headers=headers)
+    await pooled_client().delete(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", headers=headers)
 
 
 @add_test_info(
@@ -57,7 +57,7 @@ async def test_create_user_insufficient_permissions(basic_user_token: str):
     user_data = unique_user_data("create_fail")
     headers = {"Authorization": f"Bearer {basic_user_token}"}
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(f"{settings.BASE_AUTH_BACKEND_URL}/users/", json=user_data, headers=headers)
         
     assert response.status_code == 403 # Forbidden
@@ -72,7 +72,7 @@ async def test_create_user_insufficient_permissions(basic_user_token: str):
 async def test_list_users_success(auth_token: str):
     """Test successful listing of users"""
     headers = {"Authorization": f"Bearer {auth_token}"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/users/", headers=headers)
     
     assert response.status_code == 200
@@ -92,12 +92,12 @@ async def test_get_user_by_id_success(auth_token: str):
     
     # First, create a user to fetch
     user_data = unique_user_data("get_success")
-    create_response = await httpx.AsyncClient().post(f"{settings.BASE_AUTH_BACKEND_URL}/users/", json=user_data, headers=headers)
+    create_response = await pooled_client().post(f"{settings.BASE_AUTH_BACKEND_URL}/users/", json=user_data, headers=headers)
     assert create_response.status_code == 201
     user_id = create_response.json()["id"]
 
     # Fetch the user
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", headers=headers)
 
     assert response.status_code == 200
@@ -106,7 +106,7 @@ async def test_get_user_by_id_success(auth_token: str):
     assert data["email"] == user_data["email"]
 
     # Cleanup
-    await httpx.AsyncClient().delete(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", headers=headers)
+    await pooled_client().delete(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", headers=headers)
 
 
 @add_test_info(
@@ -119,7 +119,7 @@ async def test_get_user_by_id_not_found(auth_token: str):
     """Test retrieval of a non-existent user should return 404"""
     headers = {"Authorization": f"Bearer {auth_token}"}
     non_existent_id = 999999
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_AUTH_BACKEND_URL}/users/{non_existent_id}", headers=headers)
         
     assert response.status_code == 404
@@ -137,13 +137,13 @@ async def test_update_user_success(auth_token: str):
     
     # Create a user to update
     user_data = unique_user_data("update_success")
-    create_response = await httpx.AsyncClient().post(f"{settings.BASE_AUTH_BACKEND_URL}/users/", json=user_data, headers=headers)
+    create_response = await pooled_client().post(f"{settings.BASE_AUTH_BACKEND_URL}/users/", json=user_data, headers=headers)
     assert create_response.status_code == 201
     user_id = create_response.json()["id"]
     
     # Update the user's full name
     update_data = {"full_name": "Updated Full Name"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", json=update_data, headers=headers)
 
     assert response.status_code == 200
@@ -152,7 +152,7 @@ async def test_update_user_success(auth_token: str):
     assert data["id"] == user_id
 
     # Cleanup
-    await httpx.AsyncClient().delete(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", headers=headers)
+    await pooled_client().delete(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", headers=headers)
 
 
 @add_test_info(
@@ -167,18 +167,18 @@ async def test_delete_user_success(auth_token: str):
     
     # Create a user to delete
     user_data = unique_user_data("delete_success")
-    create_response = await httpx.AsyncClient().post(f"{settings.BASE_AUTH_BACKEND_URL}/users/", json=user_data, headers=headers)
+    create_response = await pooled_client().post(f"{settings.BASE_AUTH_BACKEND_URL}/users/", json=user_data, headers=headers)
     assert create_response.status_code == 201
     user_id = create_response.json()["id"]
     
     # Delete the user
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         delete_response = await client.delete(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", headers=headers)
 
     assert delete_response.status_code == 200
     
     # Verify the user is marked as deleted (e.g., status changed or not found on list)
-    get_response = await httpx.AsyncClient().get(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", headers=headers)
+    get_response = await pooled_client().get(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", headers=headers)
     assert get_response.status_code == 200
     # Assuming status 2 corresponds to 'deleted' or 'inactive'
     assert get_response.json()["status_id"] != 1 
@@ -197,15 +197,15 @@ async def test_delete_user_insufficient_permissions(auth_token: str, basic_user_
 
     # Admin creates a user
     user_data = unique_user_data("delete_fail")
-    create_response = await httpx.AsyncClient().post(f"{settings.BASE_AUTH_BACKEND_URL}/users/", json=user_data, headers=admin_headers)
+    create_response = await pooled_client().post(f"{settings.BASE_AUTH_BACKEND_URL}/users/", json=user_data, headers=admin_headers)
     assert create_response.status_code == 201
     user_id = create_response.json()["id"]
 
     # Basic user tries to delete it
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", headers=basic_headers)
 
     assert response.status_code == 403
 
     # Cleanup by admin
-    await httpx.AsyncClient().delete(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", headers=admin_headers) 
\ No newline at end of file
+    await pooled_client().delete(f"{settings.BASE_AUTH_BACKEND_URL}/users/{user_id}", headers=admin_headers) 
\ No newline at end of file
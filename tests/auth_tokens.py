@@ -0,0 +1,158 @@
+"""
+Cache de tokens de autenticación compartido entre workers y ejecuciones
+
+El login es el endpoint más lento del backend de autenticación (hash de la
+contraseña) y con pytest-xdist cada worker lo repetía en sus fixtures de
+sesión. Los tokens se guardan en .nutripae/auth_tokens.json por URL de login,
+usuario y hash de la contraseña (cambiarla en .env invalida la entrada); el
+archivo se actualiza con un lock exclusivo, de modo que si varios workers
+piden el mismo token a la vez solo el primero hace login y el resto lee su
+resultado. La expiración se toma del claim ``exp`` del JWT y el token se
+renueva antes de vencer (AUTH_TOKEN_REFRESH_MARGIN).
+
+Un token leído del archivo puede haber sido emitido antes de reiniciar el
+backend, recargar la base de datos o rotar el secreto: la primera vez que un
+proceso lo usa se verifica con GET /auth/me y, si el backend responde 401, se
+descarta y se hace login de nuevo.
+"""
+import base64
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin lock entre procesos, cada uno puede hacer login
+    fcntl = None
+
+from tests.config import settings
+from tests.http_clients import pooled_client
+
+AUTH_TOKEN_CACHE = Path(".nutripae") / "auth_tokens.json"
+
+# Vigencia asumida si el token no trae un claim exp legible
+DEFAULT_TOKEN_TTL = 15 * 60
+
+# Tokens ya leídos en este proceso: clave → {"access_token", "expires_at"}
+_tokens: Dict[str, dict] = {}
+
+
+def token_expiry(token: str) -> Optional[float]:
+    """
+    Retorna el claim exp (timestamp) de un JWT, sin verificar la firma
+
+    Returns:
+        Timestamp de expiración, o None si el token no es un JWT o no tiene exp
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _is_fresh(entry: Optional[dict]) -> bool:
+    return bool(entry) and entry["expires_at"] - time.time() > settings.AUTH_TOKEN_REFRESH_MARGIN
+
+
+def _read_cache(path: Path) -> Dict[str, dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(path: Path, cache: Dict[str, dict]):
+    """Escribe el cache de forma atómica, legible solo por el usuario"""
+    now = time.time()
+    cache = {key: entry for key, entry in cache.items() if entry["expires_at"] > now}
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def _locked(path: Path):
+    """Lock exclusivo entre procesos sobre el archivo .lock del cache"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_suffix(".lock"), "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+async def _login(login_url: str, email: str, password: str, timeout: float) -> dict:
+    async with pooled_client() as client:
+        response = await client.post(login_url, json={"email": email, "password": password}, timeout=timeout)
+    response.raise_for_status()
+    token = response.json()["access_token"]
+    return {"access_token": token, "expires_at": token_expiry(token) or time.time() + DEFAULT_TOKEN_TTL}
+
+
+async def _is_rejected(verify_url: str, token: str, timeout: float) -> bool:
+    """True si el backend responde 401 al token (cualquier otra respuesta lo acepta)"""
+    async with pooled_client() as client:
+        response = await client.get(verify_url, headers={"Authorization": f"Bearer {token}"}, timeout=timeout)
+    return response.status_code == 401
+
+
+def _cache_key(login_url: str, email: str, password: str) -> str:
+    password_hash = hashlib.sha256(password.encode("utf-8")).hexdigest()[:16]
+    return f"{login_url}|{email}|{password_hash}"
+
+
+async def get_token(login_url: str, email: str, password: str, timeout: float = 20,
+                    path: Path = AUTH_TOKEN_CACHE, verify_url: Optional[str] = None) -> str:
+    """
+    Retorna un token vigente para el usuario, haciendo login solo si hace falta
+
+    Args:
+        login_url: URL completa del endpoint de login
+        email: Email del usuario
+        password: Contraseña del usuario
+        timeout: Timeout del login en segundos
+        path: Archivo del cache compartido
+        verify_url: Endpoint autenticado con que se verifica un token leído
+            del archivo (por defecto /me junto al endpoint de login)
+
+    Returns:
+        El access_token
+
+    Raises:
+        httpx.RequestError, httpx.HTTPStatusError: Si el login falla
+        KeyError: Si la respuesta del login no incluye access_token
+    """
+    if not settings.AUTH_TOKEN_CACHE:
+        return (await _login(login_url, email, password, timeout))["access_token"]
+
+    key = _cache_key(login_url, email, password)
+    entry = _tokens.get(key)
+    if _is_fresh(entry):
+        return entry["access_token"]
+
+    verify_url = verify_url or f"{login_url.rstrip('/').rsplit('/', 1)[0]}/me"
+    with _locked(path):
+        cache = _read_cache(path)
+        entry = cache.get(key)
+        if _is_fresh(entry) and await _is_rejected(verify_url, entry["access_token"], timeout):
+            # Token emitido antes de reiniciar el backend o rotar su secreto
+            cache.pop(key)
+            entry = None
+        if not _is_fresh(entry):
+            entry = await _login(login_url, email, password, timeout)
+            cache[key] = entry
+            _write_cache(path, cache)
+
+    _tokens[key] = entry
+    return entry["access_token"]
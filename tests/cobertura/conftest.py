@@ -1,13 +1,13 @@
 import pytest
-import httpx
 import uuid
 import random
 from ..config import settings
+from ..http_clients import pooled_client
 
 # Fixture to create a department and clean up afterwards
 @pytest.fixture(scope="module")
 async def department(auth_token):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         random_number = random.randint(10000, 99999)
         # Create department
         department_data = {"name": f"Test Department-{random_number}", "dane_code": f"{random_number}"}
@@ -29,7 +29,7 @@ async def department(auth_token):
 # Fixture to create a town and clean up afterwards
 @pytest.fixture(scope="module")
 async def town(auth_token, department):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         random_number = random.randint(10000, 99999)
         town_data = {"name": f"Test Town-{random_number}", "dane_code": f"{random_number}", "department_id": department["id"]}
         response = await client.post(
@@ -44,7 +44,7 @@ async def town(auth_token, department):
 # Fixture to create an institution
 @pytest.fixture(scope="module")
 async def institution(auth_token, town):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         random_number = random.randint(10000, 99999)
         institution_data = {
             "name": f"Test Institution-{random_number}",
@@ -64,7 +64,7 @@ async def institution(auth_token, town):
 # Fixture to create a campus
 @pytest.fixture(scope="module")
 async def campus(auth_token, institution):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         random_number = random.randint(10000, 99999)
         campus_data = {
             "name": f"Test Campus-{random_number}",
@@ -86,7 +86,7 @@ async def campus(auth_token, institution):
 # Parametric data fixtures
 @pytest.fixture(scope="module")
 async def benefit_type(auth_token):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/benefit-types",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -106,21 +106,21 @@ async def benefit_type(auth_token):
 
 @pytest.fixture(scope="module")
 async def document_type(auth_token):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/document-types", headers={"Authorization": f"Bearer {auth_token}"})
         assert response.status_code == 200
         yield response.json()[0]
 
 @pytest.fixture(scope="module")
 async def gender(auth_token):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/genders", headers={"Authorization": f"Bearer {auth_token}"})
         assert response.status_code == 200
         yield response.json()[0]
 
 @pytest.fixture(scope="module")
 async def grade(auth_token):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/grades", headers={"Authorization": f"Bearer {auth_token}"})
         if response.status_code == 200 and response.json():
             yield response.json()[0]
@@ -134,7 +134,7 @@ async def grade(auth_token):
 # Fixture to create a beneficiary
 @pytest.fixture(scope="module")
 async def beneficiary(auth_token, document_type, gender, grade):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         random_number = random.randint(10000, 99999)
         beneficiary_data = {
             "document_type_id": document_type["id"],
@@ -2,10 +2,10 @@
 Integration tests for Beneficiaries Endpoints
 """
 import pytest
-import httpx
 import uuid
 import random
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 created_beneficiary_id = None
@@ -34,7 +34,7 @@ async def test_create_beneficiary_success(auth_token, document_type, gender, gra
         "etnic_group_id": 1
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/beneficiaries/",
             json=beneficiary_data,
@@ -67,7 +67,7 @@ async def test_create_beneficiary_missing_data(auth_token, document_type, gender
         "etnic_group_id": 1
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/beneficiaries/",
             json=beneficiary_data,
@@ -85,7 +85,7 @@ async def test_create_beneficiary_missing_data(auth_token, document_type, gender
 @pytest.mark.asyncio
 async def test_get_beneficiaries_success(auth_token):
     """Test successful retrieval of beneficiaries list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/beneficiaries/",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -102,7 +102,7 @@ async def test_get_beneficiaries_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_beneficiaries_unauthorized():
     """Test retrieving beneficiaries list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/beneficiaries/")
     assert response.status_code == 403
 
@@ -116,7 +116,7 @@ async def test_get_beneficiaries_unauthorized():
 async def test_get_beneficiary_by_id_success(auth_token):
     """Test successful retrieval of a beneficiary by ID"""
     assert created_beneficiary_id is not None, "Beneficiary ID is not set"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/beneficiaries/{created_beneficiary_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -134,7 +134,7 @@ async def test_get_beneficiary_by_id_success(auth_token):
 async def test_get_beneficiary_by_id_not_found(auth_token):
     """Test retrieving a beneficiary with a non-existent ID"""
     non_existent_id = uuid.uuid4()
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/beneficiaries/{non_existent_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -164,7 +164,7 @@ async def test_update_beneficiary_put_success(auth_token, document_type, gender,
         "second_surname": "Surname Updated",
         "etnic_group_id": 1
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/beneficiaries/{created_beneficiary_id}",
             json=update_data,
@@ -195,7 +195,7 @@ async def test_update_beneficiary_put_not_found(auth_token, document_type, gende
         "second_surname": "Surname Updated",
         "etnic_group_id": 1
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/beneficiaries/{uuid.uuid4()}",
             json=update_data,
@@ -214,7 +214,7 @@ async def test_update_beneficiary_patch_success(auth_token):
     """Test successful partial update (PATCH) of a beneficiary"""
     assert created_beneficiary_id is not None, "Beneficiary ID is not set"
     patch_data = {"first_name": "Patched"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.patch(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/beneficiaries/{created_beneficiary_id}",
             json=patch_data,
@@ -234,7 +234,7 @@ async def test_update_beneficiary_patch_not_found(auth_token):
     """Test partial update (PATCH) of a non-existent beneficiary"""
     non_existent_id = uuid.uuid4()
     patch_data = {"first_name": "Patched"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.patch(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/beneficiaries/{non_existent_id}",
             json=patch_data,
@@ -252,7 +252,7 @@ async def test_update_beneficiary_patch_not_found(auth_token):
 async def test_delete_beneficiary_success(auth_token):
     """Test successful deletion of a beneficiary"""
     assert created_beneficiary_id is not None, "Beneficiary ID is not set"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/beneficiaries/{created_beneficiary_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -268,7 +268,7 @@ async def test_delete_beneficiary_success(auth_token):
 @pytest.mark.asyncio
 async def test_delete_beneficiary_not_found(auth_token):
     """Test deleting a non-existent beneficiary"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/beneficiaries/{uuid.uuid4()}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -2,10 +2,10 @@
 Integration tests for Campuses Endpoints
 """
 import pytest
-import httpx
 import uuid
 import random
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 # This will hold the ID of a campus created for the whole module to use in non-destructive tests.
@@ -15,7 +15,7 @@ module_campus_id = None
 async def setup_module_campus(auth_token, institution):
     """Fixture to create a campus for the module and clean it up after tests."""
     global module_campus_id
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         random_number = random.randint(10000, 99999)
         campus_data = {
             "name": f"Module Campus {random_number}",
@@ -55,7 +55,7 @@ async def test_create_campus_success(auth_token, institution):
         "institution_id": institution["id"],
         "address": "123 Test St", "latitude": 4.60971, "longitude": -74.08175
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/campuses/",
             json=campus_data, headers={"Authorization": f"Bearer {auth_token}"}
@@ -71,7 +71,7 @@ async def test_create_campus_success(auth_token, institution):
 async def test_create_campus_missing_data(auth_token, institution):
     random_number = random.randint(10000, 99999)
     campus_data = {"institution_id": institution["id"], "dane_code": f"{random_number}", "name": "Test Campus"} # Missing required fields
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/campuses/",
             json=campus_data, headers={"Authorization": f"Bearer {auth_token}"}
@@ -82,7 +82,7 @@ async def test_create_campus_missing_data(auth_token, institution):
 @add_test_info(test_id="CAMP-003", module="Cobertura", description="Obtener la lista de campus exitosamente", expected_result="Status 200")
 @pytest.mark.asyncio
 async def test_get_campuses_success(auth_token):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/campuses/",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -93,7 +93,7 @@ async def test_get_campuses_success(auth_token):
 @add_test_info(test_id="CAMP-004", module="Cobertura", description="Fallar al obtener la lista de campus sin autorización", expected_result="Status 403")
 @pytest.mark.asyncio
 async def test_get_campuses_unauthorized():
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/campuses/")
     assert response.status_code == 403
 
@@ -102,7 +102,7 @@ async def test_get_campuses_unauthorized():
 @pytest.mark.asyncio
 async def test_get_campus_by_id_success(auth_token):
     assert module_campus_id is not None
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/campuses/{module_campus_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -114,7 +114,7 @@ async def test_get_campus_by_id_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_campus_by_id_not_found(auth_token):
     random_number = random.randint(10000, 99999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/campuses/{random_number}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -130,7 +130,7 @@ async def test_update_campus_put_success(auth_token, institution):
         "institution_id": institution["id"], "address": "123 Updated St",
         "latitude": 1.1, "longitude": 2.2
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/campuses/{module_campus_id}",
             json=update_data, headers={"Authorization": f"Bearer {auth_token}"}
@@ -147,7 +147,7 @@ async def test_update_campus_put_not_found(auth_token, institution):
         "institution_id": institution["id"], "address": "123 Updated St",
         "latitude": 1.1, "longitude": 2.2
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/campuses/{random_number}",
             json=update_data, headers={"Authorization": f"Bearer {auth_token}"}
@@ -159,7 +159,7 @@ async def test_update_campus_put_not_found(auth_token, institution):
 @pytest.mark.asyncio
 async def test_update_campus_patch_success(auth_token):
     patch_data = {"name": "Patched Campus Name"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.patch(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/campuses/{module_campus_id}",
             json=patch_data, headers={"Authorization": f"Bearer {auth_token}"}
@@ -172,7 +172,7 @@ async def test_update_campus_patch_success(auth_token):
 async def test_update_campus_patch_not_found(auth_token):
     random_number = random.randint(10000, 99999)
     patch_data = {"name": "Patched Campus Name"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.patch(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/campuses/{random_number}",
             json=patch_data, headers={"Authorization": f"Bearer {auth_token}"}
@@ -190,7 +190,7 @@ async def test_delete_campus_success(auth_token, institution):
         "institution_id": institution["id"],
         "address": "123 To Delete St", "latitude": 4.6, "longitude": -74.0
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         create_response = await client.post(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/campuses/",
             json=campus_data, headers={"Authorization": f"Bearer {auth_token}"}
@@ -208,7 +208,7 @@ async def test_delete_campus_success(auth_token, institution):
 @pytest.mark.asyncio
 async def test_delete_campus_not_found(auth_token):
     random_number = random.randint(10000, 99999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/campuses/{random_number}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -219,7 +219,7 @@ async def test_delete_campus_not_found(auth_token):
 @add_test_info(test_id="CAMP-013", module="Cobertura", description="Obtener la cobertura de un campus exitosamente", expected_result="Status 200")
 @pytest.mark.asyncio
 async def test_get_campus_coverage_success(auth_token, beneficiary, benefit_type):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         # Create a coverage for the module campus
         coverage_data = {"beneficiary_id": beneficiary["id"], "campus_id": module_campus_id, "benefit_type_id": benefit_type["id"]}
         create_cov_res = await client.post(f"{settings.BASE_COVERAGE_BACKEND_URL}/coverages/", json=coverage_data, headers={"Authorization": f"Bearer {auth_token}"})
@@ -240,7 +240,7 @@ async def test_get_campus_coverage_success(auth_token, beneficiary, benefit_type
 @pytest.mark.asyncio
 async def test_get_campus_coverage_not_found(auth_token):
     non_existent_campus_id = 9999999
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/campuses/{non_existent_campus_id}/coverage",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -2,10 +2,10 @@
 Integration tests for Coverages Endpoints
 """
 import pytest
-import httpx
 import uuid
 from datetime import datetime
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 created_coverage_id = None
@@ -27,7 +27,7 @@ async def test_create_coverage_success(auth_token, beneficiary, campus, benefit_
         "year": datetime.now().year
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/coverages/",
             json=coverage_data,
@@ -55,7 +55,7 @@ async def test_create_coverage_missing_data(auth_token, beneficiary, campus):
         "year": datetime.now().year
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/coverages/",
             json=coverage_data,
@@ -73,7 +73,7 @@ async def test_create_coverage_missing_data(auth_token, beneficiary, campus):
 @pytest.mark.asyncio
 async def test_get_coverages_success(auth_token):
     """Test successful retrieval of coverages list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/coverages/",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -90,7 +90,7 @@ async def test_get_coverages_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_coverages_unauthorized():
     """Test retrieving coverages list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/coverages/")
     assert response.status_code == 403
 
@@ -104,7 +104,7 @@ async def test_get_coverages_unauthorized():
 async def test_get_coverage_by_id_success(auth_token):
     """Test successful retrieval of a coverage by ID"""
     assert created_coverage_id is not None, "Coverage ID is not set"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/coverages/{created_coverage_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -122,7 +122,7 @@ async def test_get_coverage_by_id_success(auth_token):
 async def test_get_coverage_by_id_not_found(auth_token):
     """Test retrieving a coverage with a non-existent ID"""
     non_existent_id = uuid.uuid4()
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/coverages/{non_existent_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -145,7 +145,7 @@ async def test_update_coverage_put_success(auth_token, beneficiary, campus, bene
         "benefit_type_id": benefit_type["id"],
         "active": True,
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/coverages/{created_coverage_id}",
             json=update_data,
@@ -169,7 +169,7 @@ async def test_update_coverage_put_not_found(auth_token, beneficiary, campus, be
         "benefit_type_id": benefit_type["id"],
         "active": True,
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/coverages/{uuid.uuid4()}",
             json=update_data,
@@ -188,7 +188,7 @@ async def test_update_coverage_patch_success(auth_token):
     """Test successful partial update (PATCH) of a coverage"""
     assert created_coverage_id is not None, "Coverage ID is not set"
     patch_data = {"active": False}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.patch(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/coverages/{created_coverage_id}",
             json=patch_data,
@@ -207,7 +207,7 @@ async def test_update_coverage_patch_success(auth_token):
 async def test_update_coverage_patch_not_found(auth_token):
     """Test partial update (PATCH) of a non-existent coverage"""
     patch_data = {"year": datetime.now().year + 2}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.patch(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/coverages/{uuid.uuid4()}",
             json=patch_data,
@@ -225,7 +225,7 @@ async def test_update_coverage_patch_not_found(auth_token):
 async def test_delete_coverage_success(auth_token):
     """Test successful deletion of a coverage"""
     assert created_coverage_id is not None, "Coverage ID is not set"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/coverages/{created_coverage_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -241,7 +241,7 @@ async def test_delete_coverage_success(auth_token):
 @pytest.mark.asyncio
 async def test_delete_coverage_not_found(auth_token):
     """Test deleting a non-existent coverage"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/coverages/{uuid.uuid4()}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -2,10 +2,10 @@
 Integration tests for Departments Endpoints
 """
 import pytest
-import httpx
 import uuid
 import random
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 created_department_id = None
@@ -26,7 +26,7 @@ async def test_create_department_success(auth_token):
         "dane_code": f"DANE{random_number}"
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/departments/",
             json=department_data,
@@ -53,7 +53,7 @@ async def test_create_department_missing_data(auth_token):
         # "name": "Test Department" <- Missing
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/departments/",
             json=department_data,
@@ -71,7 +71,7 @@ async def test_create_department_missing_data(auth_token):
 @pytest.mark.asyncio
 async def test_get_departments_success(auth_token):
     """Test successful retrieval of departments list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/departments/",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -88,7 +88,7 @@ async def test_get_departments_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_departments_unauthorized():
     """Test retrieving departments list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/departments/")
     assert response.status_code == 403
 
@@ -102,7 +102,7 @@ async def test_get_departments_unauthorized():
 async def test_get_department_by_id_success(auth_token):
     """Test successful retrieval of a department by ID"""
     assert created_department_id is not None, "Department ID is not set"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/departments/{created_department_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -120,7 +120,7 @@ async def test_get_department_by_id_success(auth_token):
 async def test_get_department_by_id_not_found(auth_token):
     """Test retrieving a department with a non-existent ID"""
     random_number = random.randint(10000, 99999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/departments/{random_number}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -142,7 +142,7 @@ async def test_update_department_put_success(auth_token):
         "name": f"Updated Department {random_number}",
         "dane_code": f"DANE-UPDATED-{random_number}"
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/departments/{created_department_id}",
             json=update_data,
@@ -165,7 +165,7 @@ async def test_update_department_put_not_found(auth_token):
         "name": f"Updated Department {random_number}",
         "dane_code": f"DANE-UPDATED-{random_number}"
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/departments/{random_number}",
             json=update_data,
@@ -184,7 +184,7 @@ async def test_update_department_patch_success(auth_token):
     """Test successful partial update (PATCH) of a department"""
     assert created_department_id is not None, "Department ID is not set"
     patch_data = {"name": "Patched Department Name"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.patch(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/departments/{created_department_id}",
             json=patch_data,
@@ -204,7 +204,7 @@ async def test_update_department_patch_not_found(auth_token):
     """Test partial update (PATCH) of a non-existent department"""
     patch_data = {"name": "Patched Department Name"}
     random_number = random.randint(10000, 99999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.patch(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/departments/{random_number}",
             json=patch_data,
@@ -222,7 +222,7 @@ async def test_update_department_patch_not_found(auth_token):
 async def test_delete_department_success(auth_token):
     """Test successful deletion of a department"""
     assert created_department_id is not None, "Department ID is not set"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/departments/{created_department_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -239,7 +239,7 @@ async def test_delete_department_success(auth_token):
 async def test_delete_department_not_found(auth_token):
     """Test deleting a non-existent department"""
     random_number = random.randint(10000, 99999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/departments/{random_number}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -2,9 +2,9 @@
 Integration tests for Institutions Endpoints
 """
 import pytest
-import httpx
 import random
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 created_institution_id = None
@@ -27,7 +27,7 @@ async def test_create_institution_success(auth_token, town):
         "town_id": town["id"]
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/institutions/",
             json=institution_data,
@@ -55,7 +55,7 @@ async def test_create_institution_missing_data(auth_token, town):
         # Missing dane_code
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/institutions/",
             json=institution_data,
@@ -73,7 +73,7 @@ async def test_create_institution_missing_data(auth_token, town):
 @pytest.mark.asyncio
 async def test_get_institutions_success(auth_token):
     """Test successful retrieval of institutions list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/institutions/",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -90,7 +90,7 @@ async def test_get_institutions_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_institutions_unauthorized():
     """Test retrieving institutions list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/institutions/")
     assert response.status_code == 403
 
@@ -104,7 +104,7 @@ async def test_get_institutions_unauthorized():
 async def test_get_institution_by_id_success(auth_token):
     """Test successful retrieval of an institution by ID"""
     assert created_institution_id is not None, "Institution ID is not set"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/institutions/{created_institution_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -122,7 +122,7 @@ async def test_get_institution_by_id_success(auth_token):
 async def test_get_institution_by_id_not_found(auth_token):
     """Test retrieving an institution with a non-existent ID"""
     non_existent_id = random.randint(100000, 999999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/institutions/{non_existent_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -145,7 +145,7 @@ async def test_update_institution_put_success(auth_token, town):
         "dane_code": f"DANE-UPDATED-{random_number}",
         "town_id": town["id"]
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/institutions/{created_institution_id}",
             json=update_data,
@@ -170,7 +170,7 @@ async def test_update_institution_put_not_found(auth_token, town):
         "town_id": town["id"]
     }
     non_existent_id = random.randint(100000, 999999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/institutions/{non_existent_id}",
             json=update_data,
@@ -189,7 +189,7 @@ async def test_update_institution_patch_success(auth_token):
     """Test successful partial update (PATCH) of an institution"""
     assert created_institution_id is not None, "Institution ID is not set"
     patch_data = {"name": "Patched Institution Name"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.patch(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/institutions/{created_institution_id}",
             json=patch_data,
@@ -209,7 +209,7 @@ async def test_update_institution_patch_not_found(auth_token):
     """Test partial update (PATCH) of a non-existent institution"""
     patch_data = {"name": "Patched Institution Name"}
     non_existent_id = random.randint(100000, 999999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.patch(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/institutions/{non_existent_id}",
             json=patch_data,
@@ -227,7 +227,7 @@ async def test_update_institution_patch_not_found(auth_token):
 async def test_get_institution_by_dane_code_not_found(auth_token):
     """Test get institution by non-existent DANE code"""
     non_existent_dane = f"DANE{random.randint(100000, 999999)}"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/institutions/dane/{non_existent_dane}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -245,7 +245,7 @@ async def test_get_institution_by_dane_code_not_found(auth_token):
 async def test_delete_institution_success(auth_token):
     """Test successful deletion of an institution"""
     assert created_institution_id is not None, "Institution ID is not set"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/institutions/{created_institution_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -262,7 +262,7 @@ async def test_delete_institution_success(auth_token):
 async def test_delete_institution_not_found(auth_token):
     """Test deleting a non-existent institution"""
     non_existent_id = random.randint(100000, 999999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/institutions/{non_existent_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -2,8 +2,8 @@
 Integration tests for Parametrics Endpoints
 """
 import pytest
-import httpx
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 # Test Benefit Types
@@ -16,7 +16,7 @@ from ..test_metadata import add_test_info
 @pytest.mark.asyncio
 async def test_get_benefit_types_success(auth_token):
     """Test successful retrieval of benefit types list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/benefit-types",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -33,7 +33,7 @@ async def test_get_benefit_types_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_benefit_types_unauthorized():
     """Test retrieving benefit types list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/benefit-types")
     assert response.status_code == 403
 
@@ -47,7 +47,7 @@ async def test_get_benefit_types_unauthorized():
 @pytest.mark.asyncio
 async def test_get_document_types_success(auth_token):
     """Test successful retrieval of document types list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/document-types",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -66,7 +66,7 @@ async def test_get_document_types_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_document_types_unauthorized():
     """Test retrieving document types list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/document-types")
     assert response.status_code == 403
 
@@ -80,7 +80,7 @@ async def test_get_document_types_unauthorized():
 @pytest.mark.asyncio
 async def test_get_genders_success(auth_token):
     """Test successful retrieval of genders list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/genders",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -99,7 +99,7 @@ async def test_get_genders_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_genders_unauthorized():
     """Test retrieving genders list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/genders")
     assert response.status_code == 403
 
@@ -113,7 +113,7 @@ async def test_get_genders_unauthorized():
 @pytest.mark.asyncio
 async def test_get_grades_success(auth_token):
     """Test successful retrieval of grades list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/grades",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -130,7 +130,7 @@ async def test_get_grades_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_grades_unauthorized():
     """Test retrieving grades list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/grades")
     assert response.status_code == 403
 
@@ -144,7 +144,7 @@ async def test_get_grades_unauthorized():
 @pytest.mark.asyncio
 async def test_get_ethnic_groups_success(auth_token):
     """Test successful retrieval of ethnic groups list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/etnic-groups",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -163,6 +163,6 @@ async def test_get_ethnic_groups_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_ethnic_groups_unauthorized():
     """Test retrieving ethnic groups list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/parametrics/etnic-groups")
     assert response.status_code == 403 
\ No newline at end of file
@@ -2,9 +2,9 @@
 Integration tests for Towns Endpoints
 """
 import pytest
-import httpx
 import random
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 created_town_id = None
@@ -27,7 +27,7 @@ async def test_create_town_success(auth_token, department):
         "department_id": department["id"]
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/towns/",
             json=town_data,
@@ -55,7 +55,7 @@ async def test_create_town_missing_data(auth_token, department):
         # Missing dane_code
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/towns/",
             json=town_data,
@@ -73,7 +73,7 @@ async def test_create_town_missing_data(auth_token, department):
 @pytest.mark.asyncio
 async def test_get_towns_success(auth_token):
     """Test successful retrieval of towns list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/towns/",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -90,7 +90,7 @@ async def test_get_towns_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_towns_unauthorized():
     """Test retrieving towns list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_COVERAGE_BACKEND_URL}/towns/")
     assert response.status_code == 403
 
@@ -104,7 +104,7 @@ async def test_get_towns_unauthorized():
 async def test_get_town_by_id_success(auth_token):
     """Test successful retrieval of a town by ID"""
     assert created_town_id is not None, "Town ID is not set"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/towns/{created_town_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -122,7 +122,7 @@ async def test_get_town_by_id_success(auth_token):
 async def test_get_town_by_id_not_found(auth_token):
     """Test retrieving a town with a non-existent ID"""
     non_existent_id = random.randint(100000, 999999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/towns/{non_existent_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -145,7 +145,7 @@ async def test_update_town_put_success(auth_token, department):
         "dane_code": f"DANE-UPDATED-{random_number}",
         "department_id": department["id"]
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/towns/{created_town_id}",
             json=update_data,
@@ -170,7 +170,7 @@ async def test_update_town_put_not_found(auth_token, department):
         "department_id": department["id"]
     }
     non_existent_id = random.randint(100000, 999999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/towns/{non_existent_id}",
             json=update_data,
@@ -189,7 +189,7 @@ async def test_update_town_patch_success(auth_token):
     """Test successful partial update (PATCH) of a town"""
     assert created_town_id is not None, "Town ID is not set"
     patch_data = {"name": "Patched Town Name"}
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.patch(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/towns/{created_town_id}",
             json=patch_data,
@@ -209,7 +209,7 @@ async def test_update_town_patch_not_found(auth_token):
     """Test partial update (PATCH) of a non-existent town"""
     patch_data = {"name": "Patched Town Name"}
     non_existent_id = random.randint(100000, 999999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.patch(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/towns/{non_existent_id}",
             json=patch_data,
@@ -227,7 +227,7 @@ async def test_update_town_patch_not_found(auth_token):
 async def test_get_town_by_dane_code_not_found(auth_token):
     """Test get town by non-existent DANE code"""
     non_existent_dane = f"DANE{random.randint(100000, 999999)}"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/towns/dane/{non_existent_dane}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -244,7 +244,7 @@ async def test_get_town_by_dane_code_not_found(auth_token):
 async def test_delete_town_success(auth_token):
     """Test successful deletion of a town"""
     assert created_town_id is not None, "Town ID is not set"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/towns/{created_town_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -261,7 +261,7 @@ async def test_delete_town_success(auth_token):
 async def test_delete_town_not_found(auth_token):
     """Test deleting a non-existent town"""
     non_existent_id = random.randint(100000, 999999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_COVERAGE_BACKEND_URL}/towns/{non_existent_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
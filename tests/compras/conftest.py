@@ -8,31 +8,25 @@ from typing import Dict, Any, Optional, List
 from bson import ObjectId
 
 from .config import TestConfig
+from ..http_clients import pooled_client
+from ..auth_tokens import get_token
 from tests.conftest import auth_token
 
 
 async def get_auth_token() -> str:
-    """Get authentication token from the auth API"""
+    """Get authentication token from the auth API (shared token cache, see tests/auth_tokens.py)"""
     auth_url = TestConfig.get_auth_url(TestConfig.AUTH_LOGIN_ENDPOINT)
-    auth_data = {
-        "email": TestConfig.AUTH_EMAIL,
-        "password": TestConfig.AUTH_PASSWORD
-    }
-    
-    async with httpx.AsyncClient(timeout=TestConfig.TIMEOUT) as auth_client:
-        response = await auth_client.post(auth_url, json=auth_data)
-        if response.status_code == 200:
-            auth_response = response.json()
-            return auth_response.get("access_token")
-        else:
-            raise Exception(f"Authentication failed: {response.status_code} - {response.text}")
+    try:
+        return await get_token(auth_url, TestConfig.AUTH_EMAIL, TestConfig.AUTH_PASSWORD, timeout=TestConfig.TIMEOUT)
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"Authentication failed: {e.response.status_code} - {e.response.text}")
 
 
 @pytest.fixture
 async def client(auth_token: str):
     """HTTP client fixture for making API requests"""
     headers = {"Authorization": f"Bearer {auth_token}"}
-    async with httpx.AsyncClient(
+    async with pooled_client(
         base_url=TestConfig.BASE_URL,
         timeout=TestConfig.TIMEOUT,
         follow_redirects=TestConfig.FOLLOW_REDIRECTS,
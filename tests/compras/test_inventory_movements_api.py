@@ -1,6 +1,6 @@
 """
 Integration tests for Inventory Movements API
-Test cases: INV-MOV-001 to INV-MOV-037
+Test cases: INV-MOV-001 to INV-MOV-040
 """
 import pytest
 import httpx
@@ -735,10 +735,10 @@ class TestInventoryMovementsAPI:
         description="Obtener stock actual filtrado por ubicación de almacenamiento",
         expected_result="Status Code: 200, stock filtrado por ubicación",
         module="Compras",
-        test_id="INV-MOV-023"
+        test_id="INV-MOV-038"
     )
     async def test_get_current_stock_filtered_by_storage(self, client: httpx.AsyncClient, api_prefix: str, test_product):
-        """INV-MOV-023: Successfully retrieve current stock filtered by storage location"""
+        """INV-MOV-038: Successfully retrieve current stock filtered by storage location"""
         if not test_product:
             pytest.skip("No test product available for storage filter test")
         
@@ -757,10 +757,10 @@ class TestInventoryMovementsAPI:
         description="Obtener stock actual filtrado por lote",
         expected_result="Status Code: 200, stock filtrado por lote",
         module="Compras",
-        test_id="INV-MOV-024"
+        test_id="INV-MOV-039"
     )
     async def test_get_current_stock_filtered_by_lot(self, client: httpx.AsyncClient, api_prefix: str, test_product):
-        """INV-MOV-024: Successfully retrieve current stock filtered by lot"""
+        """INV-MOV-039: Successfully retrieve current stock filtered by lot"""
         if not test_product:
             pytest.skip("No test product available for lot filter test")
         
@@ -932,10 +932,10 @@ class TestInventoryMovementsAPI:
         description="Obtener historial de consumo filtrado por institución",
         expected_result="Status Code: 200, historial filtrado por institución",
         module="Compras",
-        test_id="INV-MOV-028"
+        test_id="INV-MOV-040"
     )
     async def test_get_consumption_history_filtered_by_institution(self, client: httpx.AsyncClient, api_prefix: str, test_product):
-        """INV-MOV-028: Successfully retrieve consumption history filtered by institution"""
+        """INV-MOV-040: Successfully retrieve consumption history filtered by institution"""
         if not test_product:
             pytest.skip("No test product available for institution consumption filter test")
         
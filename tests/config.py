@@ -17,6 +17,16 @@ class Settings(BaseSettings):
 
     BASE_USER_EMAIL: str
     BASE_USER_PASSWORD: str
+
+    # Pools de conexiones compartidos por servicio (ver tests/http_clients.py)
+    HTTP_MAX_CONNECTIONS: int = 20
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP2: bool = False  # Requiere el extra httpx[http2]
+
+    # Cache de tokens compartido entre workers y ejecuciones (ver tests/auth_tokens.py)
+    AUTH_TOKEN_CACHE: bool = True
+    AUTH_TOKEN_REFRESH_MARGIN: float = 300.0  # Segundos antes del exp en que se renueva
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
@@ -1,23 +1,47 @@
 import pytest
-import json
 import asyncio
 import httpx
 
-from tests.test_metadata import MetadataRegistry
+from tests.test_metadata import METADATA_MARKER, MetadataRegistry, get_marker_metadata, register_collected_items
 from tests.config import settings
+from tests.http_clients import drain_request_timings, http_clients as http_client_registry
+from tests.auth_tokens import get_token
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """Registra la metadata de @add_test_info (marker test_info) de los tests recolectados"""
+    register_collected_items(items)
 
 
 # Hook to write metadata to file at the end of the test session
 def pytest_sessionfinish(session):
     """
     Hook para escribir la metadata en un archivo al final de la sesión de tests.
+
+    Con pytest-xdist cada worker escribe su propio archivo y el proceso
+    controlador (que termina después de los workers) los combina en el registro.
     """
     registry = MetadataRegistry()
-    registry_data = registry.get_all_tests()
-    
-    # Store metadata in a file
-    with open("test_metadata_registry.json", "w") as f:
-        json.dump(registry_data, f, indent=4)
+
+    worker_id = getattr(session.config, "workerinput", {}).get("workerid")
+    if worker_id:
+        registry.write_shard(worker_id)
+    else:
+        registry.write()
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Adjunta al reporte de cada fase (setup, call, teardown) las peticiones HTTP
+    que hizo, y al del setup la metadata de @add_test_info, para que los
+    resultados guardados no dependan del código fuente al generar el reporte.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    report.http_requests = drain_request_timings()
+    if report.when == "setup":
+        report.test_info = get_marker_metadata(item.iter_markers(name=METADATA_MARKER))
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -27,54 +51,42 @@ def event_loop():
     yield loop
     loop.close()
 
+@pytest.fixture(scope="session", autouse=True)
+async def http_clients():
+    """Pools de conexiones HTTP compartidos por servicio; se cierran al terminar la sesión."""
+    yield http_client_registry
+    await http_client_registry.aclose()
+
 @pytest.fixture(scope="session")
 async def auth_token():
-    """Logs in and retrieves an authentication token for the session."""
-    login_data = {
-        "email": settings.ADMIN_USER_EMAIL,
-        "password": settings.ADMIN_USER_PASSWORD,
-    }
-    async with httpx.AsyncClient() as client:
-        try:
-            # The URL for login does not need the /api/v1 prefix as it's included in BASE_AUTH_BACKEND_URL
-            response = await client.post(
-                f"{settings.BASE_AUTH_BACKEND_URL}/auth/login",
-                json=login_data,
-                timeout=20, # Increased timeout for login
-            )
-            response.raise_for_status()  # Raise an exception for bad status codes
-            token_data = response.json()
-            if "access_token" not in token_data:
-                pytest.fail("'access_token' not found in login response.")
-            return token_data["access_token"]
-        except (httpx.RequestError, KeyError) as e:
-            pytest.fail(f"Authentication failed: Could not retrieve auth token. Error: {e}")
-        except httpx.HTTPStatusError as e:
-            pytest.fail(f"Authentication failed with status {e.response.status_code}: {e.response.text}")
+    """Retrieves an admin authentication token (shared token cache, see tests/auth_tokens.py)."""
+    try:
+        # The URL for login does not need the /api/v1 prefix as it's included in BASE_AUTH_BACKEND_URL
+        return await get_token(
+            f"{settings.BASE_AUTH_BACKEND_URL}/auth/login",
+            settings.ADMIN_USER_EMAIL,
+            settings.ADMIN_USER_PASSWORD,
+            timeout=20, # Increased timeout for login
+        )
+    except (httpx.RequestError, KeyError) as e:
+        pytest.fail(f"Authentication failed: Could not retrieve auth token. Error: {e}")
+    except httpx.HTTPStatusError as e:
+        pytest.fail(f"Authentication failed with status {e.response.status_code}: {e.response.text}")
 
 @pytest.fixture(scope="session")
 async def basic_user_token():
-    """Logs in as a basic user and retrieves an authentication token."""
-    login_data = {
-        "email": settings.BASE_USER_EMAIL,
-        "password": settings.BASE_USER_PASSWORD,
-    }
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{settings.BASE_AUTH_BACKEND_URL}/auth/login",
-                json=login_data,
-                timeout=20,
-            )
-            response.raise_for_status()
-            token_data = response.json()
-            if "access_token" not in token_data:
-                pytest.fail("'access_token' not found in login response for basic user.")
-            return token_data["access_token"]
-        except (httpx.RequestError, KeyError) as e:
-            pytest.fail(f"Basic user authentication failed: Could not retrieve auth token. Error: {e}")
-        except httpx.HTTPStatusError as e:
-            pytest.fail(f"Basic user authentication failed with status {e.response.status_code}: {e.response.text}")
+    """Retrieves a basic user authentication token (shared token cache, see tests/auth_tokens.py)."""
+    try:
+        return await get_token(
+            f"{settings.BASE_AUTH_BACKEND_URL}/auth/login",
+            settings.BASE_USER_EMAIL,
+            settings.BASE_USER_PASSWORD,
+            timeout=20,
+        )
+    except (httpx.RequestError, KeyError) as e:
+        pytest.fail(f"Basic user authentication failed: Could not retrieve auth token. Error: {e}")
+    except httpx.HTTPStatusError as e:
+        pytest.fail(f"Basic user authentication failed with status {e.response.status_code}: {e.response.text}")
 
 
 # Import fixtures from other conftest files to make them available globally if needed
@@ -0,0 +1,207 @@
+"""
+Clientes HTTP con pools de conexiones compartidos durante la sesión de tests
+
+Cada URL base de tests/config.Settings (auth, cobertura, compras, menús, rh)
+tiene un único pool de conexiones keep-alive para toda la sesión, con límites
+configurables y HTTP/2 opcional. Los tests siguen usando un httpx.AsyncClient
+por bloque (``async with pooled_client() as client``), pero ese cliente solo
+envuelve el pool compartido: cerrarlo no cierra las conexiones, por lo que el
+handshake TCP (y TLS) se paga una vez por servicio y no una vez por test.
+
+Los pools quedan ligados al event loop en que se crean; pytest.ini fija el
+loop de tests y fixtures en scope de sesión, y el fixture ``http_clients`` de
+tests/conftest.py los cierra al terminar la sesión.
+
+Cada cliente registra además, con event hooks de httpx, el método, la ruta
+(con los IDs reemplazados por {id}), el status, los bytes y el tiempo de cada
+petición; tests/conftest.py los adjunta al reporte de cada fase del test.
+"""
+import re
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from tests.config import settings
+
+Origin = Tuple[bytes, bytes, int]
+
+# Envía una petición por los pools y retorna la respuesta
+Send = Callable[[httpx.Request], Awaitable[httpx.Response]]
+
+
+class HttpClientRegistry:
+    """
+    Pools de conexiones por origen (esquema, host y puerto de la URL base)
+
+    Los pools se crean la primera vez que se hace una petición a su origen.
+    Un plugin puede asignar ``handler`` para interceptar todas las peticiones
+    de la sesión (ej. grabarlas o reproducirlas, ver utils/cassettes.py); el
+    handler recibe la petición y la función que la envía por los pools. Con
+    ``mount`` un origen se atiende con otro transport en lugar de un pool (ej.
+    los backends simulados en proceso, ver utils/fake_backends). Las funciones
+    de ``response_listeners`` se llaman con cada petición que obtuvo respuesta
+    (ej. el circuit breaker, ver utils/circuit_breaker.py).
+    """
+
+    def __init__(
+        self,
+        max_connections: int = settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = settings.HTTP_KEEPALIVE_EXPIRY,
+        http2: bool = settings.HTTP2,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self._pools: Dict[Origin, httpx.AsyncHTTPTransport] = {}
+        self._mounts: Dict[Origin, httpx.AsyncBaseTransport] = {}
+        self.handler: Optional[Callable[[httpx.Request, Send], Awaitable[httpx.Response]]] = None
+        self.response_listeners: List[Callable[[httpx.Request], None]] = []
+
+    @staticmethod
+    def _origin(url: httpx.URL) -> Origin:
+        return (url.raw_scheme, url.raw_host, url.port or (443 if url.scheme == "https" else 80))
+
+    def mount(self, url: str, transport: httpx.AsyncBaseTransport):
+        """Atiende las peticiones al origen de la URL con el transport indicado"""
+        self._mounts[self._origin(httpx.URL(url))] = transport
+
+    def unmount_all(self):
+        self._mounts.clear()
+
+    def pool_for(self, url: httpx.URL) -> httpx.AsyncBaseTransport:
+        """Retorna el transport montado o el pool del origen de la URL, creándolo si no existe"""
+        origin = self._origin(url)
+        if origin in self._mounts:
+            return self._mounts[origin]
+        pool = self._pools.get(origin)
+        if pool is None:
+            pool = httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+            self._pools[origin] = pool
+        return pool
+
+    async def send(self, request: httpx.Request) -> httpx.Response:
+        """Envía la petición por el pool de su origen"""
+        return await self.pool_for(request.url).handle_async_request(request)
+
+    def transport(self) -> "PooledTransport":
+        """Transport para un AsyncClient que enruta cada petición al pool de su origen"""
+        return PooledTransport(self)
+
+    async def aclose(self):
+        """Cierra todos los pools (al terminar la sesión)"""
+        pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            await pool.aclose()
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """
+    Transport que delega en los pools del registro
+
+    Cerrar el cliente que lo usa no cierra el pool: las conexiones siguen
+    disponibles para los demás tests de la sesión.
+    """
+
+    def __init__(self, registry: HttpClientRegistry):
+        self.registry = registry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.registry.handler is not None:
+            response = await self.registry.handler(request, self.registry.send)
+        else:
+            response = await self.registry.send(request)
+        for listener in self.registry.response_listeners:
+            listener(request)
+        return response
+
+    async def aclose(self):
+        pass
+
+
+# Registro de la sesión (uno por proceso, también por worker de pytest-xdist)
+http_clients = HttpClientRegistry()
+
+# Segmentos de ruta que son IDs: enteros, ObjectId de MongoDB y UUID
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-f]{24}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$",
+    re.IGNORECASE,
+)
+
+# Peticiones terminadas desde la última llamada a drain_request_timings
+_request_timings: List[dict] = []
+
+
+# Rutas de búsqueda por clave natural: el segmento siguiente es un valor (código DANE,
+# documento, código de invitación, nombre de permiso), no parte del endpoint
+_LOOKUP_PREFIXES = ("/dane", "/document", "/by-name", "/invitations/validate")
+
+# Segmentos con dígitos que sí son parte del endpoint (versión de la API)
+_VERSION_SEGMENT = re.compile(r"^v\d+$")
+
+
+def _is_variable_segment(prefix: str, segment: str) -> bool:
+    if _ID_SEGMENT.match(segment) or prefix.endswith(_LOOKUP_PREFIXES):
+        return True
+    # Códigos generados por los tests (ej. DANE310988, DOC-717919)
+    return any(char.isdigit() for char in segment) and not _VERSION_SEGMENT.match(segment)
+
+
+def template_path(path: str) -> str:
+    """
+    Reemplaza los segmentos de la ruta que son valores por {id}
+
+    Ej. /users/12 → /users/{id}, /towns/dane/DANE310988 → /towns/dane/{id}.
+    Son valores los IDs (enteros, ObjectId, UUID), el segmento que sigue a una
+    ruta de búsqueda (_LOOKUP_PREFIXES) y cualquier segmento con dígitos salvo
+    la versión de la API (v1).
+    """
+    segments = path.split("/")
+    return "/".join(
+        "{id}" if segment and _is_variable_segment("/".join(segments[:index]), segment) else segment
+        for index, segment in enumerate(segments)
+    )
+
+
+async def _start_timer(request: httpx.Request):
+    request.extensions["nutripae_start"] = time.perf_counter()
+
+
+async def _record_timing(response: httpx.Response):
+    await response.aread()
+    request = response.request
+    _request_timings.append({
+        "method": request.method,
+        "host": request.url.netloc.decode("ascii"),
+        "path": template_path(request.url.path),
+        "status": response.status_code,
+        "bytes": len(response.content),
+        "elapsed": round(time.perf_counter() - request.extensions["nutripae_start"], 4),
+    })
+
+
+def drain_request_timings() -> List[dict]:
+    """Retorna y descarta las peticiones registradas desde la última llamada"""
+    timings = _request_timings[:]
+    _request_timings.clear()
+    return timings
+
+
+def pooled_client(**kwargs) -> httpx.AsyncClient:
+    """
+    Crea un httpx.AsyncClient que usa los pools compartidos de la sesión
+
+    Acepta los mismos argumentos que httpx.AsyncClient (base_url, headers,
+    timeout, follow_redirects, ...), excepto transport. Los event_hooks
+    indicados se ejecutan junto con los que registran el tiempo de cada petición.
+    """
+    event_hooks = kwargs.pop("event_hooks", {})
+    event_hooks = {
+        "request": [_start_timer, *event_hooks.get("request", [])],
+        "response": [_record_timing, *event_hooks.get("response", [])],
+    }
+    return httpx.AsyncClient(transport=http_clients.transport(), event_hooks=event_hooks, **kwargs)
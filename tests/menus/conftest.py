@@ -4,17 +4,20 @@ Shared pytest fixtures for PAE Menus API integration tests
 import pytest
 import httpx
 import asyncio
+import uuid
+from datetime import datetime
 from typing import Dict, Any, Optional, List
 from bson import ObjectId
 
 from .config import TestConfig
+from ..http_clients import pooled_client
 
 
 @pytest.fixture
 async def client(auth_token: str):
     """HTTP client fixture for making API requests"""
     headers = {"Authorization": f"Bearer {auth_token}"}
-    async with httpx.AsyncClient(
+    async with pooled_client(
         base_url=TestConfig.BASE_URL,
         timeout=TestConfig.TIMEOUT,
         follow_redirects=TestConfig.FOLLOW_REDIRECTS,
@@ -33,8 +36,6 @@ def api_prefix():
 async def test_ingredient(client: httpx.AsyncClient, api_prefix: str):
     """Create a test ingredient and clean up after test"""
     # Use unique name to avoid collisions
-    import uuid
-    from datetime import datetime
     unique_suffix = f"{datetime.now().strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}"
     
     ingredient_data = {
@@ -64,8 +65,6 @@ async def test_ingredient(client: httpx.AsyncClient, api_prefix: str):
 async def test_ingredient_2(client: httpx.AsyncClient, api_prefix: str):
     """Create a second test ingredient for complex recipes"""
     # Use unique name to avoid collisions
-    import uuid
-    from datetime import datetime
     unique_suffix = f"{datetime.now().strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}"
     
     ingredient_data = {
@@ -94,8 +93,6 @@ async def test_ingredient_2(client: httpx.AsyncClient, api_prefix: str):
 @pytest.fixture
 async def test_dish(client: httpx.AsyncClient, api_prefix: str, test_ingredient, test_ingredient_2):
     """Create a test dish and clean up after test"""
-    import uuid
-    from datetime import datetime
     
     ingredient_id_1 = test_ingredient.get("_id")
     ingredient_id_2 = test_ingredient_2.get("_id")
@@ -142,8 +139,6 @@ async def test_dish(client: httpx.AsyncClient, api_prefix: str, test_ingredient,
 @pytest.fixture
 async def test_menu_cycle(client: httpx.AsyncClient, api_prefix: str, test_dish):
     """Create a test menu cycle and clean up after test"""
-    import uuid
-    from datetime import datetime
     
     dish_id = test_dish.get("_id")
     
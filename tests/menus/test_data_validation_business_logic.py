@@ -55,8 +55,6 @@ class TestCrossEntityValidation:
         NOTE: BACKEND ISSUE - Same as CYCLE-004, the API doesn't validate dish existence.
         """
         # Use unique name to avoid collisions
-        import uuid
-        from datetime import datetime
         unique_suffix = f"{datetime.now().strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}"
         
         cycle_data = {
@@ -138,8 +138,6 @@ class TestMenuCyclesAPI:
         validation should be added to the MenuCycleService.
         """
         # Use unique name to avoid collisions
-        import uuid
-        from datetime import datetime
         unique_suffix = f"{datetime.now().strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}"
         
         cycle_data = {
@@ -193,8 +191,6 @@ class TestMenuCyclesAPI:
         dish_id = test_dish.get("_id")
         
         # Use unique base name for this test to ensure proper testing
-        import uuid
-        from datetime import datetime
         unique_suffix = f"{datetime.now().strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}"
         base_name = f"Duplicate Cycle Test-{unique_suffix}"
         
@@ -1,11 +1,11 @@
 import pytest
-import httpx
 import random
 from ..config import settings
+from ..http_clients import pooled_client
 
 @pytest.fixture(scope="module")
 async def document_type(auth_token):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_RH_BACKEND_URL}/options/document-types", headers={"Authorization": f"Bearer {auth_token}"})
         assert response.status_code == 200
         data = response.json()
@@ -14,7 +14,7 @@ async def document_type(auth_token):
 
 @pytest.fixture(scope="module")
 async def gender(auth_token):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_RH_BACKEND_URL}/options/genders", headers={"Authorization": f"Bearer {auth_token}"})
         assert response.status_code == 200
         data = response.json()
@@ -23,7 +23,7 @@ async def gender(auth_token):
 
 @pytest.fixture(scope="module")
 async def operational_role(auth_token):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_RH_BACKEND_URL}/options/operational-roles", headers={"Authorization": f"Bearer {auth_token}"})
         if response.status_code == 200 and response.json():
             yield response.json()[0]
@@ -37,7 +37,7 @@ async def operational_role(auth_token):
 
 @pytest.fixture(scope="module")
 async def availability_status(auth_token):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_RH_BACKEND_URL}/options/availability-statuses", headers={"Authorization": f"Bearer {auth_token}"})
         assert response.status_code == 200
         data = response.json()
@@ -46,7 +46,7 @@ async def availability_status(auth_token):
 
 @pytest.fixture(scope="module")
 async def employee(auth_token, document_type, gender, operational_role):
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         random_doc = f"EMP-FIXTURE-{random.randint(100000, 999999)}"
         employee_data = {
             "document_number": random_doc,
@@ -2,10 +2,10 @@
 Integration tests for Daily Availabilities Endpoints
 """
 import pytest
-import httpx
 import random
 from datetime import date, timedelta
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 created_availability_id = None
@@ -28,7 +28,7 @@ async def test_create_availability_success(auth_token, employee, availability_st
         "notes": "Test note"
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_RH_BACKEND_URL}/availabilities/",
             json=availability_data,
@@ -54,7 +54,7 @@ async def test_create_availability_missing_data(auth_token, employee):
         "date": str(date.today())
         # status_id is missing
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_RH_BACKEND_URL}/availabilities/",
             json=availability_data,
@@ -71,7 +71,7 @@ async def test_create_availability_missing_data(auth_token, employee):
 @pytest.mark.asyncio
 async def test_get_availabilities_success(auth_token):
     """Test successful retrieval of availabilities list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_RH_BACKEND_URL}/availabilities/?start_date=2025-07-10&end_date=2025-07-15",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -88,7 +88,7 @@ async def test_get_availabilities_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_availability_by_id_success(auth_token):
     """Test successful retrieval of an availability by ID"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_RH_BACKEND_URL}/availabilities/employee/1",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -105,7 +105,7 @@ async def test_get_availability_by_id_success(auth_token):
 async def test_get_availability_by_id_not_found(auth_token):
     """Test retrieving an availability with a non-existent ID"""
     non_existent_id = random.randint(99999, 999999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_RH_BACKEND_URL}/availabilities/{non_existent_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -121,7 +121,7 @@ async def test_get_availability_by_id_not_found(auth_token):
 @pytest.mark.asyncio
 async def test_get_availabilities_by_employee_id_success(auth_token, employee):
     """Test successful retrieval of availabilities for a specific employee"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_RH_BACKEND_URL}/availabilities/employee/{employee['id']}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -140,7 +140,7 @@ async def test_get_availabilities_by_employee_id_success(auth_token, employee):
 async def test_delete_availability_not_found(auth_token):
     """Test deleting a non-existent availability"""
     non_existent_id = random.randint(99999, 999999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_RH_BACKEND_URL}/availabilities/{non_existent_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
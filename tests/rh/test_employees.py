@@ -2,10 +2,10 @@
 Integration tests for Employees Endpoints
 """
 import pytest
-import httpx
 import random
 from datetime import date
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 created_employee_id = None
@@ -32,7 +32,7 @@ async def test_create_employee_success(auth_token, document_type, gender, operat
         "operational_role_id": operational_role["id"]
     }
     
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_RH_BACKEND_URL}/employees/",
             json=employee_data,
@@ -63,7 +63,7 @@ async def test_create_employee_missing_data(auth_token, document_type, gender):
         "gender_id": gender["id"]
         # operational_role_id is missing
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.post(
             f"{settings.BASE_RH_BACKEND_URL}/employees/",
             json=employee_data,
@@ -80,7 +80,7 @@ async def test_create_employee_missing_data(auth_token, document_type, gender):
 @pytest.mark.asyncio
 async def test_get_employees_success(auth_token):
     """Test successful retrieval of employees list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_RH_BACKEND_URL}/employees/",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -97,7 +97,7 @@ async def test_get_employees_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_employees_unauthorized():
     """Test retrieving employees list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_RH_BACKEND_URL}/employees/")
     assert response.status_code == 403
 
@@ -111,7 +111,7 @@ async def test_get_employees_unauthorized():
 async def test_get_employee_by_id_success(auth_token):
     """Test successful retrieval of an employee by ID"""
     assert created_employee_id is not None, "Employee ID is not set"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_RH_BACKEND_URL}/employees/{created_employee_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -129,7 +129,7 @@ async def test_get_employee_by_id_success(auth_token):
 async def test_get_employee_by_id_not_found(auth_token):
     """Test retrieving an employee with a non-existent ID"""
     non_existent_id = random.randint(99999, 999999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_RH_BACKEND_URL}/employees/{non_existent_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -146,7 +146,7 @@ async def test_get_employee_by_id_not_found(auth_token):
 async def test_get_employee_by_document_not_found(auth_token):
     """Test retrieving an employee with a non-existent document number"""
     non_existent_doc = f"DOC-{random.randint(99999, 999999)}"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_RH_BACKEND_URL}/employees/document/{non_existent_doc}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -174,7 +174,7 @@ async def test_update_employee_put_success(auth_token, document_type, gender, op
         "operational_role_id": operational_role["id"],
         "is_active": False
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_RH_BACKEND_URL}/employees/{created_employee_id}",
             json=update_data,
@@ -204,7 +204,7 @@ async def test_update_employee_put_not_found(auth_token, document_type, gender,
         "operational_role_id": operational_role["id"],
         "is_active": False
     }
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.put(
             f"{settings.BASE_RH_BACKEND_URL}/employees/{non_existent_id}",
             json=update_data,
@@ -222,7 +222,7 @@ async def test_update_employee_put_not_found(auth_token, document_type, gender,
 async def test_delete_employee_success(auth_token):
     """Test successful deletion of an employee"""
     assert created_employee_id is not None, "Employee ID is not set"
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_RH_BACKEND_URL}/employees/{created_employee_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -239,7 +239,7 @@ async def test_delete_employee_success(auth_token):
 async def test_delete_employee_not_found(auth_token):
     """Test deleting a non-existent employee"""
     non_existent_id = random.randint(99999, 999999)
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.delete(
             f"{settings.BASE_RH_BACKEND_URL}/employees/{non_existent_id}",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -2,8 +2,8 @@
 Integration tests for Parametrics/Options Endpoints
 """
 import pytest
-import httpx
 from ..config import settings
+from ..http_clients import pooled_client
 from ..test_metadata import add_test_info
 
 # Test Document Types
@@ -16,7 +16,7 @@ from ..test_metadata import add_test_info
 @pytest.mark.asyncio
 async def test_get_document_types_success(auth_token):
     """Test successful retrieval of document types list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_RH_BACKEND_URL}/options/document-types",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -34,7 +34,7 @@ async def test_get_document_types_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_document_types_unauthorized():
     """Test retrieving document types list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_RH_BACKEND_URL}/options/document-types")
     assert response.status_code == 403
 
@@ -48,7 +48,7 @@ async def test_get_document_types_unauthorized():
 @pytest.mark.asyncio
 async def test_get_genders_success(auth_token):
     """Test successful retrieval of genders list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_RH_BACKEND_URL}/options/genders",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -66,7 +66,7 @@ async def test_get_genders_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_genders_unauthorized():
     """Test retrieving genders list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_RH_BACKEND_URL}/options/genders")
     assert response.status_code == 403
 
@@ -80,7 +80,7 @@ async def test_get_genders_unauthorized():
 @pytest.mark.asyncio
 async def test_get_operational_roles_success(auth_token):
     """Test successful retrieval of operational roles list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_RH_BACKEND_URL}/options/operational-roles",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -97,7 +97,7 @@ async def test_get_operational_roles_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_operational_roles_unauthorized():
     """Test retrieving operational roles list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_RH_BACKEND_URL}/options/operational-roles")
     assert response.status_code == 403
 
@@ -111,7 +111,7 @@ async def test_get_operational_roles_unauthorized():
 @pytest.mark.asyncio
 async def test_get_availability_statuses_success(auth_token):
     """Test successful retrieval of availability statuses list"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(
             f"{settings.BASE_RH_BACKEND_URL}/options/availability-statuses",
             headers={"Authorization": f"Bearer {auth_token}"}
@@ -129,6 +129,6 @@ async def test_get_availability_statuses_success(auth_token):
 @pytest.mark.asyncio
 async def test_get_availability_statuses_unauthorized():
     """Test retrieving availability statuses list without auth token"""
-    async with httpx.AsyncClient() as client:
+    async with pooled_client() as client:
         response = await client.get(f"{settings.BASE_RH_BACKEND_URL}/options/availability-statuses")
     assert response.status_code == 403 
\ No newline at end of file
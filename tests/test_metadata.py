@@ -2,11 +2,20 @@
 Módulo para decoradores y metadata de tests personalizados
 """
 
-import functools
+import glob
 import inspect
+import json
+import tempfile
 from typing import Dict, Any, Optional, Callable
 import os
 
+import pytest
+
+REGISTRY_FILE = "test_metadata_registry.json"
+
+
+METADATA_MARKER = "test_info"
+
 
 def add_test_info(
     description: str, expected_result: str, module: str = None, test_id: str = None
@@ -14,59 +23,58 @@ def add_test_info(
     """
     Decorador para agregar metadata a los tests
 
+    Aplica el marker de pytest ``test_info`` sin envolver la función: el test se
+    ejecuta sin frames adicionales y la metadata se registra una sola vez al
+    recolectar los tests (ver ``register_collected_items``).
+
     Args:
         description: Descripción detallada del test
         expected_result: Resultado esperado del test
         module: Módulo al que pertenece (opcional)
         test_id: ID único del test (opcional)
     """
+    return getattr(pytest.mark, METADATA_MARKER)(
+        description=description,
+        expected_result=expected_result,
+        module=module,
+        test_id=test_id,
+    )
+
+
+def get_marker_metadata(marks) -> Optional[Dict[str, Any]]:
+    """
+    Retorna la metadata del marker test_info entre los markers de un test
 
-    def decorator(func: Callable) -> Callable:
-        # Agregar metadata como atributos de la función
-        func._test_description = description
-        func._test_expected_result = expected_result
-        func._test_module = module
-        func._test_id = test_id
-
-        # Crear el wrapper apropiado para funciones sync y async
-        if inspect.iscoroutinefunction(func):
-
-            @functools.wraps(func)
-            async def wrapper(*args, **kwargs):
-                return await func(*args, **kwargs)
-
-        else:
-
-            @functools.wraps(func)
-            def wrapper(*args, **kwargs):
-                return func(*args, **kwargs)
-
-        # Copiar los atributos al wrapper para que sean accesibles
-        wrapper._test_description = description
-        wrapper._test_expected_result = expected_result
-        wrapper._test_module = module
-        wrapper._test_id = test_id
-
-        # Registrar metadata en el registry
-        try:
-            registry = MetadataRegistry()
-            module_path = os.path.relpath(inspect.getfile(func))
-            test_key = f"{module_path}::{func.__name__}"
-
-            metadata = {
-                "description": description,
-                "expected_result": expected_result,
-                "module": module,
-                "test_id": test_id,
+    Args:
+        marks: Markers del test (item.iter_markers() o func.pytestmark)
+
+    Returns:
+        Dict con la metadata, o None si el test no tiene el marker
+    """
+    for mark in marks:
+        if mark.name == METADATA_MARKER:
+            return {
+                "description": mark.kwargs.get("description"),
+                "expected_result": mark.kwargs.get("expected_result"),
+                "module": mark.kwargs.get("module"),
+                "test_id": mark.kwargs.get("test_id"),
             }
-            registry.register_test(test_key, metadata)
-        except Exception:
-            # No fallar si el registro falla
-            pass
+    return None
+
 
-        return wrapper
+def register_collected_items(items):
+    """
+    Registra en el MetadataRegistry la metadata de los tests recolectados
 
-    return decorator
+    Args:
+        items: Items de pytest recolectados
+    """
+    registry = MetadataRegistry()
+    for item in items:
+        metadata = get_marker_metadata(item.iter_markers(name=METADATA_MARKER))
+        if metadata is not None:
+            test_key = f"{os.path.relpath(item.path)}::{getattr(item, 'originalname', item.name)}"
+            registry.register_test(test_key, metadata)
 
 
 def extract_test_metadata(func: Callable) -> Dict[str, Any]:
@@ -79,13 +87,10 @@ def extract_test_metadata(func: Callable) -> Dict[str, Any]:
     Returns:
         Dict con la metadata del test
     """
-    metadata = {}
-
     # Extraer del decorador @add_test_info
-    metadata["description"] = getattr(func, "_test_description", None)
-    metadata["expected_result"] = getattr(func, "_test_expected_result", None)
-    metadata["module"] = getattr(func, "_test_module", None)
-    metadata["test_id"] = getattr(func, "_test_id", None)
+    metadata = get_marker_metadata(getattr(func, "pytestmark", [])) or dict.fromkeys(
+        ["description", "expected_result", "module", "test_id"]
+    )
 
     # Extraer del docstring si no hay decorador
     if not metadata["description"]:
@@ -162,3 +167,53 @@ class MetadataRegistry:
     def get_all_tests(self) -> Dict[str, Dict[str, Any]]:
         """Obtener metadata de todos los tests"""
         return self._tests.copy()
+
+    def write_shard(self, worker_id: str, path: str = REGISTRY_FILE):
+        """
+        Escribir la metadata de un worker de pytest-xdist en su propio archivo
+
+        Args:
+            worker_id: Id del worker (ej: "gw0")
+            path: Archivo del registro completo
+        """
+        _write_json_atomic(_shard_path(path, worker_id), self._tests)
+
+    def write(self, path: str = REGISTRY_FILE):
+        """
+        Escribir el registro completo, combinando los archivos de los workers
+
+        El archivo se reemplaza de forma atómica, por lo que nunca queda una
+        versión parcial aunque otro proceso lo esté leyendo.
+
+        Args:
+            path: Archivo del registro completo
+        """
+        tests = {}
+        shard_paths = glob.glob(_shard_path(path, "*"))
+        for shard_path in shard_paths:
+            with open(shard_path, "r") as f:
+                tests.update(json.load(f))
+        tests.update(self._tests)
+
+        _write_json_atomic(path, tests)
+        for shard_path in shard_paths:
+            os.remove(shard_path)
+
+
+def _shard_path(path: str, worker_id: str) -> str:
+    """Archivo de metadata de un worker: test_metadata_registry.gw0.json"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.{worker_id}{ext}"
+
+
+def _write_json_atomic(path: str, data: Dict[str, Any]):
+    """Escribir JSON en un archivo temporal y reemplazar el destino con os.replace"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".registry-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
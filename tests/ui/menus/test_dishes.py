@@ -1,17 +1,13 @@
+from __future__ import annotations
+
 import pytest  # type: ignore
 from datetime import datetime, timezone as tz
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import Select
+from tests.ui.utils.lazy_selenium import webdriver, By, WebDriverWait, Select, EC, ChromeOptions as Options
 
 from tests.config import settings
 from tests.test_metadata import add_test_info
 
 from enum import Enum
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 
 from tests.ui.menus.test_ingredients import IngredientsLocators
 
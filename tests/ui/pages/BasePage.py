@@ -1,13 +1,13 @@
-from selenium import webdriver
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from typing import List, Union, Tuple, Optional
+from __future__ import annotations
+
+from tests.ui.utils.lazy_selenium import webdriver, By, WebDriverWait, EC, exceptions
+from typing import TYPE_CHECKING, List, Union, Tuple, Optional
 import logging
 
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
 
 class BasePage:
     """
@@ -39,7 +39,7 @@ class BasePage:
         """
         try:
             return self.wait.until(EC.presence_of_element_located(locator))
-        except TimeoutException:
+        except exceptions.TimeoutException:
             self.logger.error(f"Element not found: {locator}")
             return None
 
@@ -54,7 +54,7 @@ class BasePage:
         try:
             self.wait.until(EC.presence_of_element_located(locator))
             return self.driver.find_elements(*locator)
-        except TimeoutException:
+        except exceptions.TimeoutException:
             self.logger.error(f"Elements not found: {locator}")
             return []
 
@@ -70,7 +70,7 @@ class BasePage:
             element = self.wait.until(EC.element_to_be_clickable(locator))
             element.click()
             return True
-        except TimeoutException:
+        except exceptions.TimeoutException:
             self.logger.error(f"Element not clickable: {locator}")
             return False
 
@@ -85,7 +85,7 @@ class BasePage:
         try:
             element = self.wait.until(EC.visibility_of_element_located(locator))
             return element.is_displayed()
-        except TimeoutException:
+        except exceptions.TimeoutException:
             return False
 
     def wait_element_visible(self, locator: Tuple[str, str]) -> bool:
@@ -99,7 +99,7 @@ class BasePage:
         try:
             self.wait.until(EC.visibility_of_element_located(locator))
             return True
-        except TimeoutException:
+        except exceptions.TimeoutException:
             self.logger.error(f"Element did not become visible: {locator}")
             return False
 
@@ -239,7 +239,7 @@ class BasePage:
             wait.until(EC.url_contains(url_fragment))
             self.logger.info(f"URL now contains: {url_fragment}")
             return True
-        except TimeoutException:
+        except exceptions.TimeoutException:
             current_url = self.get_current_url()
             self.logger.error(
                 f"URL did not contain '{url_fragment}' within {timeout} seconds. Current URL: {current_url}"
@@ -1,9 +1,12 @@
+from __future__ import annotations
+
 import logging
 from tests.ui.pages.BasePage import BasePage
-from selenium import webdriver
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.common.by import By
-from typing import Union
+from tests.ui.utils.lazy_selenium import webdriver, By
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
 
 class LoginPage(BasePage):
@@ -12,13 +12,7 @@ from .BaseTest import BaseTest
 from ..pages.LoginPage import LoginPage
 from ..pages.BasePage import BasePage
 
-# Importar settings usando absolute import
-import sys
-from pathlib import Path
-
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
-
+# tests es un paquete: pytest ya agrega la raíz del proyecto a sys.path
 from tests.config import settings
 
 
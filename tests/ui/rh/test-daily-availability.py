@@ -1,10 +1,7 @@
+from __future__ import annotations
+
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import StaleElementReferenceException
+from tests.ui.utils.lazy_selenium import webdriver, By, WebDriverWait, EC, ChromeOptions as Options, exceptions
 from tests.config import settings
 from tests.test_metadata import add_test_info
 
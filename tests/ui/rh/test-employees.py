@@ -1,18 +1,14 @@
+from __future__ import annotations
+
 import pytest  # type: ignore
 from datetime import datetime, timezone as tz
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import Select
+from tests.ui.utils.lazy_selenium import webdriver, By, WebDriverWait, Select, EC, ChromeOptions as Options, exceptions
 
 from tests.config import settings
 from tests.test_metadata import add_test_info
 
 from enum import Enum
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import re
-from selenium.common.exceptions import StaleElementReferenceException
 
 DEFAULT_TIMEOUT = 40  # Tiempo por defecto para esperas
 
@@ -140,7 +136,7 @@ def click_edit_first_employee(driver, retries=3):
             wait_for_no_overlay(driver)
             btn.click()
             return
-        except StaleElementReferenceException:
+        except exceptions.StaleElementReferenceException:
             if attempt == retries - 1:
                 raise
             else:
@@ -189,7 +185,7 @@ def click_action_first_employee(driver, accion="editar", retries=3):
             wait_for_no_overlay(driver)
             btn.click()
             return
-        except StaleElementReferenceException:
+        except exceptions.StaleElementReferenceException:
             if attempt == retries - 1:
                 return
             else:
@@ -610,7 +606,7 @@ class TestEmployeesUI:
             assert (
                 form_dialog.is_displayed()
             ), "El formulario de edición de empleado no se muestra"
-        except StaleElementReferenceException:
+        except exceptions.StaleElementReferenceException:
             return
 
     @add_test_info(
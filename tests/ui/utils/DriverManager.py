@@ -1,6 +1,6 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from __future__ import annotations
+
+from .lazy_selenium import webdriver, ChromeOptions, FirefoxOptions
 from typing import Optional
 
 
@@ -0,0 +1,76 @@
+"""
+Acceso diferido a Selenium para los tests de UI.
+
+Importar ``selenium.webdriver`` cuesta tiempo y se pagaba al recolectar
+cualquier parte del árbol de tests. Este módulo expone los mismos nombres que
+usan las suites de UI, pero Selenium solo se importa la primera vez que se usa
+uno de ellos, es decir, cuando un test de UI se ejecuta realmente.
+"""
+
+import importlib
+from typing import Any, Optional
+
+
+class By:
+    """
+    Estrategias de localización de Selenium.
+
+    Son las mismas cadenas que ``selenium.webdriver.common.by.By``; se definen
+    aquí para que los locators a nivel de módulo no requieran importar Selenium.
+    """
+
+    ID = "id"
+    XPATH = "xpath"
+    LINK_TEXT = "link text"
+    PARTIAL_LINK_TEXT = "partial link text"
+    NAME = "name"
+    TAG_NAME = "tag name"
+    CLASS_NAME = "class name"
+    CSS_SELECTOR = "css selector"
+
+
+class LazyImport:
+    """
+    Proxy que importa un módulo (o un atributo de un módulo) en el primer uso.
+
+    Args:
+        module_name (str): Módulo a importar (ej: "selenium.webdriver")
+        attribute (str): Atributo del módulo a exponer (opcional)
+    """
+
+    def __init__(self, module_name: str, attribute: Optional[str] = None):
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target = None
+
+    def _resolve(self) -> Any:
+        if self._target is None:
+            target = importlib.import_module(self._module_name)
+            if self._attribute is not None:
+                target = getattr(target, self._attribute)
+            self._target = target
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        # pytest inspecciona los atributos de cada módulo al recolectar (ej:
+        # buscando fixtures); los nombres privados no deben disparar la importación
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        target = f"{self._module_name}.{self._attribute}" if self._attribute else self._module_name
+        return f"<LazyImport {target}>"
+
+
+webdriver = LazyImport("selenium.webdriver")
+ChromeOptions = LazyImport("selenium.webdriver.chrome.options", "Options")
+FirefoxOptions = LazyImport("selenium.webdriver.firefox.options", "Options")
+WebDriverWait = LazyImport("selenium.webdriver.support.ui", "WebDriverWait")
+Select = LazyImport("selenium.webdriver.support.ui", "Select")
+EC = LazyImport("selenium.webdriver.support.expected_conditions")
+# Usar como `except exceptions.TimeoutException:`; la clase se resuelve al capturar
+exceptions = LazyImport("selenium.common.exceptions")
@@ -0,0 +1,97 @@
+"""
+Verificación de ida y vuelta de los cassettes
+
+Graba las suites de API contra los backends simulados en proceso y las
+reproduce sin backends (velocidad 0), cada ejecución en un proceso nuevo y con
+cassettes en un directorio temporal. Falla si algún test cambia de resultado
+entre la grabación y la reproducción o si alguna petición no tiene grabación,
+es decir, si las entradas de los tests no son deterministas. Uso:
+
+    python -m utils.cassette_roundtrip
+    python -m utils.cassette_roundtrip --seed 1234 tests/rh
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from typing import Dict, Any, List
+
+from .services import PROJECT_ROOT, SERVICE_TEST_PATHS
+
+# Se ejecuta en el proceso hijo: corre pytest y reporta el resultado de cada test
+_CHILD_SCRIPT = """
+import json, sys
+import pytest
+
+class Outcomes:
+    results = {}
+    missing = 0
+    def pytest_runtest_logreport(self, report):
+        if report.when == "call" or report.outcome != "passed":
+            Outcomes.results.setdefault(report.nodeid, report.outcome)
+    def pytest_sessionfinish(self, session):
+        from utils.cassettes import _cassette_key
+        Outcomes.missing = getattr(session.config.stash.get(_cassette_key, None), "missing", 0)
+
+exitcode = pytest.main(sys.argv[1:] + ["-c", "pytest.ini", "-qqq", "-p", "no:cacheprovider"], plugins=[Outcomes()])
+print(json.dumps({"exitcode": int(exitcode), "outcomes": Outcomes.results, "missing": Outcomes.missing}))
+"""
+
+
+def run_tests(test_paths: List[str], options: List[str]) -> Dict[str, Any]:
+    """
+    Ejecuta los tests en un proceso nuevo con el plugin de cassettes
+
+    Returns:
+        Dict con 'exitcode', 'outcomes' (resultado por nodeid) y 'missing'
+        (peticiones sin grabación al reproducir)
+    """
+    completed = subprocess.run(
+        [sys.executable, "-c", _CHILD_SCRIPT, *test_paths, "-p", "utils.cassettes", *options],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    """Graba, reproduce y retorna el código de salida (1 si los resultados difieren)"""
+    parser = argparse.ArgumentParser(description="Verifica que los cassettes grabados se reproduzcan igual")
+    parser.add_argument("paths", nargs="*", help="Rutas de tests (por defecto las suites de API)")
+    parser.add_argument("--seed", default=None, help="Semilla de la grabación (por defecto una nueva)")
+    args = parser.parse_args(argv)
+
+    test_paths = args.paths or [
+        path for path in SERVICE_TEST_PATHS.values()
+        if not path.startswith("tests/ui") and (PROJECT_ROOT / path).exists()
+    ]
+    with tempfile.TemporaryDirectory(prefix="cassettes-") as directory:
+        record_options = [
+            "-p", "utils.fake_backends.plugin", "--fake-backends", "inprocess",
+            "--cassette-mode", "record", "--cassette-dir", directory,
+        ]
+        if args.seed:
+            record_options += ["--cassette-seed", args.seed]
+        recorded = run_tests(test_paths, record_options)
+        replayed = run_tests(test_paths, [
+            "--cassette-mode", "replay", "--cassette-dir", directory, "--replay-speed", "0",
+        ])
+
+    changed = sorted(
+        nodeid for nodeid in recorded["outcomes"].keys() | replayed["outcomes"].keys()
+        if recorded["outcomes"].get(nodeid) != replayed["outcomes"].get(nodeid)
+    )
+    print(f"Rutas: {', '.join(test_paths)}")
+    print(f"Tests grabados: {len(recorded['outcomes'])}, reproducidos: {len(replayed['outcomes'])}")
+    print(f"Peticiones sin grabación: {replayed['missing']}")
+
+    for nodeid in changed:
+        print(f"✗ {nodeid}: {recorded['outcomes'].get(nodeid)} → {replayed['outcomes'].get(nodeid)}")
+    failed = bool(changed) or replayed["missing"] > 0 or not recorded["outcomes"]
+    if not failed:
+        print("✓ La reproducción da los mismos resultados que la grabación")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,343 @@
+"""
+Plugin de pytest para grabar y reproducir las peticiones HTTP de los tests
+
+Se carga con ``-p utils.cassettes --cassette-mode record|replay``. Intercepta
+todas las peticiones de los clientes de tests/http_clients.py (fixtures y
+tests) a través de ``http_clients.handler``:
+
+- record: envía cada petición al backend y guarda el intercambio (método, URL,
+  body de la petición, status, headers y body de la respuesta y latencia) en
+  un cassette comprimido por módulo de tests, en ``--cassette-dir``.
+- replay: no abre conexiones; responde desde los cassettes esperando la
+  latencia grabada multiplicada por ``--replay-speed`` (0 responde de
+  inmediato). Las peticiones sin grabación fallan con httpx.ConnectError, igual
+  que un servicio caído, por lo que las cuenta el circuit breaker.
+
+En ambos modos las entradas de cada test son deterministas: ``random``,
+``uuid.uuid4`` y ``bson.ObjectId()`` se siembran con la semilla de la
+grabación y el nodeid del test, y el reloj de los módulos de tests
+(``time.time``, ``datetime.now``, ``date.today``) queda fijo en la hora de la
+grabación. La semilla se elige al grabar (``--cassette-seed`` o una nueva por
+grabación, para no repetir nombres contra backends con datos previos) una
+sola vez por sesión, también con pytest-xdist, y se guarda en cada cassette
+junto con la hora; al reproducir, cada test usa las de su módulo.
+
+Permite iterar sobre el reporte, la metadata o la planificación sin los cinco
+backends, y medir el costo del propio harness reproduciendo con velocidad 0.
+"""
+import asyncio
+import datetime
+import gzip
+import json
+import os
+import random
+import sys
+import time
+import types
+import uuid
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
+
+import httpx
+import pytest
+from bson import ObjectId
+
+from .results_collector import strip_group_suffix
+
+CASSETTE_DIR = Path(".nutripae") / "cassettes"
+
+# Headers de la respuesta que no se graban: cambian en cada ejecución o los
+# recalcula httpx a partir del body (que se guarda ya descomprimido)
+_SKIPPED_HEADERS = {'date', 'server', 'content-length', 'content-encoding', 'transfer-encoding', 'connection'}
+
+
+def cassette_path(directory: Path, module_path: str) -> Path:
+    """Archivo del cassette de un módulo de tests (ej. tests/rh/test_employees.py)"""
+    return Path(directory) / (module_path.removesuffix(".py").replace("/", "__") + ".json.gz")
+
+
+def _decode(content: bytes) -> str:
+    return content.decode("utf-8", errors="surrogateescape")
+
+
+def _encode(text: str) -> bytes:
+    return text.encode("utf-8", errors="surrogateescape")
+
+
+def _build_response(request: httpx.Request, interaction: dict) -> httpx.Response:
+    return httpx.Response(
+        interaction["status"],
+        headers=interaction["headers"],
+        content=_encode(interaction["body"]),
+        request=request,
+    )
+
+
+class _FrozenTime(types.ModuleType):
+    """Módulo time cuyo time() retorna siempre el mismo instante"""
+
+    def __init__(self, timestamp: float):
+        super().__init__("time")
+        self.timestamp = timestamp
+
+    def time(self) -> float:
+        return self.timestamp
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+def seeded_inputs(monkeypatch: pytest.MonkeyPatch, seed: str, timestamp: float):
+    """
+    Siembra los generadores de entradas de los tests y fija su reloj
+
+    ``random`` se siembra globalmente. ``uuid.uuid4`` y ``ObjectId()`` sin
+    argumentos se derivan de un generador propio, por lo que los IDs que
+    consuman los tests no desplazan la secuencia de ``random``. El reloj se
+    fija en timestamp más un desplazamiento de hasta una hora según la semilla,
+    para que los nombres con la hora no coincidan entre tests. ObjectId, time,
+    datetime y date se reemplazan en los módulos del paquete tests, que los
+    importan por nombre; los backends simulados no se ven afectados.
+    """
+    random.seed(seed)
+    generator = random.Random(f"{seed}:ids")
+    now = timestamp + generator.randrange(3600)
+
+    class SeededObjectId(ObjectId):
+        def __init__(self, oid=None):
+            super().__init__(generator.randbytes(12) if oid is None else oid)
+
+    class FrozenDatetime(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls.fromtimestamp(now, tz)
+
+    class FrozenDate(datetime.date):
+        @classmethod
+        def today(cls):
+            return cls.fromtimestamp(now)
+
+    replacements = [
+        (ObjectId, SeededObjectId),
+        (time, _FrozenTime(now)),
+        (datetime.datetime, FrozenDatetime),
+        (datetime.date, FrozenDate),
+    ]
+    monkeypatch.setattr(uuid, "uuid4", lambda: uuid.UUID(int=generator.getrandbits(128), version=4))
+    for name, module in list(sys.modules.items()):
+        if name != "tests" and not name.startswith("tests."):
+            continue
+        for attribute, value in list(vars(module).items()):
+            for original, replacement in replacements:
+                if value is original:
+                    monkeypatch.setattr(module, attribute, replacement)
+
+
+def new_recording(seed: Optional[str] = None) -> Tuple[str, float]:
+    """Semilla (la indicada o una nueva) y hora de una grabación"""
+    return seed or os.urandom(8).hex(), time.time()
+
+
+class CassetteRecorder:
+    """Envía las peticiones al backend y las graba por módulo de tests"""
+
+    def __init__(self, directory: Path, recording: Tuple[str, float]):
+        self.directory = Path(directory)
+        self.seed, self.recorded_at = recording
+        self.current_module = "session"
+        self.interactions: Dict[str, List[dict]] = defaultdict(list)
+
+    def recording_for(self, module_path: str) -> Optional[Tuple[str, float]]:
+        """Semilla y hora con que se siembran los tests de un módulo"""
+        return self.seed, self.recorded_at
+
+    async def handle(self, request: httpx.Request, send) -> httpx.Response:
+        body = await request.aread()
+        start = time.perf_counter()
+        response = await send(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        interaction = {
+            "method": request.method,
+            "url": str(request.url),
+            "request_body": _decode(body),
+            "status": response.status_code,
+            "headers": [[name, value] for name, value in response.headers.items()
+                        if name.lower() not in _SKIPPED_HEADERS],
+            "body": _decode(content),
+            "elapsed": round(time.perf_counter() - start, 4),
+        }
+        self.interactions[self.current_module].append(interaction)
+        return _build_response(request, interaction)
+
+    def save(self) -> int:
+        """Escribe un cassette por módulo grabado; retorna la cantidad de intercambios"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for module_path, interactions in self.interactions.items():
+            # ensure_ascii escapa también los bytes no UTF-8 conservados por _decode
+            with gzip.open(cassette_path(self.directory, module_path), "wt", encoding="utf-8") as f:
+                json.dump(
+                    {"module": module_path, "seed": self.seed, "recorded_at": self.recorded_at,
+                     "interactions": interactions},
+                    f, separators=(",", ":")
+                )
+        return sum(len(interactions) for interactions in self.interactions.values())
+
+
+class CassettePlayer:
+    """
+    Responde las peticiones desde los cassettes grabados
+
+    Cada petición consume el siguiente intercambio grabado con el mismo método
+    y URL, preferentemente con el mismo body. Se busca
+    primero en el cassette del módulo actual y después en los demás, ya que los
+    fixtures de sesión se graban en el módulo que los usó primero.
+    """
+
+    def __init__(self, directory: Path, speed: float = 1.0):
+        self.speed = speed
+        self.current_module = "session"
+        self.replayed = 0
+        self.missing = 0
+        # Semilla y hora por módulo: los cassettes pueden venir de grabaciones distintas
+        self.recordings: Dict[str, Tuple[str, float]] = {}
+        self.cassettes: Dict[str, Dict[Tuple[str, str], Deque[dict]]] = {}
+        for path in sorted(Path(directory).glob("*.json.gz")):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                cassette = json.load(f)
+            if cassette.get("seed"):
+                self.recordings[cassette["module"]] = (cassette["seed"], cassette["recorded_at"])
+            queues: Dict[Tuple[str, str], Deque[dict]] = defaultdict(deque)
+            for interaction in cassette["interactions"]:
+                queues[(interaction["method"], interaction["url"])].append(interaction)
+            self.cassettes[cassette["module"]] = queues
+
+    def recording_for(self, module_path: str) -> Optional[Tuple[str, float]]:
+        """
+        Semilla y hora con que se grabó un módulo
+
+        Los cassettes grabados sin semilla se reproducen sin sembrar las entradas.
+        """
+        return self.recordings.get(module_path)
+
+    def _take(self, key: Tuple[str, str], body: str) -> Optional[dict]:
+        current = self.cassettes.get(self.current_module)
+        others = [queues for module, queues in self.cassettes.items() if module != self.current_module]
+        for queues in ([current] if current else []) + others:
+            queue = queues.get(key)
+            if not queue:
+                continue
+            for interaction in queue:
+                if interaction["request_body"] == body:
+                    queue.remove(interaction)
+                    return interaction
+            return queue.popleft()
+        return None
+
+    async def handle(self, request: httpx.Request, send) -> httpx.Response:
+        body = _decode(await request.aread())
+        interaction = self._take((request.method, str(request.url)), body)
+        if interaction is None:
+            self.missing += 1
+            raise httpx.ConnectError(f"Sin grabación para {request.method} {request.url}", request=request)
+        if self.speed > 0:
+            await asyncio.sleep(interaction["elapsed"] * self.speed)
+        self.replayed += 1
+        return _build_response(request, interaction)
+
+
+_cassette_key = pytest.StashKey[object]()
+_recording_key = pytest.StashKey[Tuple[str, float]]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--cassette-mode", choices=["record", "replay"], default=None,
+        help="Grabar las peticiones HTTP de los tests en cassettes o reproducirlas sin backends"
+    )
+    parser.addoption(
+        "--cassette-dir", default=str(CASSETTE_DIR),
+        help="Directorio de los cassettes (un archivo por módulo de tests)"
+    )
+    parser.addoption(
+        "--cassette-seed", default=None,
+        help="Semilla de las entradas de los tests al grabar (por defecto una nueva por grabación)"
+    )
+    parser.addoption(
+        "--replay-speed", type=float, default=1.0,
+        help="Factor sobre la latencia grabada al reproducir (0 responde de inmediato)"
+    )
+
+
+def pytest_configure(config):
+    mode = config.getoption("--cassette-mode")
+    if mode is None:
+        return
+    # Con pytest-xdist las peticiones se hacen en los workers, no en el
+    # controlador, que solo elige la semilla y la hora de la grabación
+    is_xdist_controller = getattr(config.option, "dist", "no") != "no" and not hasattr(config, "workerinput")
+    if mode == "record":
+        workerinput = getattr(config, "workerinput", {})
+        if "cassette_seed" in workerinput:
+            config.stash[_recording_key] = (workerinput["cassette_seed"], workerinput["cassette_recorded_at"])
+        else:
+            config.stash[_recording_key] = new_recording(config.getoption("--cassette-seed"))
+    if is_xdist_controller:
+        return
+
+    from tests.config import settings
+    from tests.http_clients import http_clients
+
+    if mode == "record":
+        cassette = CassetteRecorder(config.getoption("--cassette-dir"), config.stash[_recording_key])
+    else:
+        cassette = CassettePlayer(config.getoption("--cassette-dir"), config.getoption("--replay-speed"))
+    # Con tokens del cache compartido el login no quedaría grabado
+    settings.AUTH_TOKEN_CACHE = False
+    http_clients.handler = cassette.handle
+    config.stash[_cassette_key] = cassette
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Comparte con cada worker de pytest-xdist la semilla y la hora del controlador"""
+    recording = node.config.stash.get(_recording_key, None)
+    if recording is not None:
+        node.workerinput["cassette_seed"], node.workerinput["cassette_recorded_at"] = recording
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Asocia las peticiones del test y de sus fixtures al cassette de su módulo"""
+    cassette = item.config.stash.get(_cassette_key, None)
+    if cassette is None:
+        yield
+        return
+    cassette.current_module = item.nodeid.split("::")[0]
+    recording = cassette.recording_for(cassette.current_module)
+    if recording is None:
+        yield
+        return
+    seed, recorded_at = recording
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Sin el sufijo de grupo de xdist, para grabar en paralelo y reproducir en serie
+        seeded_inputs(monkeypatch, f"{seed}:{strip_group_suffix(item.nodeid)}", recorded_at)
+        yield
+
+
+def pytest_sessionfinish(session):
+    cassette = session.config.stash.get(_cassette_key, None)
+    if isinstance(cassette, CassetteRecorder) and cassette.interactions:
+        count = cassette.save()
+        print(f"\n📼 {count} peticiones grabadas en {cassette.directory}")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    cassette = config.stash.get(_cassette_key, None)
+    if isinstance(cassette, CassettePlayer):
+        terminalreporter.write_line(
+            f"📼 {cassette.replayed} peticiones reproducidas, {cassette.missing} sin grabación"
+        )
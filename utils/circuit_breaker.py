@@ -0,0 +1,150 @@
+"""
+Plugin de pytest con un circuit breaker por servicio backend
+
+Se carga con ``-p utils.circuit_breaker``. Cuenta los tests consecutivos que
+fallan por errores de transporte de httpx (conexión rechazada, timeouts, etc.)
+contra cada backend, ya sea en los fixtures compartidos (``client``,
+``auth_token``) o en los clientes de tests/http_clients.py dentro de cada
+test. Cualquier respuesta del backend, sea cual sea su status, reinicia el
+contador de su origen: un test que falla por una aserción no interrumpe la
+racha, pero sí la respuesta que recibió. Al superar el umbral, el resto de
+los tests de ese servicio no se ejecutan y se reportan con el resultado
+"unavailable" (servicio no disponible), distinto de un FAIL.
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+import pytest
+
+from .services import SERVICE_DEPENDENCIES, get_service_base_url, get_service_for_item
+
+DEFAULT_THRESHOLD = 3
+
+# Nombre del servicio no disponible asignado a un item (por el circuit breaker o el pre-flight)
+UNAVAILABLE_KEY = pytest.StashKey[str]()
+
+
+def get_origin(url: str) -> str:
+    """Retorna scheme://host:puerto de una URL"""
+    parts = urlsplit(str(url))
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def find_transport_error(exception: BaseException) -> Optional[httpx.TransportError]:
+    """Busca un error de transporte de httpx en la cadena de excepciones"""
+    seen = set()
+    while exception is not None and id(exception) not in seen:
+        if isinstance(exception, httpx.TransportError):
+            return exception
+        seen.add(id(exception))
+        exception = exception.__cause__ or exception.__context__
+    return None
+
+
+class CircuitBreaker:
+    """Estado del circuit breaker: fallas consecutivas y circuitos abiertos por origen"""
+
+    def __init__(self, threshold: int = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.failures: Dict[str, int] = {}
+        self.open_circuits: Dict[str, str] = {}
+
+    def record_failure(self, origin: str, error: httpx.TransportError):
+        """Registra un test fallido por error de transporte contra un origen"""
+        self.failures[origin] = self.failures.get(origin, 0) + 1
+        if self.failures[origin] >= self.threshold and origin not in self.open_circuits:
+            self.open_circuits[origin] = f"{type(error).__name__}: {error}"
+            print(f"\n⚡ Circuito abierto para {origin} tras {self.failures[origin]} fallas de conexión consecutivas")
+
+    def record_response(self, origin: str):
+        """Reinicia el contador de un origen que respondió una petición"""
+        self.failures[origin] = 0
+
+    def get_open_service(self, service_origins) -> Optional[Tuple[str, str]]:
+        """Retorna el primer (servicio, origen) con el circuito abierto, si existe"""
+        return next(((service, origin) for service, origin in service_origins if origin in self.open_circuits), None)
+
+
+_breaker_key = pytest.StashKey[CircuitBreaker]()
+# Marca de un item cuya falla de transporte ya se contó (setup, call o teardown)
+_failure_recorded_key = pytest.StashKey[bool]()
+_listener_key = pytest.StashKey[Callable[[httpx.Request], None]]()
+
+
+def _get_item_origins(item) -> List[Tuple[str, str]]:
+    """(servicio, origen) de los que depende un test: su servicio y las dependencias de éste"""
+    service = get_service_for_item(item)
+    if service is None:
+        return []
+    services = [service] + SERVICE_DEPENDENCIES.get(service, [])
+    return [(name, get_origin(get_service_base_url(name))) for name in services]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--breaker-threshold", type=int, default=DEFAULT_THRESHOLD,
+        help="Tests consecutivos con errores de conexión antes de abrir el circuito de un servicio"
+    )
+
+
+def pytest_configure(config):
+    from tests.http_clients import http_clients
+
+    breaker = CircuitBreaker(config.getoption("--breaker-threshold"))
+    config.stash[_breaker_key] = breaker
+    config.stash[_listener_key] = lambda request: breaker.record_response(get_origin(request.url))
+    http_clients.response_listeners.append(config.stash[_listener_key])
+
+
+def pytest_unconfigure(config):
+    from tests.http_clients import http_clients
+
+    # El registro es global: pytest.main puede ejecutarse varias veces en el mismo proceso
+    listener = config.stash.get(_listener_key, None)
+    if listener in http_clients.response_listeners:
+        http_clients.response_listeners.remove(listener)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Omite el test si el circuito de su servicio (o de sus dependencias) está abierto"""
+    breaker = item.config.stash[_breaker_key]
+    open_service = breaker.get_open_service(_get_item_origins(item))
+    if open_service is not None:
+        service, origin = open_service
+        item.stash[UNAVAILABLE_KEY] = service
+        pytest.skip(f"Servicio no disponible: {origin} ({breaker.open_circuits[origin]})")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Cuenta errores de transporte y marca los reportes de servicios no disponibles
+
+    Cada test cuenta como máximo una falla, aunque su fixture falle tanto en el
+    setup como en el teardown.
+    """
+    outcome = yield
+    report = outcome.get_result()
+
+    if UNAVAILABLE_KEY in item.stash:
+        report.service_unavailable = item.stash[UNAVAILABLE_KEY]
+        return
+
+    breaker = item.config.stash[_breaker_key]
+    error = find_transport_error(call.excinfo.value) if call.excinfo else None
+    if error is not None and not item.stash.get(_failure_recorded_key, False):
+        try:
+            breaker.record_failure(get_origin(error.request.url), error)
+        except RuntimeError:
+            # El error no tiene request asociado
+            return
+        item.stash[_failure_recorded_key] = True
+
+
+def pytest_report_teststatus(report, config):
+    """Muestra los tests de servicios no disponibles con su propio estado"""
+    if getattr(report, "service_unavailable", None) and report.when == "setup":
+        return "unavailable", "U", "UNAVAILABLE"
+    return None
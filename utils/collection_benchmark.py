@@ -0,0 +1,111 @@
+"""
+Benchmark del tiempo de recolección de tests
+
+Mide ``pytest --collect-only`` en un proceso nuevo por repetición (para no
+reutilizar módulos ya importados) y verifica que la recolección no importe
+Selenium: las suites de UI lo cargan solo al ejecutar un test. Uso:
+
+    python -m utils.collection_benchmark            # suites de API
+    python -m utils.collection_benchmark --all      # árbol completo
+    python -m utils.collection_benchmark --max-seconds 3
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from statistics import median
+from typing import Dict, Any, List
+
+from .services import PROJECT_ROOT, SERVICE_TEST_PATHS
+
+UI_SERVICES = {service for service, path in SERVICE_TEST_PATHS.items() if path.startswith("tests/ui")}
+
+# Se ejecuta en el proceso hijo: recolecta y reporta tiempo, cantidad y si se importó Selenium
+_CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import pytest
+
+class Counter:
+    collected = 0
+    def pytest_collection_finish(self, session):
+        Counter.collected = len(session.items)
+
+exitcode = pytest.main(sys.argv[1:] + ["-c", "pytest.ini", "--collect-only", "-qqq", "-p", "no:cacheprovider"], plugins=[Counter()])
+print(json.dumps({
+    "exitcode": int(exitcode),
+    "elapsed": time.perf_counter() - start,
+    "collected": Counter.collected,
+    "selenium_imported": "selenium" in sys.modules,
+}))
+"""
+
+
+def measure_collection(test_paths: List[str], repeat: int = 3) -> Dict[str, Any]:
+    """
+    Mide la recolección de las rutas indicadas
+
+    Args:
+        test_paths: Rutas de tests a recolectar
+        repeat: Repeticiones, cada una en un proceso nuevo
+
+    Returns:
+        Dict con 'median', 'min', 'collected', 'selenium_imported' y 'exitcode'
+    """
+    runs = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-c", _CHILD_SCRIPT, *test_paths],
+            cwd=PROJECT_ROOT, capture_output=True, text=True,
+        )
+        runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    elapsed = [run["elapsed"] for run in runs]
+    return {
+        "median": median(elapsed),
+        "min": min(elapsed),
+        "collected": runs[-1]["collected"],
+        "selenium_imported": any(run["selenium_imported"] for run in runs),
+        "exitcode": max(run["exitcode"] for run in runs),
+    }
+
+
+def main(argv=None) -> int:
+    """Ejecuta el benchmark y retorna el código de salida (1 si no cumple)"""
+    parser = argparse.ArgumentParser(description="Mide el tiempo de recolección de los tests")
+    parser.add_argument("--all", action="store_true", help="Recolectar también las suites de UI")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones (una por proceso)")
+    parser.add_argument(
+        "--max-seconds", type=float, default=None,
+        help="Falla si la mediana de la recolección supera este tiempo"
+    )
+    args = parser.parse_args(argv)
+
+    test_paths = [
+        path for service, path in SERVICE_TEST_PATHS.items()
+        if (args.all or service not in UI_SERVICES) and (PROJECT_ROOT / path).exists()
+    ]
+    result = measure_collection(test_paths, args.repeat)
+
+    print(f"Rutas: {', '.join(test_paths)}")
+    print(f"Tests recolectados: {result['collected']}")
+    print(f"Tiempo de recolección: mediana {result['median']:.2f}s, mínimo {result['min']:.2f}s ({args.repeat} procesos)")
+    print(f"Selenium importado: {'sí' if result['selenium_imported'] else 'no'}")
+
+    failed = result["exitcode"] != 0
+    if failed:
+        print(f"✗ pytest terminó con código {result['exitcode']}")
+    if result["selenium_imported"]:
+        print("✗ La recolección importó Selenium")
+        failed = True
+    if args.max_seconds is not None and result["median"] > args.max_seconds:
+        print(f"✗ La recolección supera el máximo de {args.max_seconds:.2f}s")
+        failed = True
+    if not failed:
+        print("✓ Recolección dentro de lo esperado")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""
+Exportadores del reporte a formatos livianos (JUnit XML, CSV, JSON y HTML)
+
+Escriben desde los mismos módulos organizados que usa el PDF
+(organize_tests_by_module) pero sin pasar por ReportLab, por lo que sirven a
+los pipelines que solo necesitan números y fallos.
+"""
+import csv
+import html
+import json
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+from .request_timing import endpoint_stats
+
+# Campos de cada test en los formatos tabulares, en orden de columna
+TEST_FIELDS = [
+    'test_id', 'module', 'name', 'nodeid', 'outcome', 'duration',
+    'description', 'expected_result', 'actual_result',
+]
+
+# Caracteres que XML 1.0 no admite (ej. códigos de color ANSI en los longrepr)
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def module_summary(tests) -> Dict[str, float]:
+    """
+    Estadísticas de un grupo de tests, con el mismo criterio que el PDF
+
+    Returns:
+        Dict con total, passed, failed (incluye errores y omitidos),
+        unavailable, success_rate (porcentaje) y duration (segundos)
+    """
+    passed = sum(1 for test in tests if test['outcome'] == 'passed')
+    unavailable = sum(1 for test in tests if test['outcome'] == 'unavailable')
+    return {
+        'total': len(tests),
+        'passed': passed,
+        'failed': len(tests) - passed - unavailable,
+        'unavailable': unavailable,
+        'success_rate': round((passed / len(tests)) * 100, 1) if tests else 0,
+        'duration': round(sum(test['duration'] for test in tests), 3),
+    }
+
+
+def export_junit(modules, filename):
+    """Escribe un JUnit XML con un testsuite por módulo"""
+    root = ET.Element('testsuites', name='NutriPAE')
+    totals = {'tests': 0, 'failures': 0, 'errors': 0, 'skipped': 0, 'time': 0.0}
+
+    for module_name, tests in modules.items():
+        suite = ET.SubElement(root, 'testsuite', name=module_name)
+        counts = {'tests': len(tests), 'failures': 0, 'errors': 0, 'skipped': 0, 'time': 0.0}
+
+        for test in tests:
+            module_path, _, _ = test['nodeid'].partition('::')
+            case = ET.SubElement(suite, 'testcase', {
+                'classname': module_path.removesuffix('.py').replace('/', '.'),
+                'name': test['name'],
+                'time': f"{test['duration']:.3f}",
+                'id': test['test_id'],
+            })
+            counts['time'] += test['duration']
+            outcome = test['outcome']
+            if outcome == 'failed':
+                counts['failures'] += 1
+                ET.SubElement(case, 'failure', message=_xml_text(test['actual_result']))
+            elif outcome == 'error':
+                counts['errors'] += 1
+                ET.SubElement(case, 'error', message=_xml_text(test['actual_result']))
+            elif outcome in ('skipped', 'unavailable'):
+                counts['skipped'] += 1
+                ET.SubElement(case, 'skipped', message=_xml_text(test['actual_result']))
+
+        for key, value in counts.items():
+            suite.set(key, f"{value:.3f}" if key == 'time' else str(value))
+            totals[key] += value
+
+    for key, value in totals.items():
+        root.set(key, f"{value:.3f}" if key == 'time' else str(value))
+
+    ET.ElementTree(root).write(filename, encoding='utf-8', xml_declaration=True)
+
+
+def _xml_text(text: str) -> str:
+    return _INVALID_XML_CHARS.sub('', text)
+
+
+def export_csv(modules, filename):
+    """Escribe un CSV con una fila por test"""
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(TEST_FIELDS)
+        for tests in modules.values():
+            for test in tests:
+                writer.writerow([test[field] for field in TEST_FIELDS])
+
+
+def export_json(modules, filename):
+    """Escribe un JSON compacto con el resumen general, la latencia por endpoint, por módulo y los tests"""
+    all_tests = [test for tests in modules.values() for test in tests]
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'summary': module_summary(all_tests),
+        'endpoints': endpoint_stats(modules),
+        'modules': {
+            module_name: {
+                'summary': module_summary(tests),
+                'tests': [{field: test[field] for field in TEST_FIELDS if field != 'module'} for test in tests],
+            }
+            for module_name, tests in modules.items()
+        },
+    }
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, separators=(',', ':'))
+
+
+# Página HTML autocontenida; las tablas se ordenan en el navegador al hacer clic en un encabezado
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<title>Reporte de Tests - NutriPAE</title>
+<style>
+body {{ font-family: Helvetica, Arial, sans-serif; margin: 2em; color: #222; }}
+h1 {{ color: darkblue; }}
+h2 {{ color: darkgreen; }}
+table {{ border-collapse: collapse; width: 100%; margin-bottom: 2em; font-size: 0.9em; }}
+th, td {{ border: 1px solid #999; padding: 4px 6px; text-align: left; vertical-align: top; }}
+th {{ background: darkblue; color: whitesmoke; cursor: pointer; user-select: none; }}
+th[data-order="asc"]::after {{ content: " ▲"; }}
+th[data-order="desc"]::after {{ content: " ▼"; }}
+tbody tr:nth-child(even) {{ background: #eee; }}
+.passed {{ color: green; }}
+.unavailable {{ color: orange; }}
+.failed, .error, .skipped {{ color: red; }}
+</style>
+</head>
+<body>
+<h1>Reporte de Tests - NutriPAE</h1>
+<p><b>Fecha:</b> {date} &middot; <b>Tests:</b> {total} &middot; <b>Pasaron:</b> {passed}
+&middot; <b>Fallaron:</b> {failed} &middot; <b>No Disponibles:</b> {unavailable}
+&middot; <b>Porcentaje de Éxito:</b> {success_rate}%</p>
+<h2>Resumen por Módulo</h2>
+<table class="sortable">
+<thead><tr><th>Módulo</th><th>Tests Totales</th><th>Pasaron</th><th>Fallaron</th><th>No Disponibles</th><th>Porcentaje Éxito</th><th>Duración(s)</th></tr></thead>
+<tbody>
+{summary_rows}
+</tbody>
+</table>
+<h2>Detalle de Tests</h2>
+<table class="sortable">
+<thead><tr><th>ID</th><th>Módulo</th><th>Test</th><th>Descripción</th><th>Resultado Esperado</th><th>Resultado Obtenido</th><th>Estado</th><th>Duración(s)</th></tr></thead>
+<tbody>
+{test_rows}
+</tbody>
+</table>
+<script>
+document.querySelectorAll("table.sortable").forEach(function (table) {{
+  table.querySelectorAll("th").forEach(function (th, column) {{
+    th.addEventListener("click", function () {{
+      var order = th.dataset.order === "asc" ? "desc" : "asc";
+      table.querySelectorAll("th").forEach(function (other) {{ delete other.dataset.order; }});
+      th.dataset.order = order;
+      var body = table.tBodies[0];
+      var rows = Array.prototype.slice.call(body.rows);
+      rows.sort(function (a, b) {{
+        var x = a.cells[column].textContent, y = b.cells[column].textContent;
+        var nx = parseFloat(x), ny = parseFloat(y);
+        var cmp = (!isNaN(nx) && !isNaN(ny)) ? nx - ny : x.localeCompare(y, "es");
+        return order === "asc" ? cmp : -cmp;
+      }});
+      rows.forEach(function (row) {{ body.appendChild(row); }});
+    }});
+  }});
+}});
+</script>
+</body>
+</html>
+"""
+
+
+def export_html(modules, filename):
+    """Escribe un HTML autocontenido con tablas ordenables en el navegador"""
+    all_tests = [test for tests in modules.values() for test in tests]
+    summary = module_summary(all_tests)
+
+    summary_rows = []
+    for module_name, tests in modules.items():
+        stats = module_summary(tests)
+        summary_rows.append(_html_row([
+            module_name, stats['total'], stats['passed'], stats['failed'],
+            stats['unavailable'], f"{stats['success_rate']:.1f}%", stats['duration'],
+        ]))
+
+    test_rows = [
+        _html_row(
+            [test['test_id'], test['module'], test['name'], test['description'],
+             test['expected_result'], test['actual_result'], test['outcome'], test['duration']],
+            status_column=6,
+        )
+        for test in all_tests
+    ]
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(_HTML_TEMPLATE.format(
+            date=datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
+            total=summary['total'],
+            passed=summary['passed'],
+            failed=summary['failed'],
+            unavailable=summary['unavailable'],
+            success_rate=f"{summary['success_rate']:.1f}",
+            summary_rows="\n".join(summary_rows),
+            test_rows="\n".join(test_rows),
+        ))
+
+
+def _html_row(values, status_column=None) -> str:
+    cells = []
+    for index, value in enumerate(values):
+        text = html.escape(str(value))
+        if index == status_column:
+            cells.append(f'<td class="{text}">{text}</td>')
+        else:
+            cells.append(f"<td>{text}</td>")
+    return f"<tr>{''.join(cells)}</tr>"
+
+
+# Formato → (extensión del archivo, función exportadora)
+EXPORTERS: Dict[str, Tuple[str, Callable]] = {
+    'junit': ('xml', export_junit),
+    'csv': ('csv', export_csv),
+    'json': ('json', export_json),
+    'html': ('html', export_html),
+}
+
+
+def export_report(modules, formats: List[str], basename: str) -> List[str]:
+    """
+    Exporta los módulos organizados en cada formato indicado
+
+    Args:
+        modules: Dict con módulos y sus tests organizados
+        formats: Formatos de EXPORTERS a generar
+        basename: Nombre de archivo sin extensión
+
+    Returns:
+        Rutas de los archivos generados, en el orden de formats
+    """
+    filenames = []
+    for fmt in formats:
+        extension, exporter = EXPORTERS[fmt]
+        filename = f"{basename}.{extension}"
+        exporter(modules, filename)
+        print(f"📄 Reporte {fmt} generado: {filename}")
+        filenames.append(filename)
+    return filenames
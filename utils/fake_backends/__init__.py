@@ -0,0 +1,12 @@
+"""
+Backends simulados en memoria de los cinco servicios de NutriPAE
+
+Aplicaciones ASGI livianas con estado (auth, cobertura, compras, menús y rh)
+que implementan los endpoints que usan las suites de tests, para ejecutarlas
+de forma hermética y medir el costo del propio harness sin los backends
+reales. Se activan con ``-p utils.fake_backends.plugin --fake-backends
+inprocess|ports`` (ver utils/fake_backends/plugin.py).
+"""
+from .server import FakeBackends
+
+__all__ = ["FakeBackends"]
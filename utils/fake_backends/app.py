@@ -0,0 +1,313 @@
+"""
+Micro framework ASGI de los backends simulados
+
+Cada servicio simulado es un FakeApp: una tabla de rutas con handlers
+síncronos que reciben un Request y retornan el body de la respuesta (status
+200) o una tupla (status, body). Los errores se lanzan como HTTPError y se
+responden como FastAPI, con ``{"detail": ...}`` (los 422 con la lista de
+errores de validación).
+
+Los tokens son JWT HS256 firmados con una clave fija compartida por todos los
+servicios simulados, con claim ``exp``: cualquier servicio los valida sin
+consultar al de autenticación, igual que los backends reales.
+"""
+import base64
+import hashlib
+import hmac
+import itertools
+import json
+import re
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from bson import ObjectId
+
+TOKEN_SECRET = b"nutripae-fake-backends"
+TOKEN_TTL = 60 * 60
+
+Handler = Callable[..., Any]
+
+
+class HTTPError(Exception):
+    """Error que el handler responde con su status y ``{"detail": detail}``"""
+
+    def __init__(self, status: int, detail: Any):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+def validation_error(*fields: str, msg: str = "Field required", error_type: str = "missing",
+                     location: str = "body") -> HTTPError:
+    """Error 422 con un elemento por campo, en el formato de FastAPI"""
+    return HTTPError(422, [
+        {"type": error_type, "loc": [location, field], "msg": msg} for field in fields
+    ])
+
+
+def require(data: dict, *fields: str):
+    """Lanza un 422 con los campos que faltan (o son null) en el body"""
+    missing = [field for field in fields if data.get(field) is None]
+    if missing:
+        raise validation_error(*missing)
+
+
+def parse_object_id(value: str, field: str = "id", location: str = "path") -> str:
+    """Valida un ObjectId de MongoDB (422 si el formato no es válido)"""
+    if not ObjectId.is_valid(value):
+        raise validation_error(field, msg="Invalid ObjectId", error_type="value_error", location=location)
+    return value
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _sign(signing_input: str) -> str:
+    return _b64(hmac.new(TOKEN_SECRET, signing_input.encode(), hashlib.sha256).digest())
+
+
+def issue_token(claims: dict, ttl: float = TOKEN_TTL) -> str:
+    """Emite un JWT HS256 con los claims y un exp dentro de ``ttl`` segundos"""
+    header = _b64(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+    payload = _b64(json.dumps({**claims, "exp": int(time.time() + ttl)}).encode())
+    return f"{header}.{payload}.{_sign(f'{header}.{payload}')}"
+
+
+def decode_token(token: str) -> Optional[dict]:
+    """Retorna los claims del JWT, o None si la firma no es válida o expiró"""
+    try:
+        header, payload, signature = token.split(".")
+        if not hmac.compare_digest(signature, _sign(f"{header}.{payload}")):
+            return None
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except ValueError:
+        return None
+    return claims if claims.get("exp", 0) > time.time() else None
+
+
+def sequence() -> Callable[[], int]:
+    """Generador de IDs enteros autoincrementales (tablas SQL)"""
+    return itertools.count(1).__next__
+
+
+def object_id() -> str:
+    """ID de documento MongoDB"""
+    return str(ObjectId())
+
+
+class Table:
+    """
+    Colección en memoria de un recurso
+
+    Los registros se indexan por su ID como texto, tal como llega en la URL.
+    """
+
+    def __init__(self, new_id: Callable[[], Any], id_field: str = "id"):
+        self.new_id = new_id
+        self.id_field = id_field
+        self.rows: Dict[str, dict] = {}
+
+    def insert(self, row: dict) -> dict:
+        row = {self.id_field: self.new_id(), **row}
+        self.rows[str(row[self.id_field])] = row
+        return row
+
+    def get(self, row_id: Any) -> Optional[dict]:
+        return self.rows.get(str(row_id))
+
+    def find(self, row_id: Any, detail: str = "Not found", status: int = 404) -> dict:
+        """Retorna el registro o lanza HTTPError si no existe"""
+        row = self.get(row_id)
+        if row is None:
+            raise HTTPError(status, detail)
+        return row
+
+    def delete(self, row_id: Any) -> Optional[dict]:
+        return self.rows.pop(str(row_id), None)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(list(self.rows.values()))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+class Request:
+    """Petición recibida por un handler"""
+
+    def __init__(self, method: str, path: str, query_string: bytes, headers: Dict[str, str], body: bytes):
+        self.method = method
+        self.path = path
+        self.params = dict(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True))
+        self.headers = headers
+        self.body = body
+        self.claims: Optional[dict] = None
+
+    def json(self) -> dict:
+        """Body JSON como dict (vacío si no hay body); 422 si no es un objeto JSON"""
+        if not self.body:
+            return {}
+        try:
+            data = json.loads(self.body)
+        except ValueError:
+            raise HTTPError(422, [{"type": "json_invalid", "loc": ["body"], "msg": "JSON decode error"}])
+        if not isinstance(data, dict):
+            raise HTTPError(422, [{"type": "model_attributes_type", "loc": ["body"], "msg": "Input should be an object"}])
+        return data
+
+    def int_param(self, name: str, default: Optional[int] = None,
+                  ge: Optional[int] = None, le: Optional[int] = None) -> Optional[int]:
+        """Parámetro entero del query string, con los límites de validación de FastAPI"""
+        value = self.params.get(name)
+        if value is None:
+            return default
+        try:
+            number = int(value)
+        except ValueError:
+            raise validation_error(name, msg="Input should be a valid integer", error_type="int_parsing", location="query")
+        if (ge is not None and number < ge) or (le is not None and number > le):
+            raise validation_error(name, msg="Input out of range", error_type="range", location="query")
+        return number
+
+    def float_param(self, name: str, default: Optional[float] = None, ge: Optional[float] = None) -> Optional[float]:
+        value = self.params.get(name)
+        if value is None:
+            return default
+        try:
+            number = float(value)
+        except ValueError:
+            raise validation_error(name, msg="Input should be a valid number", error_type="float_parsing", location="query")
+        if ge is not None and number < ge:
+            raise validation_error(name, msg=f"Input should be greater than or equal to {ge}",
+                                   error_type="greater_than_equal", location="query")
+        return number
+
+    def bool_param(self, name: str) -> Optional[bool]:
+        value = self.params.get(name)
+        if value is None:
+            return None
+        return value.lower() in ("true", "1", "yes", "on")
+
+
+def add_health_routes(app: "FakeApp", service: str):
+    """Bienvenida y health checks de los servicios de compras y menús (sin autenticación)"""
+    app.get("/", auth=False)(lambda request: {"message": f"Welcome to the {service}"})
+    app.get("/health", auth=False)(lambda request: {"status": "healthy", "service": service})
+    app.get("/health/database", auth=False)(lambda request: {"status": "healthy", "database": "connected"})
+
+
+class FakeApp:
+    """
+    Aplicación ASGI con una tabla de rutas
+
+    Las rutas usan la sintaxis de FastAPI (``/roles/{role_id}``) y se comparan
+    sin considerar la barra final. ``prefix`` es la ruta base de la URL del
+    servicio en la configuración (ej. /api/v1): las peticiones fuera de ella
+    responden 404.
+    """
+
+    def __init__(self, name: str, prefix: str = ""):
+        self.name = name
+        self.prefix = prefix.rstrip("/")
+        self._routes: List[Tuple[str, re.Pattern, Handler, bool]] = []
+
+    def route(self, method: str, pattern: str, auth: bool = True):
+        """Registra un handler; con auth=True exige un token válido (403 sin token, 401 inválido)"""
+        regex = re.compile("^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", pattern.rstrip("/")) + "/?$")
+
+        def decorator(handler: Handler) -> Handler:
+            self._routes.append((method, regex, handler, auth))
+            return handler
+        return decorator
+
+    def get(self, pattern: str, **kwargs):
+        return self.route("GET", pattern, **kwargs)
+
+    def head(self, pattern: str, **kwargs):
+        return self.route("HEAD", pattern, **kwargs)
+
+    def post(self, pattern: str, **kwargs):
+        return self.route("POST", pattern, **kwargs)
+
+    def put(self, pattern: str, **kwargs):
+        return self.route("PUT", pattern, **kwargs)
+
+    def patch(self, pattern: str, **kwargs):
+        return self.route("PATCH", pattern, **kwargs)
+
+    def delete(self, pattern: str, **kwargs):
+        return self.route("DELETE", pattern, **kwargs)
+
+    def dispatch(self, method: str, path: str, query_string: bytes, headers: Dict[str, str],
+                 body: bytes) -> Tuple[int, Any]:
+        """Ejecuta el handler de la ruta y retorna (status, body JSON o None)"""
+        if self.prefix:
+            if path != self.prefix and not path.startswith(self.prefix + "/"):
+                return 404, {"detail": "Not Found"}
+            path = path[len(self.prefix):]
+
+        method_not_allowed = False
+        for route_method, regex, handler, auth in self._routes:
+            match = regex.match(path)
+            if match is None:
+                continue
+            if route_method != method:
+                method_not_allowed = True
+                continue
+            request = Request(method, path, query_string, headers, body)
+            try:
+                if auth:
+                    request.claims = self._authenticate(headers)
+                result = handler(request, **match.groupdict())
+            except HTTPError as e:
+                return e.status, {"detail": e.detail}
+            return result if isinstance(result, tuple) else (200, result)
+
+        if method_not_allowed:
+            return 405, {"detail": "Method Not Allowed"}
+        return 404, {"detail": "Not Found"}
+
+    @staticmethod
+    def _authenticate(headers: Dict[str, str]) -> dict:
+        authorization = headers.get("authorization", "")
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            raise HTTPError(403, "Not authenticated")
+        claims = decode_token(token)
+        if claims is None:
+            raise HTTPError(401, "Could not validate credentials")
+        return claims
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        headers = {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in scope["headers"]}
+
+        status, payload = self.dispatch(scope["method"], scope["path"], scope.get("query_string", b""), headers, body)
+        content = b"" if payload is None or scope["method"] == "HEAD" else json.dumps(payload).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(content)).encode())],
+        })
+        await send({"type": "http.response.body", "body": content})
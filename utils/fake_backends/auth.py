@@ -0,0 +1,278 @@
+"""
+Backend de autenticación simulado (login, usuarios, roles, permisos e invitaciones)
+
+Parte con dos roles: admin (ID 1, todos los permisos) y basic_user (ID 2, solo
+lectura), y con un usuario por cada cuenta de la configuración.
+"""
+import secrets
+from typing import Iterable, Tuple
+
+from .app import FakeApp, HTTPError, Table, issue_token, now_iso, require, sequence
+
+PERMISSIONS = [
+    "user:list", "user:read", "user:create", "user:update", "user:delete",
+    "role:list", "role:read", "role:create", "role:update", "role:delete",
+    "permission:list", "permission:read",
+    "invitation:list", "invitation:create", "invitation:cancel",
+]
+BASIC_PERMISSIONS = ["user:list", "user:read", "role:list", "role:read", "permission:list", "permission:read"]
+
+USER_STATUSES = ["active", "inactive", "suspended"]
+INVITATION_STATUSES = ["pending", "accepted", "expired", "cancelled"]
+API_VERSIONS = ["v1"]
+HTTP_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+
+ADMIN_ROLE_ID, BASIC_ROLE_ID = 1, 2
+USER_ACTIVE, USER_INACTIVE = 1, 2
+INVITATION_PENDING, INVITATION_CANCELLED = 1, 4
+
+
+def _parametric(names) -> list:
+    return [{"id": index, "name": name} for index, name in enumerate(names, start=1)]
+
+
+def create_app(prefix: str = "/api/v1", accounts: Iterable[Tuple[str, str, int]] = ()) -> FakeApp:
+    """
+    Crea el servicio con su estado inicial
+
+    Args:
+        prefix: Ruta base del servicio
+        accounts: Cuentas iniciales (email, contraseña, ID del rol)
+    """
+    app = FakeApp("auth", prefix)
+    permissions = Table(sequence())
+    for name in PERMISSIONS:
+        permissions.insert({"name": name, "description": name.replace(":", " ")})
+    permission_ids = {permission["name"]: permission["id"] for permission in permissions}
+
+    roles = Table(sequence())
+    roles.insert({"name": "admin", "description": "Administrador", "permission_ids": list(permission_ids.values())})
+    roles.insert({"name": "basic_user", "description": "Usuario básico",
+                  "permission_ids": [permission_ids[name] for name in BASIC_PERMISSIONS]})
+
+    users = Table(sequence())
+    passwords = {}
+    invitations = Table(sequence())
+
+    def add_user(data: dict, password: str) -> dict:
+        user = users.insert({
+            "email": data["email"],
+            "full_name": data.get("full_name", ""),
+            "username": data.get("username") or data["email"].split("@")[0],
+            "phone_number": data.get("phone_number"),
+            "status_id": USER_ACTIVE,
+            "role_ids": list(data.get("role_ids") or [BASIC_ROLE_ID]),
+            "created_at": now_iso(),
+        })
+        passwords[user["id"]] = password
+        return user
+
+    for email, password, role_id in accounts:
+        if not any(user["email"] == email for user in users):
+            add_user({"email": email, "full_name": email.split("@")[0], "role_ids": [role_id]}, password)
+
+    def current_user(request) -> dict:
+        user = users.get(request.claims.get("sub"))
+        if user is None:
+            raise HTTPError(401, "Could not validate credentials")
+        return user
+
+    def user_permissions(user: dict) -> list:
+        ids = {pid for role_id in user["role_ids"] if roles.get(role_id) for pid in roles.get(role_id)["permission_ids"]}
+        return sorted(permission["name"] for permission in permissions if permission["id"] in ids)
+
+    def require_permission(request, name: str):
+        if name not in user_permissions(current_user(request)):
+            raise HTTPError(403, "Not enough permissions")
+
+    # --- Autenticación ---
+
+    @app.post("/auth/login", auth=False)
+    def login(request):
+        data = request.json()
+        require(data, "email", "password")
+        user = next((user for user in users if user["email"] == data["email"]), None)
+        if user is None or passwords[user["id"]] != data["password"] or user["status_id"] != USER_ACTIVE:
+            raise HTTPError(401, "Incorrect email or password")
+        return {"access_token": issue_token({"sub": str(user["id"]), "email": user["email"]}), "token_type": "bearer"}
+
+    @app.post("/auth/register", auth=False)
+    def register(request):
+        data = request.json()
+        require(data, "email", "password")
+        if any(user["email"] == data["email"] for user in users):
+            raise HTTPError(400, "Email already registered")
+        return 201, add_user(data, data["password"])
+
+    @app.get("/auth/me")
+    def me(request):
+        return current_user(request)
+
+    @app.post("/auth/change-password")
+    def change_password(request):
+        data = request.json()
+        require(data, "old_password", "new_password")
+        user = current_user(request)
+        if passwords[user["id"]] != data["old_password"]:
+            raise HTTPError(400, "Incorrect old password")
+        passwords[user["id"]] = data["new_password"]
+        return {"message": "Password changed successfully"}
+
+    @app.post("/auth/forgot-password", auth=False)
+    def forgot_password(request):
+        if "email" not in request.params:
+            raise HTTPError(422, [{"type": "missing", "loc": ["query", "email"], "msg": "Field required"}])
+        return {"message": "If the email exists, you will receive password reset instructions"}
+
+    # --- Autorización ---
+
+    @app.post("/authorization/check-authorization")
+    def check_authorization(request):
+        data = request.json()
+        require(data, "endpoint", "method")
+        granted = user_permissions(current_user(request))
+        missing = [name for name in data.get("required_permissions", []) if name not in granted]
+        return {"authorized": not missing, "missing_permissions": missing}
+
+    @app.get("/authorization/user-permissions")
+    def get_user_permissions(request):
+        return {"permissions": user_permissions(current_user(request))}
+
+    # --- Usuarios ---
+
+    @app.post("/users/")
+    def create_user(request):
+        require_permission(request, "user:create")
+        data = request.json()
+        require(data, "email", "password")
+        if any(user["email"] == data["email"] for user in users):
+            raise HTTPError(400, "Email already registered")
+        return 201, add_user(data, data["password"])
+
+    @app.get("/users/")
+    def list_users(request):
+        return list(users)
+
+    @app.get("/users/{user_id}")
+    def get_user(request, user_id):
+        return users.find(user_id, "User not found")
+
+    @app.put("/users/{user_id}")
+    def update_user(request, user_id):
+        require_permission(request, "user:update")
+        user = users.find(user_id, "User not found")
+        data = request.json()
+        if "password" in data:
+            passwords[user["id"]] = data.pop("password")
+        user.update({key: value for key, value in data.items() if key != "id"})
+        return user
+
+    @app.delete("/users/{user_id}")
+    def delete_user(request, user_id):
+        require_permission(request, "user:delete")
+        user = users.find(user_id, "User not found")
+        # Borrado lógico: el usuario queda inactivo
+        user["status_id"] = USER_INACTIVE
+        return {"message": "User deleted successfully"}
+
+    # --- Roles ---
+
+    @app.post("/roles/")
+    def create_role(request):
+        require_permission(request, "role:create")
+        data = request.json()
+        require(data, "name")
+        if any(role["name"] == data["name"] for role in roles):
+            raise HTTPError(400, "Role already exists")
+        return 201, roles.insert({
+            "name": data["name"],
+            "description": data.get("description"),
+            "permission_ids": list(data.get("permission_ids") or []),
+        })
+
+    @app.get("/roles/")
+    def list_roles(request):
+        return list(roles)
+
+    @app.get("/roles/{role_id}/users")
+    def list_role_users(request, role_id):
+        role = roles.find(role_id, "Role not found")
+        return [user for user in users if role["id"] in user["role_ids"]]
+
+    @app.get("/roles/{role_id}")
+    def get_role(request, role_id):
+        return roles.find(role_id, "Role not found")
+
+    @app.put("/roles/{role_id}")
+    def update_role(request, role_id):
+        require_permission(request, "role:update")
+        role = roles.find(role_id, "Role not found")
+        role.update({key: value for key, value in request.json().items() if key != "id"})
+        return role
+
+    @app.delete("/roles/{role_id}")
+    def delete_role(request, role_id):
+        require_permission(request, "role:delete")
+        roles.find(role_id, "Role not found")
+        roles.delete(role_id)
+        return {"message": "Role deleted successfully"}
+
+    # --- Permisos ---
+
+    @app.get("/permissions/")
+    def list_permissions(request):
+        return list(permissions)
+
+    @app.get("/permissions/by-name/{name}")
+    def get_permission_by_name(request, name):
+        permission = next((permission for permission in permissions if permission["name"] == name), None)
+        if permission is None:
+            raise HTTPError(404, "Permission not found")
+        return permission
+
+    @app.get("/permissions/{permission_id}")
+    def get_permission(request, permission_id):
+        return permissions.find(permission_id, "Permission not found")
+
+    # --- Invitaciones ---
+
+    @app.post("/invitations/")
+    def create_invitation(request):
+        data = request.json()
+        require(data, "email")
+        return 201, invitations.insert({
+            "email": data["email"],
+            "code": secrets.token_urlsafe(16),
+            "role_ids": list(data.get("role_ids") or []),
+            "status_id": INVITATION_PENDING,
+            "created_at": now_iso(),
+        })
+
+    @app.get("/invitations/")
+    def list_invitations(request):
+        return list(invitations)
+
+    @app.get("/invitations/validate/{code}", auth=False)
+    def validate_invitation(request, code):
+        invitation = next((invitation for invitation in invitations if invitation["code"] == code), None)
+        if invitation is None or invitation["status_id"] != INVITATION_PENDING:
+            return {"valid": False}
+        return {"valid": True, "invitation": invitation}
+
+    @app.put("/invitations/{invitation_id}/cancel")
+    def cancel_invitation(request, invitation_id):
+        invitation = invitations.find(invitation_id, "Invitation not found")
+        invitation["status_id"] = INVITATION_CANCELLED
+        return invitation
+
+    # --- Paramétricas ---
+
+    for path, names in (
+        ("/parametric/user-statuses/", USER_STATUSES),
+        ("/parametric/invitation-statuses/", INVITATION_STATUSES),
+        ("/parametric/api-versions/", API_VERSIONS),
+        ("/parametric/http-methods/", HTTP_METHODS),
+    ):
+        app.get(path)(lambda request, items=_parametric(names): items)
+
+    return app
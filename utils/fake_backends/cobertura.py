@@ -0,0 +1,123 @@
+"""
+Backend de cobertura simulado (división territorial, sedes, beneficiarios y coberturas)
+
+Como el backend real, crear un recurso responde 200 y actualizar o eliminar un
+ID inexistente responde 400. Beneficiarios y coberturas usan UUID; el resto,
+IDs enteros.
+"""
+import os
+import uuid
+
+from .app import FakeApp, HTTPError, Table, now_iso, require, sequence
+
+DOCUMENT_TYPES = ["Registro Civil", "Tarjeta de Identidad", "Cédula de Ciudadanía", "Cédula de Extranjería"]
+GENDERS = ["Masculino", "Femenino", "Otro"]
+GRADES = ["Transición", "Primero", "Segundo", "Tercero", "Cuarto", "Quinto"]
+BENEFIT_TYPES = ["Almuerzo", "Complemento AM", "Complemento PM"]
+ETNIC_GROUPS = ["Ninguno", "Indígena", "Afrocolombiano", "Raizal", "Rrom"]
+
+
+def _new_uuid() -> str:
+    # No usa uuid.uuid4: al grabar cassettes está sembrado para las entradas
+    # de los tests y los IDs del servidor no deben consumir esa secuencia
+    return str(uuid.UUID(bytes=os.urandom(16), version=4))
+
+
+def _crud(app: FakeApp, path: str, table: Table, required, label: str, defaults=None):
+    """Rutas CRUD de un recurso con la semántica de errores del backend de cobertura"""
+
+    @app.post(f"{path}/")
+    def create(request):
+        data = request.json()
+        require(data, *required)
+        return table.insert({**(defaults or {}), **data, "created_at": now_iso()})
+
+    @app.get(f"{path}/")
+    def list_all(request):
+        return list(table)
+
+    @app.get(f"{path}/{{item_id}}")
+    def get(request, item_id):
+        return table.find(item_id, f"{label} not found")
+
+    def update(request, item_id):
+        row = table.find(item_id, f"{label} not found", status=400)
+        row.update({key: value for key, value in request.json().items() if key != "id"})
+        return row
+
+    app.put(f"{path}/{{item_id}}")(update)
+    app.patch(f"{path}/{{item_id}}")(update)
+
+    @app.delete(f"{path}/{{item_id}}")
+    def delete(request, item_id):
+        table.find(item_id, f"{label} not found", status=400)
+        table.delete(item_id)
+        return {"message": f"{label} deleted successfully"}
+
+
+def create_app(prefix: str = "/api/v1") -> FakeApp:
+    app = FakeApp("cobertura", prefix)
+    departments = Table(sequence())
+    towns = Table(sequence())
+    institutions = Table(sequence())
+    campuses = Table(sequence())
+    beneficiaries = Table(_new_uuid)
+    coverages = Table(_new_uuid)
+
+    parametrics = {
+        "document-types": DOCUMENT_TYPES,
+        "genders": GENDERS,
+        "grades": GRADES,
+        "benefit-types": BENEFIT_TYPES,
+        "etnic-groups": ETNIC_GROUPS,
+    }
+    parametric_tables = {}
+    for name, values in parametrics.items():
+        parametric_tables[name] = Table(sequence())
+        for value in values:
+            parametric_tables[name].insert({"name": value})
+
+    # Las rutas por código DANE van antes que las de ID para que no las capture {item_id}
+    @app.get("/towns/dane/{dane_code}")
+    def get_town_by_dane(request, dane_code):
+        return _by_dane(towns, dane_code, "Town")
+
+    @app.get("/institutions/dane/{dane_code}")
+    def get_institution_by_dane(request, dane_code):
+        return _by_dane(institutions, dane_code, "Institution")
+
+    @app.get("/campuses/{campus_id}/coverage")
+    def get_campus_coverage(request, campus_id):
+        campus = campuses.find(campus_id, "Campus not found")
+        return [coverage for coverage in coverages if coverage["campus_id"] == campus["id"]]
+
+    _crud(app, "/departments", departments, ("name", "dane_code"), "Department")
+    _crud(app, "/towns", towns, ("name", "dane_code", "department_id"), "Town")
+    _crud(app, "/institutions", institutions, ("name", "dane_code", "town_id"), "Institution")
+    _crud(app, "/campuses", campuses,
+          ("name", "dane_code", "institution_id", "address", "latitude", "longitude"), "Campus")
+    _crud(app, "/beneficiaries", beneficiaries,
+          ("document_type_id", "number_document", "first_name", "first_surname",
+           "birth_date", "gender_id", "grade_id"), "Beneficiary")
+
+    _crud(app, "/coverages", coverages, ("beneficiary_id", "campus_id", "benefit_type_id"), "Coverage",
+          defaults={"active": True})
+
+    for name, table in parametric_tables.items():
+        app.get(f"/parametrics/{name}")(lambda request, table=table: list(table))
+
+    for name in ("grades", "benefit-types"):
+        @app.post(f"/parametrics/{name}")
+        def create_parametric(request, table=parametric_tables[name]):
+            data = request.json()
+            require(data, "name")
+            return table.insert(data)
+
+    return app
+
+
+def _by_dane(table: Table, dane_code: str, label: str) -> dict:
+    row = next((row for row in table if str(row["dane_code"]) == dane_code), None)
+    if row is None:
+        raise HTTPError(404, f"{label} not found")
+    return row
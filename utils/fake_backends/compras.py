@@ -0,0 +1,445 @@
+"""
+Backend de compras simulado (proveedores, productos, órdenes de compra e inventario)
+
+Los documentos usan ``_id`` con ObjectId como MongoDB; un ID con formato
+inválido responde 422. El inventario se maneja por lotes: las recepciones
+crean lotes, los consumos los descuentan en orden FIFO (fecha de ingreso) y
+cada operación deja un movimiento para el historial.
+"""
+import re
+from datetime import date
+from typing import List, Optional
+
+from .app import (
+    FakeApp, HTTPError, Table, add_health_routes, now_iso, object_id, parse_object_id,
+    require, validation_error,
+)
+
+API = "/api/v1"
+_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+PROVIDER_FIELDS = ("name", "nit", "address", "responsible_name", "email", "phone_number")
+RECEIPT_FIELDS = ("product_id", "institution_id", "storage_location", "quantity_received",
+                  "unit_of_measure", "expiration_date", "batch_number", "received_by")
+CONSUMPTION_FIELDS = ("product_id", "institution_id", "storage_location", "quantity", "unit",
+                      "consumption_date", "reason", "consumed_by")
+ADJUSTMENT_FIELDS = ("product_id", "inventory_id", "quantity", "unit", "reason", "adjusted_by")
+
+
+def _page(items: list, skip: int, limit: int) -> dict:
+    return {
+        "current_page": skip // limit + 1,
+        "page_size": limit,
+        "has_next": skip + limit < len(items),
+        "has_previous": skip > 0,
+    }
+
+
+def _validate_provider(data: dict, partial: bool = False):
+    if not partial:
+        require(data, *PROVIDER_FIELDS)
+    if "name" in data and not str(data["name"]).strip():
+        raise validation_error("name", msg="String should have at least 1 character", error_type="string_too_short")
+    if "email" in data and not _EMAIL.match(str(data["email"])):
+        raise validation_error("email", msg="value is not a valid email address", error_type="value_error")
+
+
+def _institution_id(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise validation_error("institution_id", msg="Input should be a valid integer", error_type="int_parsing",
+                               location="path")
+
+
+def _positive(data: dict, field: str):
+    if not isinstance(data[field], (int, float)) or data[field] <= 0:
+        raise validation_error(field, msg="Input should be greater than 0", error_type="greater_than")
+
+
+def create_app(prefix: str = "") -> FakeApp:
+    app = FakeApp("compras", prefix)
+    add_health_routes(app, "PAE Compras API")
+    providers = Table(object_id, "_id")
+    products = Table(object_id, "_id")
+    purchase_orders = Table(object_id, "_id")
+    receipts = Table(object_id, "_id")
+    inventory = Table(object_id, "_id")
+    movements = Table(object_id, "_id")
+
+    def active_provider(provider_id: str) -> dict:
+        provider = providers.get(parse_object_id(provider_id))
+        if provider is None or provider["deleted_at"] is not None:
+            raise HTTPError(404, "Provider not found")
+        return provider
+
+    def existing_product(product_id: str, field: str = "product_id") -> dict:
+        product = products.get(parse_object_id(product_id, field, "body"))
+        if product is None or product["deleted_at"] is not None:
+            raise HTTPError(404, "Product not found")
+        return product
+
+    def batches(product_id: str, institution_id: int, storage_location: Optional[str] = None,
+                lot: Optional[str] = None) -> List[dict]:
+        """Lotes con stock del producto en la institución, en orden FIFO"""
+        found = [batch for batch in inventory
+                 if batch["product_id"] == product_id and batch["institution_id"] == institution_id
+                 and batch["quantity"] > 0
+                 and storage_location in (None, batch["storage_location"]) and lot in (None, batch["lot"])]
+        return sorted(found, key=lambda batch: batch["date_of_admission"])
+
+    def add_movement(movement_type: str, batch: dict, quantity: float, movement_date: str, **fields) -> dict:
+        return movements.insert({
+            "movement_type": movement_type,
+            "product_id": batch["product_id"],
+            "institution_id": batch["institution_id"],
+            "storage_location": batch["storage_location"],
+            "inventory_id": batch["_id"],
+            "lot": batch["lot"],
+            "quantity": quantity,
+            "unit": batch["unit"],
+            "movement_date": movement_date,
+            "notes": fields.pop("notes", None),
+            **fields,
+            "created_at": now_iso(),
+        })
+
+    def receive(data: dict) -> dict:
+        """Crea el lote de una recepción y su movimiento; retorna la transacción"""
+        product = existing_product(data["product_id"])
+        if any(batch["product_id"] == product["_id"] and batch["lot"] == data["batch_number"] for batch in inventory):
+            raise HTTPError(409, f"Batch number {data['batch_number']} already exists for this product")
+        received_at = data.get("reception_date") or now_iso()
+        batch = inventory.insert({
+            "product_id": product["_id"],
+            "product_name": product["name"],
+            "institution_id": data["institution_id"],
+            "storage_location": data["storage_location"],
+            "quantity": data["quantity_received"],
+            "initial_quantity": data["quantity_received"],
+            "unit": data["unit_of_measure"],
+            "lot": data["batch_number"],
+            "expiration_date": data["expiration_date"],
+            "date_of_admission": received_at,
+            "minimum_threshold": 0.0,
+            "created_at": now_iso(),
+        })
+        movement = add_movement("receipt", batch, data["quantity_received"], received_at,
+                                received_by=data["received_by"], notes=data.get("notes"),
+                                purchase_order_id=data.get("purchase_order_id"))
+        return {
+            "transaction_id": object_id(),
+            "product_id": product["_id"],
+            "institution_id": batch["institution_id"],
+            "storage_location": batch["storage_location"],
+            "quantity_received": batch["initial_quantity"],
+            "unit_of_measure": batch["unit"],
+            "batch_number": batch["lot"],
+            "expiration_date": batch["expiration_date"],
+            "inventory_id": batch["_id"],
+            "movement_id": movement["_id"],
+            "created_at": movement["created_at"],
+        }
+
+    # --- Proveedores ---
+
+    @app.post(f"{API}/providers/")
+    def create_provider(request):
+        data = request.json()
+        _validate_provider(data)
+        if any(provider["nit"] == data["nit"] and provider["deleted_at"] is None for provider in providers):
+            raise HTTPError(409, f"Provider with NIT '{data['nit']}' already exists")
+        now = now_iso()
+        return 201, providers.insert({
+            "is_local_provider": False, **data, "created_at": now, "updated_at": now, "deleted_at": None,
+        })
+
+    @app.get(f"{API}/providers/")
+    def list_providers(request):
+        skip = request.int_param("skip", 0, ge=0)
+        limit = request.int_param("limit", 100, ge=1, le=1000)
+        is_local = request.bool_param("is_local_provider")
+        items = [provider for provider in providers if provider["deleted_at"] is None
+                 and is_local in (None, provider["is_local_provider"])]
+        return {"providers": items[skip:skip + limit], "total_count": len(items), "page_info": _page(items, skip, limit)}
+
+    @app.get(f"{API}/providers/{{provider_id}}")
+    def get_provider(request, provider_id):
+        return active_provider(provider_id)
+
+    @app.put(f"{API}/providers/{{provider_id}}")
+    def update_provider(request, provider_id):
+        provider = active_provider(provider_id)
+        data = request.json()
+        _validate_provider(data, partial=True)
+        provider.update({key: value for key, value in data.items() if key != "_id"}, updated_at=now_iso())
+        return provider
+
+    @app.delete(f"{API}/providers/{{provider_id}}")
+    def delete_provider(request, provider_id):
+        active_provider(provider_id)["deleted_at"] = now_iso()
+        return 204, None
+
+    # --- Productos ---
+
+    @app.post(f"{API}/products/")
+    def create_product(request):
+        data = request.json()
+        require(data, "provider_id", "name", "weight", "weekly_availability", "life_time")
+        active_provider(data["provider_id"])
+        now = now_iso()
+        return 201, products.insert({**data, "created_at": now, "updated_at": now, "deleted_at": None})
+
+    @app.get(f"{API}/products/")
+    def list_products(request):
+        return [product for product in products if product["deleted_at"] is None]
+
+    @app.get(f"{API}/products/{{product_id}}")
+    def get_product(request, product_id):
+        return existing_product(product_id)
+
+    @app.delete(f"{API}/products/{{product_id}}")
+    def delete_product(request, product_id):
+        existing_product(product_id)["deleted_at"] = now_iso()
+        return 204, None
+
+    # --- Órdenes de compra y recepciones ---
+
+    @app.post(f"{API}/purchase-orders/")
+    def create_purchase_order(request):
+        data = request.json()
+        require(data, "provider_id", "items", "required_delivery_date")
+        if not data["items"]:
+            raise validation_error("items", msg="List should have at least 1 item", error_type="too_short")
+        active_provider(data["provider_id"])
+        items = []
+        for item in data["items"]:
+            require(item, "product_id", "quantity", "unit")
+            existing_product(item["product_id"])
+            items.append({**item, "quantity_received": 0.0})
+        now = now_iso()
+        return 201, purchase_orders.insert({
+            **data, "items": items, "status": "pending", "created_at": now, "updated_at": now,
+        })
+
+    @app.get(f"{API}/purchase-orders/")
+    def list_purchase_orders(request):
+        return list(purchase_orders)
+
+    @app.get(f"{API}/purchase-orders/{{order_id}}")
+    def get_purchase_order(request, order_id):
+        return purchase_orders.find(parse_object_id(order_id), "Purchase order not found")
+
+    @app.post(f"{API}/purchase-orders/{{order_id}}/cancel")
+    def cancel_purchase_order(request, order_id):
+        order = purchase_orders.find(parse_object_id(order_id), "Purchase order not found")
+        if order["status"] == "completed":
+            raise HTTPError(400, "Completed purchase orders cannot be cancelled")
+        order.update(status="cancelled", cancellation_reason=request.json().get("reason"), updated_at=now_iso())
+        return order
+
+    @app.post(f"{API}/ingredient-receipts/")
+    def create_ingredient_receipt(request):
+        data = request.json()
+        require(data, "institution_id", "receipt_date", "delivery_person_name", "items")
+        order = None
+        if data.get("purchase_order_id"):
+            order = purchase_orders.get(parse_object_id(data["purchase_order_id"], "purchase_order_id", "body"))
+            if order is None:
+                raise HTTPError(404, "Purchase order not found")
+        for item in data["items"]:
+            require(item, "product_id", "quantity", "unit", "storage_location", "lot", "expiration_date")
+            receive({
+                "product_id": item["product_id"],
+                "institution_id": data["institution_id"],
+                "storage_location": item["storage_location"],
+                "quantity_received": item["quantity"],
+                "unit_of_measure": item["unit"],
+                "expiration_date": item["expiration_date"],
+                "batch_number": item["lot"],
+                "received_by": data["delivery_person_name"],
+                "reception_date": data["receipt_date"],
+                "purchase_order_id": data.get("purchase_order_id"),
+            })
+            for ordered in order["items"] if order else ():
+                if ordered["product_id"] == item["product_id"]:
+                    ordered["quantity_received"] += item["quantity"]
+        if order is not None and all(item["quantity_received"] >= item["quantity"] for item in order["items"]):
+            order.update(status="completed", updated_at=now_iso())
+        return 201, receipts.insert({**data, "created_at": now_iso()})
+
+    # --- Inventario ---
+
+    @app.get(f"{API}/inventory")
+    def list_inventory(request):
+        institution_id = request.int_param("institution_id")
+        product_id = request.params.get("product_id")
+        provider_id = request.params.get("provider_id")
+        for name, value in (("product_id", product_id), ("provider_id", provider_id)):
+            if value is not None:
+                parse_object_id(value, name, "query")
+        limit = request.int_param("limit", 100, ge=1, le=1000)
+        offset = request.int_param("offset", 0, ge=0)
+        show_expired = request.bool_param("show_expired")
+        below_threshold = request.bool_param("show_below_threshold")
+        category = request.params.get("category")
+        today = date.today().isoformat()
+
+        items = []
+        for batch in inventory:
+            product = products.get(batch["product_id"]) or {}
+            expired = batch["expiration_date"] < today
+            below = batch["quantity"] <= batch["minimum_threshold"]
+            if (institution_id not in (None, batch["institution_id"]) or product_id not in (None, batch["product_id"])
+                    or provider_id not in (None, product.get("provider_id"))
+                    or category not in (None, product.get("category"))
+                    or (show_expired is False and expired) or (below_threshold and not below)):
+                continue
+            items.append({**batch, "is_expired": expired, "is_below_threshold": below})
+        return {
+            "inventory_items": items[offset:offset + limit],
+            "summary": {
+                "total_items": len(items),
+                "below_threshold_count": sum(item["is_below_threshold"] for item in items),
+                "expired_count": sum(item["is_expired"] for item in items),
+            },
+            "page_info": _page(items, offset, limit),
+        }
+
+    @app.put(f"{API}/inventory/{{inventory_id}}/threshold")
+    def update_threshold(request, inventory_id):
+        batch = inventory.get(parse_object_id(inventory_id))
+        threshold = request.float_param("new_threshold", ge=0)
+        if threshold is None:
+            raise validation_error("new_threshold", location="query")
+        if batch is None:
+            raise HTTPError(404, "Inventory item not found")
+        batch["minimum_threshold"] = threshold
+        return {"message": "Minimum threshold updated successfully", "inventory_id": inventory_id,
+                "new_threshold": threshold}
+
+    # --- Movimientos de inventario ---
+
+    @app.post(f"{API}/inventory-movements/receive-inventory")
+    def receive_inventory(request):
+        data = request.json()
+        require(data, *RECEIPT_FIELDS)
+        _positive(data, "quantity_received")
+        return 201, receive(data)
+
+    @app.post(f"{API}/inventory-movements/consume-inventory")
+    def consume_inventory(request):
+        data = request.json()
+        require(data, *CONSUMPTION_FIELDS)
+        _positive(data, "quantity")
+        product = existing_product(data["product_id"])
+        available = batches(product["_id"], data["institution_id"])
+        if sum(batch["quantity"] for batch in available) < data["quantity"]:
+            raise HTTPError(400, f"Insufficient stock for product {product['_id']}")
+
+        pending = data["quantity"]
+        details, movement_ids = [], []
+        for batch in available:
+            if pending <= 0:
+                break
+            consumed = min(batch["quantity"], pending)
+            batch["quantity"] -= consumed
+            pending -= consumed
+            movement = add_movement("usage", batch, -consumed, data["consumption_date"],
+                                    consumption_date=data["consumption_date"], reason=data["reason"],
+                                    consumed_by=data["consumed_by"], notes=data.get("notes"))
+            details.append({"inventory_id": batch["_id"], "lot": batch["lot"], "quantity_consumed": consumed,
+                            "remaining_quantity": batch["quantity"], "expiration_date": batch["expiration_date"]})
+            movement_ids.append(movement["_id"])
+        return 201, {
+            "transaction_id": object_id(),
+            "product_id": product["_id"],
+            "institution_id": data["institution_id"],
+            "total_quantity_consumed": data["quantity"],
+            "unit": data["unit"],
+            "batch_details": details,
+            "movement_ids": movement_ids,
+            "created_at": now_iso(),
+        }
+
+    @app.post(f"{API}/inventory-movements/manual-adjustment")
+    def manual_adjustment(request):
+        data = request.json()
+        require(data, *ADJUSTMENT_FIELDS)
+        batch = inventory.get(parse_object_id(data["inventory_id"], "inventory_id", "body"))
+        if batch is None:
+            raise HTTPError(404, "Inventory item not found")
+        previous = batch["quantity"]
+        if previous + data["quantity"] < 0:
+            raise HTTPError(400, "Adjustment would result in negative stock")
+        batch["quantity"] = previous + data["quantity"]
+        movement = add_movement("adjustment", batch, data["quantity"], now_iso(), reason=data["reason"],
+                                adjusted_by=data["adjusted_by"], notes=data.get("notes"))
+        return 201, {
+            "transaction_id": object_id(),
+            "product_id": data["product_id"],
+            "inventory_id": batch["_id"],
+            "adjustment_quantity": data["quantity"],
+            "unit": data["unit"],
+            "reason": data["reason"],
+            "movement_id": movement["_id"],
+            "previous_stock": previous,
+            "new_stock": batch["quantity"],
+            "created_at": movement["created_at"],
+        }
+
+    def product_movements(request, product_id: str, movement_type: Optional[str] = None) -> list:
+        parse_object_id(product_id, "product_id")
+        institution_id = request.int_param("institution_id")
+        movement_type = movement_type or request.params.get("movement_type")
+        limit = request.int_param("limit", 100, ge=1, le=1000)
+        offset = request.int_param("offset", 0, ge=0)
+        found = [movement for movement in movements if movement["product_id"] == product_id
+                 and institution_id in (None, movement["institution_id"])
+                 and movement_type in (None, movement["movement_type"])]
+        found.sort(key=lambda movement: (movement["movement_date"], movement["created_at"]), reverse=True)
+        return found[offset:offset + limit]
+
+    @app.get(f"{API}/inventory-movements/product/{{product_id}}")
+    def get_product_movements(request, product_id):
+        return product_movements(request, product_id)
+
+    @app.get(f"{API}/inventory-movements/consumption-history/{{product_id}}")
+    def get_consumption_history(request, product_id):
+        return product_movements(request, product_id, "usage")
+
+    @app.get(f"{API}/inventory-movements/stock/{{product_id}}/{{institution_id}}")
+    def get_current_stock(request, product_id, institution_id):
+        institution = _institution_id(institution_id)
+        storage_location = request.params.get("storage_location")
+        found = batches(parse_object_id(product_id, "product_id"), institution, storage_location,
+                        request.params.get("lot"))
+        return {
+            "product_id": product_id,
+            "institution_id": institution,
+            "current_stock": sum(batch["quantity"] for batch in found),
+            "unit": found[0]["unit"] if found else None,
+            "storage_location": storage_location,
+        }
+
+    @app.get(f"{API}/inventory-movements/stock-summary/{{product_id}}/{{institution_id}}")
+    def get_stock_summary(request, product_id, institution_id):
+        institution = _institution_id(institution_id)
+        storage_location = request.params.get("storage_location")
+        found = batches(parse_object_id(product_id, "product_id"), institution, storage_location)
+        return {
+            "product_id": product_id,
+            "institution_id": institution,
+            "total_available_stock": float(sum(batch["quantity"] for batch in found)),
+            "unit": found[0]["unit"] if found else None,
+            "storage_location": storage_location,
+            "number_of_batches": len(found),
+            "batches": [
+                {"inventory_id": batch["_id"], "lot": batch["lot"], "quantity": batch["quantity"],
+                 "storage_location": batch["storage_location"], "date_of_admission": batch["date_of_admission"],
+                 "expiration_date": batch["expiration_date"]}
+                for batch in found
+            ],
+        }
+
+    return app
@@ -0,0 +1,299 @@
+"""
+Backend de menús simulado (ingredientes, platos, ciclos de menú y programación)
+
+Implementa las validaciones de negocio que los tests esperan del backend:
+nombres únicos, platos solo con ingredientes existentes y activos, ciclos
+solo con platos existentes y fechas de programación ordenadas.
+"""
+from typing import Optional
+
+from .app import (
+    FakeApp, HTTPError, Table, add_health_routes, now_iso, object_id, parse_object_id,
+    require, validation_error,
+)
+
+API = "/api/v1"
+STATUSES = ("active", "inactive")
+UNITS = ("kg", "g", "mg", "l", "ml", "lb", "unidad")
+MEAL_SLOTS = ("breakfast_dish_ids", "lunch_dish_ids", "snack_dish_ids")
+
+
+def _check_status(data: dict):
+    if "status" in data and data["status"] not in STATUSES:
+        raise validation_error("status", msg="Input should be 'active' or 'inactive'", error_type="enum")
+
+
+def _check_name(data: dict):
+    if "name" in data and not str(data["name"]).strip():
+        raise validation_error("name", msg="String should have at least 1 character", error_type="string_too_short")
+
+
+def _name_taken(table: Table, name: str, exclude: Optional[str] = None) -> bool:
+    return any(row["name"].lower() == name.lower() and row["_id"] != exclude for row in table)
+
+
+def create_app(prefix: str = "") -> FakeApp:
+    app = FakeApp("menus", prefix)
+    add_health_routes(app, "PAE Menus API")
+    ingredients = Table(object_id, "_id")
+    dishes = Table(object_id, "_id")
+    cycles = Table(object_id, "_id")
+    schedules = Table(object_id, "_id")
+
+    def find(table: Table, item_id: str, label: str) -> dict:
+        return table.find(parse_object_id(item_id), f"{label} not found")
+
+    def dishes_using(ingredient_id: str) -> list:
+        return [dish for dish in dishes
+                if any(portion["ingredient_id"] == ingredient_id for portion in dish["recipe"]["ingredients"])]
+
+    def detailed(ingredient: dict) -> dict:
+        used_in = dishes_using(ingredient["_id"])
+        return {**ingredient, "usage_count": len(used_in),
+                "menu_usage": [{"dish_id": dish["_id"], "dish_name": dish["name"]} for dish in used_in]}
+
+    def validate_recipe(recipe) -> dict:
+        portions = (recipe or {}).get("ingredients")
+        if not isinstance(portions, list):
+            raise validation_error("recipe", msg="Field required")
+        if not portions:
+            raise HTTPError(400, "Recipe must contain at least one ingredient")
+        for portion in portions:
+            require(portion, "ingredient_id", "quantity", "unit")
+            if portion["quantity"] <= 0:
+                raise validation_error("quantity", msg="Input should be greater than 0", error_type="greater_than")
+            ingredient = ingredients.get(portion["ingredient_id"])
+            if ingredient is None:
+                raise HTTPError(400, f"Ingredient {portion['ingredient_id']} not found")
+            if ingredient["status"] != "active":
+                raise HTTPError(400, f"Ingredient {portion['ingredient_id']} is not active")
+        return {**recipe, "ingredients": portions}
+
+    def validate_daily_menus(daily_menus: list):
+        for daily_menu in daily_menus:
+            require(daily_menu, "day")
+            if daily_menu["day"] < 1:
+                raise validation_error("day", msg="Input should be greater than or equal to 1",
+                                       error_type="greater_than_equal")
+            for slot in MEAL_SLOTS:
+                for dish_id in daily_menu.get(slot, []):
+                    if dishes.get(dish_id) is None:
+                        raise HTTPError(400, f"Dish {dish_id} not found")
+
+    # --- Ingredientes ---
+
+    @app.post(f"{API}/ingredients/")
+    def create_ingredient(request):
+        data = request.json()
+        require(data, "name", "base_unit_of_measure")
+        _check_name(data)
+        _check_status(data)
+        if data["base_unit_of_measure"] not in UNITS:
+            raise validation_error("base_unit_of_measure", msg="Invalid unit of measure", error_type="enum")
+        if _name_taken(ingredients, data["name"]):
+            raise HTTPError(400, f"Ingredient with name '{data['name']}' already exists")
+        now = now_iso()
+        return 201, ingredients.insert({
+            "status": "active", "description": None, "category": None, **data, "created_at": now, "updated_at": now,
+        })
+
+    @app.get(f"{API}/ingredients/")
+    def list_ingredients(request):
+        skip = request.int_param("skip", 0, ge=0)
+        limit = request.int_param("limit", 100, ge=1, le=1000)
+        status = request.params.get("status")
+        category = request.params.get("category")
+        search = request.params.get("search", "").lower()
+        found = [ingredient for ingredient in ingredients
+                 if status in (None, ingredient["status"]) and category in (None, ingredient["category"])
+                 and search in ingredient["name"].lower()]
+        return found[skip:skip + limit]
+
+    @app.get(f"{API}/ingredients/categories")
+    def list_categories(request):
+        return sorted({ingredient["category"] for ingredient in ingredients if ingredient["category"]})
+
+    @app.get(f"{API}/ingredients/statistics")
+    def ingredient_statistics(request):
+        active = sum(ingredient["status"] == "active" for ingredient in ingredients)
+        return {"total_ingredients": len(ingredients), "active_ingredients": active,
+                "inactive_ingredients": len(ingredients) - active}
+
+    @app.head(f"{API}/ingredients/validate/name-uniqueness")
+    def check_name_uniqueness(request):
+        if "name" not in request.params:
+            raise validation_error("name", location="query")
+        if _name_taken(ingredients, request.params["name"]):
+            return 409, None
+        return 200, None
+
+    @app.get(f"{API}/ingredients/detailed")
+    def list_detailed_ingredients(request):
+        return [detailed(ingredient) for ingredient in ingredients]
+
+    @app.get(f"{API}/ingredients/{{ingredient_id}}/detailed")
+    def get_detailed_ingredient(request, ingredient_id):
+        return detailed(find(ingredients, ingredient_id, "Ingredient"))
+
+    @app.get(f"{API}/ingredients/{{ingredient_id}}")
+    def get_ingredient(request, ingredient_id):
+        return find(ingredients, ingredient_id, "Ingredient")
+
+    @app.put(f"{API}/ingredients/{{ingredient_id}}")
+    def update_ingredient(request, ingredient_id):
+        ingredient = find(ingredients, ingredient_id, "Ingredient")
+        data = request.json()
+        _check_name(data)
+        _check_status(data)
+        if "name" in data and _name_taken(ingredients, data["name"], exclude=ingredient["_id"]):
+            raise HTTPError(400, f"Ingredient with name '{data['name']}' already exists")
+        ingredient.update({key: value for key, value in data.items() if key != "_id"}, updated_at=now_iso())
+        return ingredient
+
+    for action, status in (("activate", "active"), ("inactivate", "inactive")):
+        @app.patch(f"{API}/ingredients/{{ingredient_id}}/{action}")
+        def set_ingredient_status(request, ingredient_id, status=status):
+            ingredient = find(ingredients, ingredient_id, "Ingredient")
+            ingredient.update(status=status, updated_at=now_iso())
+            return ingredient
+
+    @app.delete(f"{API}/ingredients/{{ingredient_id}}")
+    def delete_ingredient(request, ingredient_id):
+        ingredient = find(ingredients, ingredient_id, "Ingredient")
+        if dishes_using(ingredient["_id"]):
+            raise HTTPError(400, "Ingredient cannot be deleted because it is used in dishes")
+        ingredients.delete(ingredient_id)
+        return {"message": "Ingredient deleted successfully"}
+
+    # --- Platos ---
+
+    @app.post(f"{API}/dishes/")
+    def create_dish(request):
+        data = request.json()
+        require(data, "name", "compatible_meal_types", "recipe")
+        _check_name(data)
+        _check_status(data)
+        recipe = validate_recipe(data["recipe"])
+        if _name_taken(dishes, data["name"]):
+            raise HTTPError(400, f"Dish with name '{data['name']}' already exists")
+        now = now_iso()
+        return 201, dishes.insert({
+            "status": "active", "description": None, **data, "recipe": recipe, "created_at": now, "updated_at": now,
+        })
+
+    @app.get(f"{API}/dishes/")
+    def list_dishes(request):
+        name = request.params.get("name", "").lower()
+        status = request.params.get("status")
+        meal_type = request.params.get("meal_type")
+        return [dish for dish in dishes
+                if name in dish["name"].lower() and status in (None, dish["status"])
+                and (meal_type is None or meal_type in dish["compatible_meal_types"])]
+
+    @app.get(f"{API}/dishes/{{dish_id}}")
+    def get_dish(request, dish_id):
+        return find(dishes, dish_id, "Dish")
+
+    @app.put(f"{API}/dishes/{{dish_id}}")
+    def update_dish(request, dish_id):
+        dish = find(dishes, dish_id, "Dish")
+        data = request.json()
+        _check_name(data)
+        _check_status(data)
+        if "recipe" in data:
+            data["recipe"] = validate_recipe(data["recipe"])
+        if "name" in data and _name_taken(dishes, data["name"], exclude=dish["_id"]):
+            raise HTTPError(400, f"Dish with name '{data['name']}' already exists")
+        dish.update({key: value for key, value in data.items() if key != "_id"}, updated_at=now_iso())
+        return dish
+
+    @app.delete(f"{API}/dishes/{{dish_id}}")
+    def delete_dish(request, dish_id):
+        find(dishes, dish_id, "Dish")
+        dishes.delete(dish_id)
+        return {"message": "Dish deleted successfully"}
+
+    # --- Ciclos de menú ---
+
+    @app.post(f"{API}/menu-cycles/")
+    def create_menu_cycle(request):
+        data = request.json()
+        require(data, "name", "duration_days", "daily_menus")
+        _check_name(data)
+        _check_status(data)
+        if data["duration_days"] < 1:
+            raise validation_error("duration_days", msg="Input should be greater than or equal to 1",
+                                   error_type="greater_than_equal")
+        validate_daily_menus(data["daily_menus"])
+        if _name_taken(cycles, data["name"]):
+            raise HTTPError(400, f"Menu cycle with name '{data['name']}' already exists")
+        now = now_iso()
+        return 201, cycles.insert({"status": "active", "description": None, **data, "created_at": now, "updated_at": now})
+
+    @app.get(f"{API}/menu-cycles/")
+    def list_menu_cycles(request):
+        status = request.params.get("status")
+        search = request.params.get("search", "").lower()
+        return [cycle for cycle in cycles if status in (None, cycle["status"]) and search in cycle["name"].lower()]
+
+    @app.get(f"{API}/menu-cycles/{{cycle_id}}")
+    def get_menu_cycle(request, cycle_id):
+        return find(cycles, cycle_id, "Menu cycle")
+
+    @app.patch(f"{API}/menu-cycles/{{cycle_id}}/deactivate")
+    def deactivate_menu_cycle(request, cycle_id):
+        cycle = find(cycles, cycle_id, "Menu cycle")
+        cycle.update(status="inactive", updated_at=now_iso())
+        return cycle
+
+    @app.patch(f"{API}/menu-cycles/{{cycle_id}}")
+    def update_menu_cycle(request, cycle_id):
+        cycle = find(cycles, cycle_id, "Menu cycle")
+        data = request.json()
+        _check_name(data)
+        _check_status(data)
+        if "daily_menus" in data:
+            validate_daily_menus(data["daily_menus"])
+        if "name" in data and _name_taken(cycles, data["name"], exclude=cycle["_id"]):
+            raise HTTPError(400, f"Menu cycle with name '{data['name']}' already exists")
+        cycle.update({key: value for key, value in data.items() if key != "_id"}, updated_at=now_iso())
+        return cycle
+
+    @app.delete(f"{API}/menu-cycles/{{cycle_id}}")
+    def delete_menu_cycle(request, cycle_id):
+        find(cycles, cycle_id, "Menu cycle")
+        cycles.delete(cycle_id)
+        return {"message": "Menu cycle deleted successfully"}
+
+    # --- Programación de menús ---
+
+    @app.post(f"{API}/menu-schedules/assign")
+    def assign_menu_schedule(request):
+        data = request.json()
+        require(data, "menu_cycle_id", "start_date", "end_date")
+        if data["end_date"] < data["start_date"]:
+            raise validation_error("end_date", msg="end_date must be after start_date", error_type="value_error")
+        cycle = cycles.get(parse_object_id(data["menu_cycle_id"], "menu_cycle_id", "body"))
+        if cycle is None:
+            raise HTTPError(404, "Menu cycle not found")
+        schedule = schedules.insert({
+            "menu_cycle_id": cycle["_id"],
+            "coverage": {"campus_ids": data.get("campus_ids", []), "town_ids": data.get("town_ids", [])},
+            "start_date": data["start_date"],
+            "end_date": data["end_date"],
+            "status": "active",
+            "created_at": now_iso(),
+        })
+        return 201, {"message": "Menu schedule assigned successfully", "schedule_id": schedule["_id"]}
+
+    @app.get(f"{API}/menu-schedules/{{schedule_id}}")
+    def get_menu_schedule(request, schedule_id):
+        return find(schedules, schedule_id, "Menu schedule")
+
+    @app.delete(f"{API}/menu-schedules/{{schedule_id}}")
+    def delete_menu_schedule(request, schedule_id):
+        find(schedules, schedule_id, "Menu schedule")
+        schedules.delete(schedule_id)
+        return {"message": "Menu schedule deleted successfully"}
+
+    return app
@@ -0,0 +1,69 @@
+"""
+Plugin de pytest para ejecutar las suites contra los backends simulados
+
+Se carga con ``-p utils.fake_backends.plugin --fake-backends inprocess|ports``:
+
+- inprocess: las peticiones de los clientes de tests/http_clients.py a las
+  URLs base de la configuración se atienden con httpx.ASGITransport, sin
+  sockets. Con pytest-xdist cada worker tiene su propia copia de los backends.
+- ports: los backends escuchan en los puertos de las URLs base (8000-8004)
+  durante la sesión; con pytest-xdist se inician una sola vez en el
+  controlador y los workers comparten su estado, como con los reales.
+
+Compatible con utils/cassettes.py: en modo record se graban las respuestas de
+los backends simulados.
+"""
+import pytest
+
+from .server import FakeBackends
+
+_backends_key = pytest.StashKey[FakeBackends]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fake-backends", choices=["inprocess", "ports"], default=None,
+        help="Ejecutar los tests contra backends simulados en memoria (en proceso o en los puertos locales)"
+    )
+
+
+def pytest_configure(config):
+    mode = config.getoption("--fake-backends")
+    if mode is None:
+        return
+    is_xdist_worker = hasattr(config, "workerinput")
+    is_xdist_controller = getattr(config.option, "dist", "no") != "no" and not is_xdist_worker
+
+    from tests.config import settings
+    from tests.http_clients import http_clients
+
+    # Los tokens del cache compartido no los emitió esta instancia de los backends
+    settings.AUTH_TOKEN_CACHE = False
+    if mode == "inprocess":
+        if is_xdist_controller:
+            return
+        backends = FakeBackends(settings)
+        backends.mount(http_clients)
+    else:
+        if is_xdist_worker:
+            return
+        backends = FakeBackends(settings)
+        backends.start()
+    config.stash[_backends_key] = backends
+
+
+def pytest_unconfigure(config):
+    backends = config.stash.get(_backends_key, None)
+    if backends is None:
+        return
+    if config.getoption("--fake-backends") == "ports":
+        backends.stop()
+    else:
+        from tests.http_clients import http_clients
+        backends.unmount(http_clients)
+
+
+@pytest.fixture(scope="session")
+def fake_backends(pytestconfig):
+    """Backends simulados de la sesión (None en los workers de xdist en modo ports o sin --fake-backends)"""
+    return pytestconfig.stash.get(_backends_key, None)
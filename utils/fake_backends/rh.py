@@ -0,0 +1,117 @@
+"""
+Backend de recursos humanos simulado (empleados, disponibilidades y opciones)
+"""
+from .app import FakeApp, HTTPError, Table, now_iso, require, sequence
+
+DOCUMENT_TYPES = ["Cédula de Ciudadanía", "Cédula de Extranjería", "Pasaporte"]
+GENDERS = ["Masculino", "Femenino", "Otro"]
+OPERATIONAL_ROLES = ["Manipulador de Alimentos", "Coordinador", "Nutricionista"]
+AVAILABILITY_STATUSES = ["Disponible", "No disponible", "Incapacidad", "Vacaciones"]
+
+EMPLOYEE_FIELDS = ("document_number", "full_name", "birth_date", "hire_date",
+                   "document_type_id", "gender_id", "operational_role_id")
+
+
+def _options(names) -> Table:
+    table = Table(sequence())
+    for name in names:
+        table.insert({"name": name})
+    return table
+
+
+def create_app(prefix: str = "/api/v1") -> FakeApp:
+    app = FakeApp("rh", prefix)
+    employees = Table(sequence())
+    availabilities = Table(sequence())
+    operational_roles = _options(OPERATIONAL_ROLES)
+    options = {
+        "document-types": _options(DOCUMENT_TYPES),
+        "genders": _options(GENDERS),
+        "operational-roles": operational_roles,
+        "availability-statuses": _options(AVAILABILITY_STATUSES),
+    }
+
+    for name, table in options.items():
+        app.get(f"/options/{name}")(lambda request, table=table: list(table))
+
+    @app.post("/operational-roles/")
+    def create_operational_role(request):
+        data = request.json()
+        require(data, "name")
+        return 201, operational_roles.insert({"name": data["name"]})
+
+    # --- Empleados ---
+
+    @app.post("/employees/")
+    def create_employee(request):
+        data = request.json()
+        require(data, *EMPLOYEE_FIELDS)
+        if any(employee["document_number"] == data["document_number"] for employee in employees):
+            raise HTTPError(400, "Employee with this document number already exists")
+        return 201, employees.insert({"is_active": True, **data, "created_at": now_iso()})
+
+    @app.get("/employees/")
+    def list_employees(request):
+        return list(employees)
+
+    @app.get("/employees/document/{document_number}")
+    def get_employee_by_document(request, document_number):
+        employee = next((employee for employee in employees if employee["document_number"] == document_number), None)
+        if employee is None:
+            raise HTTPError(404, "Employee not found")
+        return employee
+
+    @app.get("/employees/{employee_id}")
+    def get_employee(request, employee_id):
+        return employees.find(employee_id, "Employee not found")
+
+    @app.put("/employees/{employee_id}")
+    def update_employee(request, employee_id):
+        employee = employees.find(employee_id, "Employee not found")
+        employee.update({key: value for key, value in request.json().items() if key != "id"})
+        return employee
+
+    @app.delete("/employees/{employee_id}")
+    def delete_employee(request, employee_id):
+        employees.find(employee_id, "Employee not found")
+        employees.delete(employee_id)
+        return {"message": "Employee deleted successfully"}
+
+    # --- Disponibilidades ---
+
+    @app.post("/availabilities/")
+    def create_availability(request):
+        data = request.json()
+        require(data, "employee_id", "date", "status_id")
+        return 201, availabilities.insert({"notes": None, **data, "created_at": now_iso()})
+
+    @app.get("/availabilities/")
+    def list_availabilities(request):
+        start_date = request.params.get("start_date", "")
+        end_date = request.params.get("end_date", "9999-12-31")
+        # Las fechas ISO se comparan como texto
+        return [availability for availability in availabilities
+                if start_date <= availability["date"] <= end_date]
+
+    @app.get("/availabilities/employee/{employee_id}")
+    def list_employee_availabilities(request, employee_id):
+        return [availability for availability in availabilities
+                if str(availability["employee_id"]) == employee_id]
+
+    @app.get("/availabilities/{availability_id}")
+    def get_availability(request, availability_id):
+        return availabilities.find(availability_id, "Availability not found")
+
+    @app.put("/availabilities/{availability_id}")
+    def update_availability(request, availability_id):
+        availability = availabilities.find(availability_id, "Availability not found")
+        availability.update({key: value for key, value in request.json().items() if key != "id"})
+        return availability
+
+    @app.delete("/availabilities/{availability_id}")
+    def delete_availability(request, availability_id):
+        availabilities.find(availability_id, "Availability not found")
+        availabilities.delete(availability_id)
+        return {"message": "Availability deleted successfully"}
+
+    return app
@@ -0,0 +1,178 @@
+"""
+Arranque de los cinco backends simulados en proceso o en puertos locales
+"""
+import asyncio
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+import h11
+import httpx
+
+from . import auth, cobertura, compras, menus, rh
+from .app import FakeApp
+
+# URL de login del helper get_auth_token de tests/compras/config.py
+COMPRAS_AUTH_URL = "http://127.0.0.1:8000"
+
+
+class FakeBackends:
+    """
+    Los cinco servicios simulados construidos a partir de la configuración
+
+    Cada servicio se sirve en la URL base de tests/config.Settings: la ruta
+    de la URL es el prefijo de la aplicación y las cuentas de administrador y
+    de usuario básico son las de la configuración. El estado vive en memoria
+    mientras viva la instancia.
+    """
+
+    def __init__(self, settings):
+        self.urls: Dict[str, str] = {
+            "auth": settings.BASE_AUTH_BACKEND_URL,
+            "cobertura": settings.BASE_COVERAGE_BACKEND_URL,
+            "compras": settings.BASE_COMPRAS_BACKEND_URL,
+            "menus": settings.BASE_MENUS_BACKEND_URL,
+            "rh": settings.BASE_RH_BACKEND_URL,
+        }
+        accounts = [
+            (settings.ADMIN_USER_EMAIL, settings.ADMIN_USER_PASSWORD, auth.ADMIN_ROLE_ID),
+            (settings.BASE_USER_EMAIL, settings.BASE_USER_PASSWORD, auth.BASIC_ROLE_ID),
+        ]
+        prefix = {service: urlsplit(url).path for service, url in self.urls.items()}
+        self.apps: Dict[str, FakeApp] = {
+            "auth": auth.create_app(prefix["auth"], accounts),
+            "cobertura": cobertura.create_app(prefix["cobertura"]),
+            "compras": compras.create_app(prefix["compras"]),
+            "menus": menus.create_app(prefix["menus"]),
+            "rh": rh.create_app(prefix["rh"]),
+        }
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._servers = []
+
+    def _origins(self):
+        """(URL, aplicación) por origen atendido, incluida la URL de login de compras"""
+        origins = [(url, self.apps[service]) for service, url in self.urls.items()]
+        return origins + [(COMPRAS_AUTH_URL, self.apps["auth"])]
+
+    # --- En proceso ---
+
+    def mount(self, registry):
+        """Atiende las peticiones del registro de clientes HTTP sin abrir sockets"""
+        for url, app in self._origins():
+            registry.mount(url, httpx.ASGITransport(app=app))
+
+    def unmount(self, registry):
+        registry.unmount_all()
+
+    # --- En puertos locales ---
+
+    def start(self):
+        """
+        Sirve cada aplicación en el host y puerto de su URL base (HTTP/1.1)
+
+        El servidor corre en un hilo con su propio event loop, por lo que los
+        tests (y los workers de pytest-xdist) lo usan como a los backends
+        reales. Falla con OSError si algún puerto ya está ocupado.
+        """
+        # localhost ya incluye 127.0.0.1: un solo servidor por puerto
+        addresses: Dict[int, Tuple[str, FakeApp]] = {}
+        for url, app in self._origins():
+            parts = urlsplit(url)
+            addresses.setdefault(parts.port or 80, (parts.hostname, app))
+
+        ready = threading.Event()
+        errors = []
+
+        async def serve():
+            try:
+                for port, (host, app) in addresses.items():
+                    self._servers.append(await asyncio.start_server(
+                        lambda reader, writer, app=app: _serve_connection(app, reader, writer), host, port
+                    ))
+            except OSError as e:
+                errors.append(e)
+            finally:
+                ready.set()
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="fake-backends", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(serve(), self._loop)
+        ready.wait()
+        if errors:
+            self.stop()
+            raise errors[0]
+
+    def stop(self):
+        if self._loop is None:
+            return
+
+        async def close():
+            for server in self._servers:
+                server.close()
+                await server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop, self._thread, self._servers = None, None, []
+
+
+async def _serve_connection(app: FakeApp, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Atiende las peticiones keep-alive de una conexión con la aplicación ASGI"""
+    connection = h11.Connection(h11.SERVER)
+    try:
+        while True:
+            event = connection.next_event()
+            if event is h11.NEED_DATA:
+                connection.receive_data(await reader.read(65536))
+                continue
+            if not isinstance(event, h11.Request):
+                break
+
+            body = b""
+            while True:
+                part = connection.next_event()
+                if part is h11.NEED_DATA:
+                    connection.receive_data(await reader.read(65536))
+                elif isinstance(part, h11.Data):
+                    body += part.data
+                else:
+                    break
+
+            status, headers, content = await _call_asgi(app, event, body)
+            writer.write(connection.send(h11.Response(status_code=status, headers=headers)))
+            writer.write(connection.send(h11.Data(data=content)))
+            writer.write(connection.send(h11.EndOfMessage()))
+            await writer.drain()
+
+            if connection.our_state is not h11.DONE or connection.their_state is not h11.DONE:
+                break
+            connection.start_next_cycle()
+    except (ConnectionError, h11.RemoteProtocolError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _call_asgi(app: FakeApp, request: h11.Request, body: bytes):
+    path, _, query = request.target.partition(b"?")
+    scope = {
+        "type": "http",
+        "method": request.method.decode("ascii"),
+        "path": unquote(path.decode("ascii")),
+        "query_string": query,
+        "headers": [(name.lower(), value) for name, value in request.headers],
+    }
+    response = {}
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        response.update(message)
+
+    await app(scope, receive, send)
+    return response["status"], response["headers"], response["body"]
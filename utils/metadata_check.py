@@ -0,0 +1,93 @@
+"""
+Validación de metadata en tiempo de colección
+
+Plugin de pytest usado por ``generate_test_report.py --validate-only``: revisa
+cada test recolectado (sin ejecutarlo ni acceder a la red) y reporta los tests
+sin metadata completa, los test_id repetidos entre tests de un mismo servicio y
+los archivos que no se pudieron recolectar. Un mismo test_id en servicios
+distintos es válido: el historial y la planificación usan el nodeid.
+"""
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+
+from .services import PROJECT_ROOT, get_service_for_path
+from .static_metadata import METADATA_FIELDS, get_file_metadata
+
+
+def get_item_metadata(item) -> Dict[str, Any]:
+    """
+    Metadata de un test recolectado
+
+    Usa el marker test_info que aplica @add_test_info y, si el test no lo tiene,
+    el docstring estructurado leído del AST del archivo.
+    """
+    marker = item.get_closest_marker("test_info")
+    if marker is not None:
+        return {field: marker.kwargs.get(field) for field in METADATA_FIELDS}
+
+    module_path = Path(item.path).relative_to(PROJECT_ROOT).as_posix()
+    name = getattr(item, "originalname", item.name)
+    return get_file_metadata(module_path).get(name) or {}
+
+
+class MetadataValidator:
+    """Plugin que valida la metadata de todos los tests recolectados"""
+
+    def __init__(self):
+        self.total = 0
+        self.errors: List[str] = []
+        self.collection_errors: List[str] = []
+        # {(servicio, test_id): {"ruta::función": [nodeid, ...]}}
+        self.test_ids: Dict[Tuple[str, str], Dict[str, List[str]]] = {}
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.collection_errors.append(f"{report.nodeid}: {report.longreprtext.strip().splitlines()[-1]}")
+
+    def pytest_collection_finish(self, session):
+        for item in session.items:
+            self.total += 1
+            metadata = get_item_metadata(item)
+            module_path = Path(item.path).relative_to(PROJECT_ROOT).as_posix()
+            function_key = f"{module_path}::{getattr(item, 'originalname', item.name)}"
+
+            missing_fields = [field for field in METADATA_FIELDS if not metadata.get(field)]
+            if missing_fields:
+                self.errors.append(f"{item.nodeid}: campos faltantes: {', '.join(missing_fields)}")
+            if metadata.get('test_id'):
+                # Los tests parametrizados comparten la función y por lo tanto el test_id
+                service = get_service_for_path(module_path) or 'sin servicio'
+                functions = self.test_ids.setdefault((service, metadata['test_id']), {})
+                functions.setdefault(function_key, []).append(item.nodeid)
+
+    def get_duplicates(self) -> Dict[Tuple[str, str], List[str]]:
+        """Retorna los nodeids de los (servicio, test_id) usados por más de una función de test"""
+        return {
+            key: sorted(nodeid for nodeids in functions.values() for nodeid in nodeids)
+            for key, functions in sorted(self.test_ids.items())
+            if len(functions) > 1
+        }
+
+    def has_metadata_errors(self) -> bool:
+        """Si hay tests sin metadata completa o archivos que no se pudieron recolectar"""
+        return bool(self.errors or self.collection_errors)
+
+    def format_problems(self) -> str:
+        """Describe todos los problemas encontrados, o cadena vacía si no hay"""
+        sections = []
+        if self.collection_errors:
+            sections.append("Archivos que no se pudieron recolectar:\n" + "\n".join(
+                f"• {error}" for error in self.collection_errors
+            ))
+        if self.errors:
+            sections.append("Los siguientes tests no tienen metadata completa:\n" + "\n".join(
+                f"• {error}" for error in self.errors
+            ))
+        duplicates = self.get_duplicates()
+        if duplicates:
+            lines = []
+            for (service, test_id), nodeids in duplicates.items():
+                lines.append(f"• {test_id} ({service}):")
+                lines.extend(f"    - {nodeid}" for nodeid in nodeids)
+            sections.append("test_id duplicados dentro de un servicio:\n" + "\n".join(lines))
+        return "\n\n".join(sections)
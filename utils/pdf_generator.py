@@ -1,49 +1,268 @@
 """
 Generador de PDF usando las utilidades existentes
 """
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import chain
+from pathlib import Path
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, NextPageTemplate, PageTemplate, Frame, BaseDocTemplate
 
-from .pdf_styles import setup_pdf_styles
-from .pdf_tables import create_summary_table, create_test_details_table
+from .pdf_styles import draw_page_number, setup_pdf_styles
+from .request_timing import ENDPOINT_TABLE_ROWS, endpoint_stats
+from .pdf_tables import (
+    DETAILS_CHUNK_ROWS,
+    DETAILS_FRAGMENT_TESTS,
+    ParagraphCache,
+    create_endpoint_timing_table,
+    create_summary_table,
+    create_toc_table,
+    iter_test_details_tables,
+)
 
 
-def generate_pdf_report(modules, filename='test_report.pdf'):
+def generate_pdf_report(modules, filename='test_report.pdf', chunk_rows=DETAILS_CHUNK_ROWS,
+                        workers=1, toc=False, cache=None):
     """
     Genera el PDF completo con todos los módulos
+
+    Las tablas de detalle se generan por partes de chunk_rows filas, por lo
+    que el tiempo de maquetación crece de forma lineal con la cantidad de
+    tests. BaseDocTemplate.build conserva los flowables y las páginas hasta
+    guardar, así que un documento solo se construye de una vez si tiene hasta
+    DETAILS_FRAGMENT_TESTS tests; los reportes más grandes se construyen por
+    fragmentos de ese tamaño que se unen con pypdf, y la memoria de ReportLab
+    queda acotada.
+
+    Con workers > 1, toc=True, un cache o más de DETAILS_FRAGMENT_TESTS
+    tests, cada módulo se renderiza como un fragmento independiente (en un
+    pool de procesos si workers > 1) y los fragmentos se unen después de la
+    página de resumen (ver _generate_merged_report).
     
     Args:
         modules: Dict con módulos y sus tests organizados
         filename: Nombre del archivo PDF a generar
+        chunk_rows: Máximo de filas por tabla de detalle
+        workers: Procesos para renderizar los módulos en paralelo
+        toc: Incluir una tabla de contenido con la página de cada módulo
+        cache: ReportCache del que se reutilizan las secciones de los módulos
+            que no cambiaron (opcional)
     """
+    total_tests = sum(len(tests) for tests in modules.values())
+    if workers > 1 or toc or cache is not None or total_tests > DETAILS_FRAGMENT_TESTS:
+        _generate_merged_report(modules, filename, chunk_rows, workers, toc, cache)
+        print(f"📄 Reporte PDF generado: {filename}")
+        return
+
     # Configurar estilos
     styles = setup_pdf_styles()
     
-    # Crear templates para diferentes orientaciones
+    # Crear documento con múltiples templates (resumen vertical, detalles horizontal)
+    doc = BaseDocTemplate(filename, pageTemplates=_create_page_templates())
+    
+    story = chain(
+        # === PÁGINA 1: RESUMEN GENERAL ===
+        _create_header_section(styles),
+        _create_summary_section(modules, styles),
+        # === PÁGINAS DETALLADAS: UNA POR MÓDULO ===
+        _create_details_sections(modules, styles, chunk_rows, ParagraphCache(styles)),
+    )
+    
+    doc.build(list(story))
+    print(f"📄 Reporte PDF generado: {filename}")
+
+
+def _create_page_templates(numbered=True):
+    """
+    Crea los templates de página: vertical (resumen) y horizontal (detalles)
+
+    Args:
+        numbered: Dibujar el número de página en el pie. Los fragmentos que se
+            combinan después se numeran al unirlos.
+    """
+    callbacks = {'onPage': _draw_page_number} if numbered else {}
+
     # Template para páginas verticales (resumen)
     portrait_frame = Frame(72, 18, A4[0] - 144, A4[1] - 90, id='portrait')
-    portrait_template = PageTemplate(id='portrait', frames=[portrait_frame])
+    portrait_template = PageTemplate(id='portrait', frames=[portrait_frame], **callbacks)
     
     # Template para páginas horizontales (detalles)
     landscape_frame = Frame(50, 50, landscape(A4)[0] - 100, landscape(A4)[1] - 100, id='landscape')
-    landscape_template = PageTemplate(id='landscape', frames=[landscape_frame], pagesize=landscape(A4))
-    
-    # Crear documento con múltiples templates
-    doc = BaseDocTemplate(filename, pageTemplates=[portrait_template, landscape_template])
-    
-    story = []
-    
-    # === PÁGINA 1: RESUMEN GENERAL ===
-    story.extend(_create_header_section(styles))
-    story.extend(_create_summary_section(modules, styles))
-    
-    # === PÁGINAS DETALLADAS: UNA POR MÓDULO ===
-    story.extend(_create_details_sections(modules, styles))
-    
-    # Construir el PDF
-    doc.build(story)
-    print(f"📄 Reporte PDF generado: {filename}")
+    landscape_template = PageTemplate(
+        id='landscape', frames=[landscape_frame], pagesize=landscape(A4), **callbacks
+    )
+
+    return [portrait_template, landscape_template]
+
+
+def _draw_page_number(canv, doc):
+    """Callback onPage que numera las páginas del documento"""
+    draw_page_number(canv, doc.pagesize[0], canv.getPageNumber())
+
+
+def _generate_merged_report(modules, filename, chunk_rows, workers, toc, cache=None):
+    """
+    Renderiza cada módulo como un PDF independiente y los une al resumen
+
+    Los módulos son independientes (cada uno empieza en una página nueva), así
+    que se renderizan en un pool de procesos, del más grande al más pequeño. El
+    resumen se renderiza al final, cuando ya se conoce la cantidad de páginas
+    de cada módulo para la tabla de contenido, y la numeración se estampa al
+    unir los fragmentos.
+
+    Con un cache, las secciones cuyo hash de contenido ya está guardado no se
+    renderizan: solo se vuelven a unir.
+    """
+    from .pdf_merge import count_pages, merge_pdf_fragments
+    from .report_cache import module_cache_key
+
+    with tempfile.TemporaryDirectory(prefix="nutripae_pdf_") as tmp:
+        fragments = []
+        pending = {}  # índice del módulo → clave de cache de las secciones a renderizar
+        tasks = []
+        for index, (module_name, tests) in enumerate(modules.items()):
+            key = module_cache_key(module_name, tests, index == 0, chunk_rows) if cache is not None else None
+            cached = cache.get(key) if cache is not None else None
+            if cached is not None:
+                fragments.append(str(cached))
+                continue
+            fragment = str(Path(tmp) / f"module_{index}.pdf")
+            fragments.append(fragment)
+            pending[index] = key
+            tasks.append((module_name, list(tests), index == 0, chunk_rows, fragment))
+
+        _render_module_fragments(tasks, workers)
+
+        if cache is not None:
+            print(f"Cache del reporte: {len(modules) - len(tasks)} de {len(modules)} módulos reutilizados")
+            for index, key in pending.items():
+                cache.store(key, fragments[index])
+
+        module_pages = [count_pages(fragment) for fragment in fragments]
+
+        front_filename = str(Path(tmp) / "front.pdf")
+        _render_front_matter(modules, front_filename, module_pages if toc else None)
+        merge_pdf_fragments([front_filename] + fragments, filename)
+
+
+def _render_module_fragments(tasks, workers):
+    """
+    Renderiza los fragmentos de los módulos, en paralelo si workers > 1
+
+    Cada fragmento se escribe en la ruta indicada en su tarea; los errores de
+    los procesos del pool se propagan.
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            render_module_fragment(*task)
+        return
+
+    # Longest-first: los módulos grandes empiezan primero para balancear los procesos
+    order = sorted(range(len(tasks)), key=lambda index: len(tasks[index][1]), reverse=True)
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        futures = [pool.submit(render_module_fragment, *tasks[index]) for index in order]
+        for future in futures:
+            future.result()
+
+
+def render_module_fragment(module_name, tests, first, chunk_rows, filename):
+    """
+    Renderiza la sección de un módulo como un PDF horizontal sin numerar
+
+    Se ejecuta en los procesos del pool, por lo que crea sus propios estilos.
+    Un módulo con más de DETAILS_FRAGMENT_TESTS tests se construye por partes
+    de ese tamaño (redondeado a partes completas de chunk_rows filas), cada
+    una con su propio doc.build, que se unen en el fragmento; cada parte
+    empieza en una página nueva.
+
+    Args:
+        module_name: Nombre del módulo
+        tests: Tests del módulo
+        first: Si es el primer módulo (incluye el título "Detalles por Módulo")
+        chunk_rows: Máximo de filas por tabla de detalle
+        filename: PDF de salida
+
+    Returns:
+        Ruta del fragmento generado
+    """
+    from .pdf_merge import merge_pdf_fragments
+
+    styles = setup_pdf_styles()
+    cache = ParagraphCache(styles)
+    part_tests = max(chunk_rows, DETAILS_FRAGMENT_TESTS // chunk_rows * chunk_rows)
+    if len(tests) <= part_tests:
+        story = _create_module_section(module_name, tests, styles, chunk_rows, cache)
+        if first:
+            story = chain(_create_details_title(styles), story)
+        _build_landscape(filename, story)
+        return filename
+
+    with tempfile.TemporaryDirectory(prefix="nutripae_module_") as tmp:
+        parts = []
+        for start in range(0, len(tests), part_tests):
+            part = str(Path(tmp) / f"part_{len(parts)}.pdf")
+            story = iter_test_details_tables(tests[start:start + part_tests], styles, chunk_rows, cache)
+            if start == 0:
+                header = _create_module_header(module_name, tests, styles)
+                story = chain(_create_details_title(styles), header, story) if first else chain(header, story)
+            if start + part_tests >= len(tests):
+                story = chain(story, [Spacer(1, 20)])
+            _build_landscape(part, story)
+            parts.append(part)
+        merge_pdf_fragments(parts, filename, number_pages=False)
+    return filename
+
+
+def _build_landscape(filename, story):
+    """Construye un PDF horizontal sin numerar con los flowables indicados"""
+    landscape_template = _create_page_templates(numbered=False)[1]
+    doc = BaseDocTemplate(filename, pageTemplates=[landscape_template])
+    doc.build(list(story))
+
+
+def _render_front_matter(modules, filename, module_pages=None):
+    """
+    Renderiza el encabezado y el resumen (y la tabla de contenido) en vertical
+
+    Args:
+        modules: Dict con módulos y sus tests
+        filename: PDF de salida
+        module_pages: Páginas de cada módulo en orden; si se indica se agrega
+            la tabla de contenido
+    """
+    styles = setup_pdf_styles()
+    front_pages = 1
+    # La cantidad de páginas del resumen desplaza la página de cada módulo: se
+    # repite hasta que la tabla de contenido es consistente (normalmente 1-2 pasadas)
+    for _ in range(3):
+        story = _create_header_section(styles) + _create_summary_section(modules, styles)
+        if module_pages is not None:
+            story += _create_toc_section(modules, module_pages, front_pages, styles)
+
+        portrait_template = _create_page_templates(numbered=False)[0]
+        doc = BaseDocTemplate(filename, pageTemplates=[portrait_template])
+        doc.build(list(story))
+
+        pages = doc.canv.getPageNumber() - 1
+        if module_pages is None or pages == front_pages:
+            return
+        front_pages = pages
+
+
+def _create_toc_section(modules, module_pages, front_pages, styles):
+    """Crea la tabla de contenido con la página inicial de cada módulo"""
+    entries = []
+    page = front_pages + 1
+    for module_name, pages in zip(modules, module_pages):
+        entries.append((module_name, page))
+        page += pages
+
+    return [
+        Paragraph('Contenido', styles['ModuleTitle']),
+        Spacer(1, 10),
+        create_toc_table(entries, styles),
+    ]
 
 
 def _create_header_section(styles):
@@ -88,51 +307,82 @@ def _create_summary_section(modules, styles):
     elements.append(summary_table)
     elements.append(Spacer(1, 20))
     
+    # Latencia de los endpoints de los backends (peticiones de tests y fixtures)
+    stats = endpoint_stats(modules)
+    if stats:
+        elements.append(Paragraph('Tiempos por Endpoint', styles['ModuleTitle']))
+        elements.append(Spacer(1, 10))
+        shown = stats[:ENDPOINT_TABLE_ROWS]
+        elements.append(Paragraph(
+            f"{len(shown)} de {len(stats)} endpoints, ordenados por p95 "
+            f"({sum(entry['count'] for entry in stats)} peticiones)",
+            styles['CustomNormal']
+        ))
+        elements.append(Spacer(1, 10))
+        elements.append(create_endpoint_timing_table(shown, styles))
+        elements.append(Spacer(1, 20))
+    
     return elements
 
 
-def _create_details_sections(modules, styles):
-    """Crea las secciones detalladas para cada módulo"""
-    elements = []
-    
+def _create_details_sections(modules, styles, chunk_rows=DETAILS_CHUNK_ROWS, cache=None):
+    """
+    Genera las secciones detalladas para cada módulo
+
+    Se usa para construir de una vez los reportes de hasta
+    DETAILS_FRAGMENT_TESTS tests. Las celdas repetidas de todos los módulos se
+    comparten a través de cache.
+    """
+    cache = cache or ParagraphCache(styles)
+
     # Cambiar a orientación horizontal para los detalles
-    elements.append(NextPageTemplate('landscape'))
-    elements.append(PageBreak())
+    yield NextPageTemplate('landscape')
+    yield PageBreak()
     
-    # Título para la sección de detalles
-    title_details = Paragraph('Detalles por Módulo', styles['CustomTitle'])
-    elements.append(title_details)
-    elements.append(Spacer(1, 20))
+    yield from _create_details_title(styles)
     
     # Módulos ordenados alfabéticamente (ya vienen ordenados del test_runner)
     for i, (module_name, tests) in enumerate(modules.items()):
         if i > 0:  # Salto de página antes de cada módulo (excepto el primero)
-            elements.append(PageBreak())
-        
-        # Título del módulo
-        module_title = Paragraph(f'Módulo: {module_name}', styles['ModuleTitle'])
-        elements.append(module_title)
-        elements.append(Spacer(1, 15))
-        
-        # Estadísticas del módulo
-        passed = sum(1 for test in tests if test['outcome'] == 'passed')
-        failed = len(tests) - passed
-        success_rate = (passed / len(tests)) * 100 if tests else 0
-        
-        stats_text = f"""
-        <b>Tests Totales:</b> {len(tests)} | 
-        <b>Pasaron:</b> {passed} | 
-        <b>Fallaron:</b> {failed} | 
-        <b>Porcentaje de Éxito:</b> {success_rate:.1f}%
-        """
-        
-        stats_para = Paragraph(stats_text, styles['Summary'])
-        elements.append(stats_para)
-        elements.append(Spacer(1, 15))
+            yield PageBreak()
         
-        # Tabla de tests del módulo usando la función existente
-        module_table = create_test_details_table(tests, styles)
-        elements.append(module_table)
-        elements.append(Spacer(1, 20))
+        yield from _create_module_section(module_name, tests, styles, chunk_rows, cache)
+
+
+def _create_details_title(styles):
+    """Título de la sección de detalles"""
+    yield Paragraph('Detalles por Módulo', styles['CustomTitle'])
+    yield Spacer(1, 20)
+
+
+def _create_module_section(module_name, tests, styles, chunk_rows, cache):
+    """Genera el título, las estadísticas y la tabla de un módulo"""
+    yield from _create_module_header(module_name, tests, styles)
+
+    # Tabla de tests del módulo, en partes de tamaño acotado
+    yield from iter_test_details_tables(tests, styles, chunk_rows, cache)
+    yield Spacer(1, 20)
+
+
+def _create_module_header(module_name, tests, styles):
+    """Genera el título y las estadísticas de un módulo"""
+    # Título del módulo
+    yield Paragraph(f'Módulo: {module_name}', styles['ModuleTitle'])
+    yield Spacer(1, 15)
+    
+    # Estadísticas del módulo
+    passed = sum(1 for test in tests if test['outcome'] == 'passed')
+    unavailable = sum(1 for test in tests if test['outcome'] == 'unavailable')
+    failed = len(tests) - passed - unavailable
+    success_rate = (passed / len(tests)) * 100 if tests else 0
+    
+    stats_text = f"""
+    <b>Tests Totales:</b> {len(tests)} | 
+    <b>Pasaron:</b> {passed} | 
+    <b>Fallaron:</b> {failed} | 
+    <b>No Disponibles:</b> {unavailable} | 
+    <b>Porcentaje de Éxito:</b> {success_rate:.1f}%
+    """
     
-    return elements 
\ No newline at end of file
+    yield Paragraph(stats_text, styles['Summary'])
+    yield Spacer(1, 15)
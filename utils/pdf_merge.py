@@ -0,0 +1,81 @@
+"""
+Combinación de fragmentos PDF y numeración de las páginas resultantes
+
+Cuando cada módulo del reporte se renderiza por separado (en paralelo o
+reutilizado de un cache), sus PDF se unen aquí en el orden del reporte y los
+números de página se estampan al final, cuando ya se conoce la posición de
+cada página en el documento completo.
+"""
+from typing import List, Union
+from pathlib import Path
+
+from pypdf import PageObject, PdfReader, PdfWriter
+from pypdf.generic import ContentStream, DictionaryObject, NameObject
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+# Mismo pie que pdf_styles.draw_page_number: Helvetica 8, gris, alineado a la derecha
+_PAGE_NUMBER_FONT = NameObject("/FPageNumber")
+_PAGE_NUMBER_SIZE = 8
+_PAGE_NUMBER_MARGIN = 40
+_PAGE_NUMBER_Y = 8
+
+
+def count_pages(path: Union[str, Path]) -> int:
+    """Cantidad de páginas de un PDF"""
+    return len(PdfReader(path).pages)
+
+
+def merge_pdf_fragments(fragments: List[Union[str, Path]], filename: Union[str, Path], number_pages: bool = True):
+    """
+    Une los fragmentos en un solo PDF
+
+    Args:
+        fragments: Rutas de los PDF en el orden del reporte
+        filename: PDF de salida
+        number_pages: Estampar "Página N" en el pie de cada página
+    """
+    writer = PdfWriter()
+    for fragment in fragments:
+        writer.append(PdfReader(fragment))
+
+    if number_pages:
+        stamp_page_numbers(writer)
+
+    with open(filename, "wb") as f:
+        writer.write(f)
+
+
+def stamp_page_numbers(writer: PdfWriter):
+    """
+    Agrega "Página N" al pie de cada página del writer
+
+    Cada número se dibuja en una página superpuesta del mismo tamaño, con la
+    fuente definida en línea en sus /Resources, y se combina con
+    PageObject.merge_page, que aísla el estado gráfico del contenido original.
+    """
+    for number, page in enumerate(writer.pages, 1):
+        text = f"Página {number}"
+        x = float(page.mediabox.width) - _PAGE_NUMBER_MARGIN - stringWidth(text, "Helvetica", _PAGE_NUMBER_SIZE)
+        footer = ContentStream(None, None)
+        footer.set_data(
+            f"0.5 g BT {_PAGE_NUMBER_FONT} {_PAGE_NUMBER_SIZE} Tf {x:.2f} {_PAGE_NUMBER_Y} Td (".encode("ascii")
+            + text.encode("cp1252") + b") Tj ET\n"
+        )
+
+        overlay = PageObject.create_blank_page(width=page.mediabox.width, height=page.mediabox.height)
+        overlay[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({_PAGE_NUMBER_FONT: _page_number_font()}),
+        })
+        overlay.replace_contents(footer)
+        page.merge_page(overlay)
+        # merge_page reescribe el contenido de la página sin comprimir
+        page.compress_content_streams()
+
+
+def _page_number_font() -> DictionaryObject:
+    return DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+        NameObject("/Encoding"): NameObject("/WinAnsiEncoding"),
+    })
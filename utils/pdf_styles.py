@@ -77,4 +77,31 @@ def get_table_colors():
         'summary_content_bg': colors.lightblue,
         'summary_total_bg': colors.yellow,
         'grid': colors.black
-    } 
\ No newline at end of file
+    }
+
+
+# Markup de la columna Estado: los tests no disponibles se distinguen de los fallidos
+STATUS_MARKUP = {
+    'passed': '<font color="green">✓ PASS</font>',
+    'unavailable': '<font color="orange">⚠ NO DISPONIBLE</font>',
+}
+FAILED_STATUS_MARKUP = '<font color="red">✗ FAIL</font>'
+
+
+def get_status_markup(outcome):
+    """Retorna el markup de la columna Estado para el resultado de un test"""
+    return STATUS_MARKUP.get(outcome, FAILED_STATUS_MARKUP)
+
+
+def draw_page_number(canv, page_width, number):
+    """
+    Dibuja el número de página en el pie, alineado a la derecha
+
+    Lo usan tanto las páginas construidas en un solo documento (callback
+    onPage) como las que se numeran después de combinar fragmentos.
+    """
+    canv.saveState()
+    canv.setFont('Helvetica', 8)
+    canv.setFillColor(colors.grey)
+    canv.drawRightString(page_width - 40, 8, f"Página {number}")
+    canv.restoreState()
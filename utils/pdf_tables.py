@@ -1,61 +1,182 @@
 """
 Generación de tablas para el PDF
 """
+from xml.sax.saxutils import escape
+
 from reportlab.lib.units import inch
 from reportlab.platypus import Table, TableStyle, Paragraph
-from .pdf_styles import get_table_colors
+from reportlab.platypus.flowables import _FUZZ
+from .pdf_styles import get_status_markup, get_table_colors
+
+
+# Filas de datos por tabla al generar el detalle por partes (número par para
+# que los colores alternados de las filas continúen entre partes)
+DETAILS_CHUNK_ROWS = 200
+
+# Tests por fragmento PDF: cada fragmento se construye con su propio doc.build
+# y los fragmentos se unen con pypdf, por lo que los flowables y las páginas
+# que ReportLab conserva hasta guardar quedan acotados a este tamaño
+DETAILS_FRAGMENT_TESTS = 2000
 
+# Anchos de columna para orientación horizontal
+DETAILS_COL_WIDTHS = [
+    0.6*inch,  # ID
+    1.5*inch,  # Test name
+    2.8*inch,  # Description
+    2.0*inch,  # Expected result
+    2.0*inch,  # Actual result
+    0.8*inch,  # Status
+    0.6*inch   # Duration
+]
+
+
+class CachedParagraph(Paragraph):
+    """
+    Paragraph que recuerda el resultado de wrap para cada ancho
 
-def create_test_details_table(tests, styles):
+    Table llama a wrap varias veces por celda (al medir filas, al dividir
+    entre páginas y al dibujar); con el ancho ya conocido se reutilizan las
+    líneas calculadas en lugar de volver a cortar el texto.
+    """
+
+    def __init__(self, text, style, *args, **kwargs):
+        super().__init__(text, style, *args, **kwargs)
+        self._wrap_cache = {}
+
+    def wrap(self, availWidth, availHeight):
+        if availWidth < _FUZZ:
+            return super().wrap(availWidth, availHeight)
+
+        cached = self._wrap_cache.get(availWidth)
+        if cached is None:
+            width, height = super().wrap(availWidth, availHeight)
+            self._wrap_cache[availWidth] = (self.blPara, self._wrapWidths, height)
+            return width, height
+
+        self.blPara, self._wrapWidths, self.height = cached
+        self.width = availWidth
+        return self.width, self.height
+
+
+class ParagraphCache:
+    """
+    Cache de celdas de tabla: textos repetidos comparten un mismo Paragraph
+
+    Los encabezados, el estado (uno entre pocos valores) y resultados como
+    "Status Code: 200" se repiten miles de veces; con el cache su markup se
+    parsea y se corta en líneas una sola vez. Los textos únicos (ID, nombre,
+    descripción) no se guardan para que la memoria no crezca con la cantidad
+    de tests.
+    """
+
+    def __init__(self, styles, max_entries=4096):
+        """
+        Args:
+            styles: Estilos del PDF
+            max_entries: Máximo de textos guardados (se descartan los más antiguos)
+        """
+        self.styles = styles
+        self.max_entries = max_entries
+        self._paragraphs = {}
+
+    def shared(self, text, style_name='TableText'):
+        """Retorna el Paragraph compartido para un texto repetitivo"""
+        key = (text, style_name)
+        paragraph = self._paragraphs.get(key)
+        if paragraph is None:
+            if len(self._paragraphs) >= self.max_entries:
+                del self._paragraphs[next(iter(self._paragraphs))]
+            paragraph = CachedParagraph(text, self.styles[style_name])
+            self._paragraphs[key] = paragraph
+        return paragraph
+
+    def unique(self, text, style_name='TableText'):
+        """Crea un Paragraph para un texto que no se repite"""
+        return CachedParagraph(text, self.styles[style_name])
+
+
+def create_test_details_table(tests, styles, cache=None):
     """
     Crea una tabla detallada con los resultados de los tests
     
     Args:
         tests: Lista de tests con su información
         styles: Estilos del PDF
+        cache: ParagraphCache compartido entre tablas (opcional)
         
     Returns:
         Table: Tabla configurada para el PDF
     """
-    colors = get_table_colors()
-    
-    # Encabezados de la tabla
-    headers = [
-        Paragraph('<b>ID</b>', styles['TableText']),
-        Paragraph('<b>Test</b>', styles['TableText']),
-        Paragraph('<b>Descripción</b>', styles['TableText']),
-        Paragraph('<b>Resultado Esperado</b>', styles['TableText']),
-        Paragraph('<b>Resultado Obtenido</b>', styles['TableText']),
-        Paragraph('<b>Estado</b>', styles['TableText']),
-        Paragraph('<b>Duración(s)</b>', styles['TableText'])
-    ]
-    
-    # Datos de la tabla
-    data = [headers]
-    
+    cache = cache or ParagraphCache(styles)
+    data = [_details_headers(cache)]
+    data.extend(_details_row(test, cache) for test in tests)
+    return _build_details_table(data)
+
+
+def iter_test_details_tables(tests, styles, chunk_rows=DETAILS_CHUNK_ROWS, cache=None):
+    """
+    Genera la tabla detallada en partes de tamaño acotado
+
+    Cada parte tiene como máximo chunk_rows filas de datos y su propia fila de
+    encabezados, que se repite en cada página si la parte ocupa varias. Las
+    tablas pequeñas se maquetan en tiempo lineal y se dividen entre páginas
+    sin recalcular una tabla de miles de filas.
+
+    Args:
+        tests: Iterable de tests con su información
+        styles: Estilos del PDF
+        chunk_rows: Máximo de filas de datos por tabla
+        cache: ParagraphCache compartido entre tablas (opcional)
+
+    Returns:
+        Iterador de Table configuradas para el PDF
+    """
+    cache = cache or ParagraphCache(styles)
+    data = None
     for test in tests:
-        status_color = '<font color="green">✓ PASS</font>' if test['outcome'] == 'passed' else '<font color="red">✗ FAIL</font>'
-        
-        data.append([
-            Paragraph(test.get('test_id', 'N/A'), styles['TableText']),
-            Paragraph(test['name'], styles['TableText']),
-            Paragraph(test['description'], styles['TableText']),
-            Paragraph(test['expected_result'], styles['TableText']),
-            Paragraph(test['actual_result'], styles['TableText']),
-            Paragraph(status_color, styles['TableText']),
-            Paragraph(str(test['duration']), styles['TableText'])
-        ])
-    
-    # Crear tabla con anchos apropiados para orientación horizontal
-    table = Table(data, colWidths=[
-        0.6*inch,  # ID
-        1.5*inch,  # Test name
-        2.8*inch,  # Description
-        2.0*inch,  # Expected result
-        2.0*inch,  # Actual result
-        0.8*inch,  # Status
-        0.6*inch   # Duration
-    ])
+        if data is None:
+            data = [_details_headers(cache)]
+        data.append(_details_row(test, cache))
+        if len(data) > chunk_rows:
+            yield _build_details_table(data)
+            data = None
+
+    if data is not None:
+        yield _build_details_table(data)
+
+
+def _details_headers(cache):
+    """Encabezados de la tabla detallada"""
+    return [
+        cache.shared('<b>ID</b>'),
+        cache.shared('<b>Test</b>'),
+        cache.shared('<b>Descripción</b>'),
+        cache.shared('<b>Resultado Esperado</b>'),
+        cache.shared('<b>Resultado Obtenido</b>'),
+        cache.shared('<b>Estado</b>'),
+        cache.shared('<b>Duración(s)</b>')
+    ]
+
+
+def _details_row(test, cache):
+    """Fila de la tabla detallada para un test"""
+    return [
+        cache.unique(test.get('test_id', 'N/A')),
+        cache.unique(test['name']),
+        cache.unique(test['description']),
+        cache.shared(test['expected_result']),
+        cache.shared(test['actual_result']),
+        cache.shared(get_status_markup(test['outcome'])),
+        cache.shared(str(test['duration']))
+    ]
+
+
+def _build_details_table(data):
+    """Crea la Table con encabezado repetible y le aplica el estilo de detalle"""
+    colors = get_table_colors()
+
+    # repeatRows=1: si la tabla se divide entre páginas, el encabezado se repite
+    table = Table(data, colWidths=DETAILS_COL_WIDTHS, repeatRows=1)
     
     # Aplicar estilo a la tabla
     table.setStyle(TableStyle([
@@ -99,30 +220,34 @@ def create_summary_table(modules, styles):
     """
     colors = get_table_colors()
     
-    headers = ['Módulo', 'Tests Totales', 'Pasaron', 'Fallaron', 'Porcentaje Éxito']
+    headers = ['Módulo', 'Tests Totales', 'Pasaron', 'Fallaron', 'No Disponibles', 'Porcentaje Éxito']
     data = [headers]
     
     total_tests = 0
     total_passed = 0
     total_failed = 0
+    total_unavailable = 0
     
     # Ordenar módulos alfabéticamente
     sorted_modules = sorted(modules.items())
     
     for module_name, tests in sorted_modules:
         passed = sum(1 for test in tests if test['outcome'] == 'passed')
-        failed = len(tests) - passed
+        unavailable = sum(1 for test in tests if test['outcome'] == 'unavailable')
+        failed = len(tests) - passed - unavailable
         success_rate = (passed / len(tests)) * 100 if tests else 0
         
         total_tests += len(tests)
         total_passed += passed
         total_failed += failed
+        total_unavailable += unavailable
         
         data.append([
             module_name,
             str(len(tests)),
             str(passed),
             str(failed),
+            str(unavailable),
             f"{success_rate:.1f}%"
         ])
     
@@ -133,11 +258,12 @@ def create_summary_table(modules, styles):
         str(total_tests),
         str(total_passed),
         str(total_failed),
+        str(total_unavailable),
         f"{total_success_rate:.1f}%"
     ])
     
     # Crear tabla
-    table = Table(data, colWidths=[2*inch, 1*inch, 1*inch, 1*inch, 1.2*inch])
+    table = Table(data, colWidths=[1.6*inch, 0.9*inch, 0.8*inch, 0.8*inch, 1.1*inch, 1.1*inch])
     
     # Aplicar estilo a la tabla
     table.setStyle(TableStyle([
@@ -159,4 +285,74 @@ def create_summary_table(modules, styles):
         ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
     ]))
     
-    return table 
\ No newline at end of file
+    return table 
+
+def create_toc_table(entries, styles):
+    """
+    Crea la tabla de contenido del reporte
+
+    Args:
+        entries: Lista de (módulo, página inicial)
+        styles: Estilos del PDF
+
+    Returns:
+        Table: Tabla de contenido configurada
+    """
+    colors = get_table_colors()
+
+    data = [['Módulo', 'Página']]
+    data.extend([module_name, str(page)] for module_name, page in entries)
+
+    table = Table(data, colWidths=[3.5*inch, 1.0*inch], repeatRows=1)
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors['header_bg']),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors['header_text']),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('ALIGN', (1, 0), (1, -1), 'CENTER'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors['row_bg_1'], colors['row_bg_2']]),
+        ('GRID', (0, 0), (-1, -1), 1, colors['grid']),
+    ]))
+
+    return table
+
+
+def create_endpoint_timing_table(stats, styles):
+    """
+    Crea la tabla de latencia por endpoint
+
+    Args:
+        stats: Estadísticas por endpoint (ver request_timing.endpoint_stats)
+        styles: Estilos del PDF
+
+    Returns:
+        Table: Tabla con las peticiones y los percentiles (ms) de cada endpoint
+    """
+    colors = get_table_colors()
+
+    data = [['Endpoint', 'Servicio', 'Peticiones', 'p50 (ms)', 'p95 (ms)', 'p99 (ms)']]
+    for entry in stats:
+        data.append([
+            Paragraph(f"{entry['method']} {escape(entry['path'])}", styles['TableText']),
+            entry['host'],
+            str(entry['count']),
+            f"{entry['p50_ms']:.0f}",
+            f"{entry['p95_ms']:.0f}",
+            f"{entry['p99_ms']:.0f}",
+        ])
+
+    table = Table(data, colWidths=[2.5*inch, 1.1*inch, 0.75*inch, 0.65*inch, 0.65*inch, 0.65*inch], repeatRows=1)
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors['header_bg']),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors['header_text']),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors['row_bg_1'], colors['row_bg_2']]),
+        ('GRID', (0, 0), (-1, -1), 1, colors['grid']),
+    ]))
+
+    return table
@@ -0,0 +1,137 @@
+"""
+Verificación previa (pre-flight) de los servicios backend
+
+Antes de ejecutar los tests se consultan en paralelo las URLs base de todos los
+servicios configurados en tests/config.Settings (y sus endpoints de salud). Los
+servicios que no responden se pasan a este mismo módulo, cargado como plugin de
+pytest con ``-p utils.preflight --skip-services ...``, que omite sus suites
+completas en lugar de esperar el timeout de cada test.
+"""
+import asyncio
+import time
+from typing import Dict, Any, Iterable, List
+
+import httpx
+import pytest
+
+from .circuit_breaker import UNAVAILABLE_KEY
+from .services import (
+    SERVICE_DEPENDENCIES,
+    SERVICE_HEALTH_ENDPOINTS,
+    get_service_base_url,
+    get_service_for_item,
+)
+
+PREFLIGHT_TIMEOUT = 3.0
+
+
+async def _probe_url(client: httpx.AsyncClient, url: str) -> Dict[str, Any]:
+    """Consulta una URL; cualquier respuesta HTTP indica que el servicio está arriba"""
+    start = time.perf_counter()
+    try:
+        response = await client.get(url)
+    except httpx.TransportError as e:
+        return {
+            'url': url,
+            'reachable': False,
+            'status_code': None,
+            'detail': f"{type(e).__name__}: {e}",
+            'elapsed': time.perf_counter() - start,
+        }
+
+    detail = ''
+    if response.headers.get('content-type', '').startswith('application/json'):
+        try:
+            data = response.json()
+            if isinstance(data, dict) and 'status' in data:
+                detail = str(data['status'])
+        except ValueError:
+            pass
+
+    return {
+        'url': url,
+        'reachable': True,
+        'status_code': response.status_code,
+        'detail': detail,
+        'elapsed': time.perf_counter() - start,
+    }
+
+
+async def _probe_all(urls: List[str], timeout: float) -> Dict[str, Dict[str, Any]]:
+    """Consulta todas las URLs de forma concurrente"""
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+        results = await asyncio.gather(*(_probe_url(client, url) for url in urls))
+    return {result['url']: result for result in results}
+
+
+def probe_services(services: Iterable[str], timeout: float = PREFLIGHT_TIMEOUT) -> Dict[str, Dict[str, Any]]:
+    """
+    Verifica concurrentemente la disponibilidad de los servicios
+
+    Args:
+        services: Servicios a verificar (claves de utils.services.SERVICE_TEST_PATHS)
+        timeout: Timeout de cada consulta en segundos
+
+    Returns:
+        Dict {servicio: {'available', 'healthy', 'probes', 'reason'}}. Un servicio
+        no está disponible si su URL no responde o si alguna de sus dependencias
+        (ej: autenticación) no está disponible.
+    """
+    services = set(services)
+    services |= {dependency for service in services for dependency in SERVICE_DEPENDENCIES.get(service, [])}
+
+    service_urls = {}
+    for service in services:
+        base_url = get_service_base_url(service)
+        health_urls = [f"{base_url}{endpoint}" for endpoint in SERVICE_HEALTH_ENDPOINTS.get(service, [])]
+        service_urls[service] = health_urls or [base_url]
+
+    unique_urls = sorted({url for urls in service_urls.values() for url in urls})
+    probes = asyncio.run(_probe_all(unique_urls, timeout))
+
+    status = {}
+    for service, urls in service_urls.items():
+        service_probes = [probes[url] for url in urls]
+        reachable = all(probe['reachable'] for probe in service_probes)
+        healthy = reachable and all(
+            probe['status_code'] < 400 and probe['detail'] in ('', 'healthy')
+            for probe in service_probes
+        )
+        unreachable = [probe for probe in service_probes if not probe['reachable']]
+        status[service] = {
+            'available': reachable,
+            'healthy': healthy,
+            'probes': service_probes,
+            'reason': unreachable[0]['detail'] if unreachable else '',
+        }
+
+    for service, service_status in status.items():
+        down_dependencies = [
+            dependency for dependency in SERVICE_DEPENDENCIES.get(service, [])
+            if not status[dependency]['available']
+        ]
+        if service_status['available'] and down_dependencies:
+            service_status['available'] = False
+            service_status['reason'] = f"depende de: {', '.join(down_dependencies)}"
+
+    return status
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--skip-services", default="",
+        help="Servicios (separados por coma) cuyas suites se omiten por no estar disponibles"
+    )
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """Omite los tests de los servicios que no pasaron la verificación previa"""
+    skipped_services = {service for service in config.getoption("--skip-services").split(",") if service}
+    if not skipped_services:
+        return
+
+    for item in items:
+        service = get_service_for_item(item)
+        if service in skipped_services:
+            item.stash[UNAVAILABLE_KEY] = service
+            item.add_marker(pytest.mark.skip(reason=f"Servicio no disponible (pre-flight): {service}"))
@@ -0,0 +1,115 @@
+"""
+Benchmark de generación del reporte PDF con tests sintéticos
+
+Genera el PDF para cantidades crecientes de tests en un proceso nuevo por
+tamaño y reporta el tiempo y la memoria máxima (RSS) de cada uno, para
+verificar que el costo crece de forma lineal. La memoria de ReportLab está
+acotada por DETAILS_FRAGMENT_TESTS; lo que sigue creciendo, más despacio, es
+el documento que pypdf arma al unir los fragmentos.
+Uso:
+
+    python -m utils.report_benchmark                      # 5k, 20k y 50k tests
+    python -m utils.report_benchmark --sizes 1000 50000 --modules 2
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, List
+
+from .services import PROJECT_ROOT
+
+# Se ejecuta en el proceso hijo: genera el PDF y reporta tiempo y memoria máxima
+_CHILD_SCRIPT = """
+import json, os, resource, sys, time
+from utils.report_benchmark import synthetic_modules
+from utils.pdf_generator import generate_pdf_report
+
+tests, modules, filename = int(sys.argv[1]), int(sys.argv[2]), sys.argv[3]
+data = synthetic_modules(tests, modules)
+sys.stdout = open(os.devnull, "w")
+start = time.perf_counter()
+generate_pdf_report(data, filename)
+elapsed = time.perf_counter() - start
+sys.stdout = sys.__stdout__
+print(json.dumps({
+    "elapsed": elapsed,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "size_mb": os.path.getsize(filename) / (1024 * 1024),
+}))
+"""
+
+
+def synthetic_modules(total_tests: int, module_count: int = 1) -> Dict[str, list]:
+    """
+    Crea módulos con tests sintéticos con el formato de organize_tests_by_module
+
+    Args:
+        total_tests: Cantidad total de tests
+        module_count: Cantidad de módulos entre los que se reparten
+
+    Returns:
+        Dict con módulos en orden alfabético y sus tests
+    """
+    from .test_records import TestRecord
+
+    modules: Dict[str, list] = {f"Módulo {index:02d}": [] for index in range(module_count)}
+    names = list(modules)
+    for index in range(total_tests):
+        failed = index % 17 == 0
+        modules[names[index % module_count]].append(TestRecord(
+            nodeid=f"tests/synthetic/test_synthetic.py::test_case_{index}",
+            name=f"test_case_{index}",
+            module=names[index % module_count],
+            description=f"Verificar el caso sintético número {index} del endpoint de prueba",
+            expected_result="Status Code: 200",
+            actual_result="AssertionError: assert 500 == 200" if failed else "Test ejecutado exitosamente",
+            outcome="failed" if failed else "passed",
+            duration=round(0.01 * (index % 50), 3),
+            test_id=f"SYN-{index:05d}",
+        ))
+    return modules
+
+
+def measure_report(total_tests: int, module_count: int = 1) -> Dict[str, Any]:
+    """
+    Mide la generación del PDF en un proceso nuevo
+
+    Returns:
+        Dict con 'elapsed' (segundos), 'max_rss_mb' y 'size_mb' del PDF
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = str(Path(tmp) / "benchmark.pdf")
+        completed = subprocess.run(
+            [sys.executable, "-c", _CHILD_SCRIPT, str(total_tests), str(module_count), filename],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    """Ejecuta el benchmark para cada tamaño y muestra el costo por test"""
+    parser = argparse.ArgumentParser(description="Mide la generación del reporte PDF con tests sintéticos")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[5000, 20000, 50000],
+        help="Cantidades de tests a generar (una ejecución por cantidad)"
+    )
+    parser.add_argument("--modules", type=int, default=1, help="Módulos entre los que se reparten los tests")
+    args = parser.parse_args(argv)
+
+    results: List[Dict[str, Any]] = []
+    for size in args.sizes:
+        result = measure_report(size, args.modules)
+        results.append(result)
+        print(
+            f"{size:>7} tests: {result['elapsed']:.1f}s "
+            f"({1000 * result['elapsed'] / size:.2f} ms/test), "
+            f"memoria máxima {result['max_rss_mb']:.0f} MB, PDF {result['size_mb']:.1f} MB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Cache en disco de las secciones del reporte PDF, por hash de contenido
+
+Cada módulo del reporte se renderiza como un fragmento PDF independiente (ver
+pdf_generator._generate_merged_report). La clave de cada fragmento es el hash
+de los datos visibles de sus tests y de la configuración de estilos, por lo que
+al volver a generar el reporte solo se renderizan los módulos que cambiaron;
+el resto se reutiliza y solo se vuelve a unir.
+"""
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+import reportlab
+
+REPORT_CACHE_DIR = Path(".nutripae") / "report_cache"
+
+# Campos de cada test que aparecen en el PDF: cambios en otros (ej. nodeid) no invalidan
+_RENDERED_FIELDS = ('test_id', 'name', 'description', 'expected_result', 'actual_result', 'outcome', 'duration')
+
+# Archivos que definen estilos, tablas y maquetación de las secciones
+_LAYOUT_SOURCES = ('pdf_styles.py', 'pdf_tables.py', 'pdf_generator.py')
+
+_fingerprint: Optional[str] = None
+
+
+def style_fingerprint() -> str:
+    """
+    Hash de la configuración de estilos y maquetación del PDF
+
+    Incluye el código de estilos, tablas y generador y la versión de ReportLab,
+    de modo que cualquier cambio de formato invalida todo el cache.
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256(reportlab.Version.encode())
+        for name in _LAYOUT_SOURCES:
+            digest.update((Path(__file__).parent / name).read_bytes())
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+
+def module_cache_key(module_name: str, tests, first: bool, chunk_rows: int) -> str:
+    """
+    Clave de cache de la sección de un módulo
+
+    Args:
+        module_name: Nombre del módulo
+        tests: Tests del módulo en el orden del reporte
+        first: Si es el primer módulo (su sección incluye el título de detalles)
+        chunk_rows: Máximo de filas por tabla de detalle
+
+    Returns:
+        Hash hexadecimal de los datos del módulo y la configuración de estilos
+    """
+    digest = hashlib.sha256(style_fingerprint().encode())
+    digest.update(json.dumps([module_name, first, chunk_rows], ensure_ascii=False).encode())
+    for test in tests:
+        digest.update(json.dumps([test[field] for field in _RENDERED_FIELDS], ensure_ascii=False).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class ReportCache:
+    """
+    Directorio con un PDF por sección de módulo, nombrado por su clave
+
+    Las entradas se escriben de forma atómica y se les actualiza el mtime al
+    reutilizarlas, para poder eliminar las que llevan tiempo sin usarse.
+    """
+
+    def __init__(self, directory: Union[str, Path] = REPORT_CACHE_DIR):
+        self.directory = Path(directory)
+
+    def path_for(self, key: str) -> Path:
+        """Ruta de la entrada de una clave"""
+        return self.directory / f"{key}.pdf"
+
+    def get(self, key: str) -> Optional[Path]:
+        """
+        Retorna la sección guardada para la clave, o None si no existe
+        """
+        path = self.path_for(key)
+        if not path.exists():
+            return None
+        path.touch()
+        return path
+
+    def store(self, key: str, fragment: Union[str, Path]) -> Path:
+        """
+        Guarda un fragmento renderizado bajo la clave
+
+        Returns:
+            Ruta de la entrada en el cache
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(fragment, tmp_path)
+        os.replace(tmp_path, path)
+        return path
+
+    def prune(self, max_age_days: float = 30) -> int:
+        """
+        Elimina las entradas que no se usan hace más de max_age_days días
+
+        Returns:
+            Cantidad de entradas eliminadas
+        """
+        if not self.directory.exists():
+            return 0
+        limit = time.time() - max_age_days * 86400
+        removed = 0
+        for path in self.directory.glob("*.pdf"):
+            if path.stat().st_mtime < limit:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
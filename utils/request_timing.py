@@ -0,0 +1,70 @@
+"""
+Estadísticas de latencia por endpoint a partir de las peticiones de cada test
+
+Los clientes de tests/http_clients.py registran cada petición (método, host,
+ruta con los IDs reemplazados por {id}, status, bytes y tiempo) y quedan en el
+TestRecord de su test. Aquí se agrupan por endpoint para todo el reporte, de
+modo que se vea qué endpoints de los backends son lentos y no solo qué tests
+lo son (la duración de un test incluye toda su cadena de fixtures).
+"""
+import math
+from typing import Dict, List, Sequence, Tuple
+
+# Endpoints que se muestran en el PDF (los de mayor p95)
+ENDPOINT_TABLE_ROWS = 25
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """
+    Percentil por rango más cercano
+
+    Args:
+        sorted_values: Valores ordenados de menor a mayor (no vacío)
+        pct: Percentil entre 0 y 100
+
+    Returns:
+        Valor de la muestra en ese percentil
+    """
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def endpoint_stats(modules) -> List[Dict[str, object]]:
+    """
+    Calcula la latencia por endpoint de todas las peticiones de los tests
+
+    Args:
+        modules: Dict con módulos y sus tests organizados
+
+    Returns:
+        Lista ordenada por p95 descendente; cada elemento tiene method, host,
+        path, count, p50_ms, p95_ms, p99_ms, max_ms, avg_bytes y status
+        (cantidad de respuestas por código)
+    """
+    groups: Dict[Tuple[str, str, str], List[dict]] = {}
+    for tests in modules.values():
+        for test in tests:
+            for request in test.get('http_requests') or ():
+                key = (request['method'], request['host'], request['path'])
+                groups.setdefault(key, []).append(request)
+
+    stats = []
+    for (method, host, path), requests in groups.items():
+        elapsed = sorted(request['elapsed'] * 1000 for request in requests)
+        status: Dict[str, int] = {}
+        for request in requests:
+            status[str(request['status'])] = status.get(str(request['status']), 0) + 1
+        stats.append({
+            'method': method,
+            'host': host,
+            'path': path,
+            'count': len(requests),
+            'p50_ms': round(percentile(elapsed, 50), 1),
+            'p95_ms': round(percentile(elapsed, 95), 1),
+            'p99_ms': round(percentile(elapsed, 99), 1),
+            'max_ms': round(elapsed[-1], 1),
+            'avg_bytes': round(sum(request['bytes'] for request in requests) / len(requests)),
+            'status': dict(sorted(status.items())),
+        })
+    stats.sort(key=lambda entry: entry['p95_ms'], reverse=True)
+    return stats
@@ -0,0 +1,140 @@
+"""
+Estado persistente para el modo de re-ejecución rápida
+
+Guarda los resultados de la última ejecución y el hash del contenido de cada
+archivo de tests. En modo rápido solo se vuelven a ejecutar los tests que
+fallaron la vez anterior (según el cache ``lastfailed`` de pytest) y los tests
+de archivos cuyo contenido cambió; los resultados nuevos se combinan con los
+resultados guardados de los tests que no se tocaron.
+"""
+import hashlib
+import json
+import shutil
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from .results_collector import iter_test_records, strip_group_suffix
+from .services import SERVICE_TEST_PATHS, get_service_for_path
+
+STATE_DIR = Path(".nutripae")
+LAST_RESULTS_FILE = STATE_DIR / "last_results.ndjson"
+FILE_HASHES_FILE = STATE_DIR / "file_hashes.json"
+LASTFAILED_FILE = Path(".pytest_cache") / "v" / "cache" / "lastfailed"
+
+
+def _is_test_module(path: str) -> bool:
+    name = PurePosixPath(path).name
+    return name.startswith("test_") and name.endswith(".py")
+
+
+def compute_file_hashes(root: Union[str, Path] = "tests") -> Dict[str, str]:
+    """
+    Calcula el hash SHA-256 de cada archivo Python bajo el directorio de tests
+
+    Returns:
+        Dict {ruta relativa: hash}
+    """
+    return {
+        path.as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in sorted(Path(root).rglob("*.py"))
+    }
+
+
+def load_last_failed() -> Set[str]:
+    """Carga los nodeids que fallaron en la última ejecución según el cache de pytest"""
+    if not LASTFAILED_FILE.exists():
+        return set()
+    try:
+        with open(LASTFAILED_FILE, "r") as f:
+            return {strip_group_suffix(nodeid) for nodeid in json.load(f)}
+    except (IOError, json.JSONDecodeError):
+        return set()
+
+
+def plan_fast_rerun(test_paths: List[str]) -> Optional[Tuple[List[str], Set[str]]]:
+    """
+    Calcula qué tests se deben volver a ejecutar
+
+    Args:
+        test_paths: Rutas de los servicios que forman la ejecución completa
+
+    Returns:
+        Tupla (argumentos para pytest, archivos re-ejecutados completos), o None
+        si no hay estado previo o cambió un archivo compartido por todos los
+        servicios y se necesita una ejecución completa.
+    """
+    if not LAST_RESULTS_FILE.exists() or not FILE_HASHES_FILE.exists():
+        return None
+
+    with open(FILE_HASHES_FILE, "r") as f:
+        previous_hashes = json.load(f)
+    current_hashes = compute_file_hashes()
+
+    changed = [path for path, digest in current_hashes.items() if previous_hashes.get(path) != digest]
+    targets: List[str] = []
+    rerun_files: Set[str] = set()
+
+    for path in changed:
+        if _is_test_module(path):
+            if get_service_for_path(path) is not None:
+                targets.append(path)
+                rerun_files.add(path)
+            continue
+
+        # conftest.py, config.py, páginas, etc.: se re-ejecuta el servicio completo
+        service = get_service_for_path(path)
+        if service is None:
+            print(f"Cambió un archivo compartido ({path}): se requiere ejecución completa")
+            return None
+        service_path = SERVICE_TEST_PATHS[service]
+        targets.append(service_path)
+        rerun_files.update(p for p in current_hashes if _is_test_module(p) and get_service_for_path(p) == service)
+
+    # Tests fallidos según pytest y tests cuyo servicio no estaba disponible
+    previous_failures = load_last_failed() | {
+        record['nodeid'] for record in iter_test_records(LAST_RESULTS_FILE)
+        if record.get('outcome') == 'unavailable'
+    }
+
+    services = {get_service_for_path(path) for path in test_paths}
+    for nodeid in sorted(previous_failures):
+        file_path = nodeid.split("::")[0]
+        if file_path in current_hashes and file_path not in rerun_files and get_service_for_path(file_path) in services:
+            targets.append(nodeid)
+
+    return targets, rerun_files
+
+
+def merge_results(new_results: Union[str, Path], rerun_files: Set[str], output_path: Union[str, Path]):
+    """
+    Combina los resultados nuevos con los guardados de la última ejecución
+
+    Los tests de archivos re-ejecutados completos y los tests re-ejecutados
+    individualmente se reemplazan; se descartan los de archivos eliminados.
+
+    Args:
+        new_results: Archivo NDJSON con los resultados de la re-ejecución
+        rerun_files: Archivos de tests que se re-ejecutaron completos
+        output_path: Archivo NDJSON donde se escribe el resultado combinado
+    """
+    new_nodeids = {record['nodeid'] for record in iter_test_records(new_results)}
+    merged_path = Path(output_path).with_suffix(".merged")
+
+    with open(merged_path, "w", encoding="utf-8") as out:
+        for record in iter_test_records(LAST_RESULTS_FILE):
+            file_path = record['nodeid'].split("::")[0]
+            if record['nodeid'] in new_nodeids or file_path in rerun_files or not Path(file_path).exists():
+                continue
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        for record in iter_test_records(new_results):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    shutil.move(merged_path, output_path)
+
+
+def save_run_state(results: Union[str, Path]):
+    """Guarda los resultados completos y los hashes actuales para la próxima re-ejecución"""
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(results, LAST_RESULTS_FILE)
+    with open(FILE_HASHES_FILE, "w") as f:
+        json.dump(compute_file_hashes(), f, indent=2)
@@ -0,0 +1,167 @@
+"""
+Plugin de pytest que emite los resultados de los tests como un stream NDJSON
+"""
+import json
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, Union
+
+RESULTS_FILE = "test_results.ndjson"
+
+
+class ResultsCollector:
+    """
+    Plugin que agrupa los reportes de setup, call y teardown de cada test
+    en un registro con el mismo formato que genera pytest-json-report.
+
+    Cada registro se escribe como una línea NDJSON apenas termina el teardown
+    del test, por lo que en memoria solo quedan los tests en ejecución.
+    """
+
+    def __init__(self, output_path: Union[str, Path] = RESULTS_FILE):
+        self.output_path = Path(output_path)
+        self.exitcode = None
+        self.counts: Dict[str, int] = {}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._stream = None
+
+    def pytest_sessionstart(self, session):
+        """Abre el archivo NDJSON donde se emiten los resultados"""
+        self._stream = open(self.output_path, "w", encoding="utf-8")
+
+    def pytest_runtest_logreport(self, report):
+        """Acumula cada fase del test y emite el registro en el teardown"""
+        nodeid = strip_group_suffix(report.nodeid)
+        record = self._pending.setdefault(nodeid, {
+            'nodeid': nodeid,
+            'outcome': 'passed',
+        })
+        record[report.when] = {
+            'duration': report.duration,
+            'outcome': report.outcome,
+        }
+        if report.longrepr:
+            record[report.when]['longrepr'] = report.longreprtext
+        if getattr(report, 'http_requests', None):
+            # Peticiones HTTP de la fase, registradas por tests/http_clients.py
+            record[report.when]['http_requests'] = report.http_requests
+        if getattr(report, 'test_id', None):
+            record['test_id'] = report.test_id
+        if getattr(report, 'test_info', None):
+            # Metadata de @add_test_info, adjuntada por tests/conftest.py
+            record['test_info'] = report.test_info
+
+        if getattr(report, 'service_unavailable', None):
+            # Test omitido por el circuit breaker o el pre-flight: resultado propio
+            record['outcome'] = 'unavailable'
+            record['unavailable_service'] = report.service_unavailable
+        elif report.when == 'call':
+            record['outcome'] = report.outcome
+        elif report.outcome != 'passed' and record['outcome'] == 'passed':
+            # Fallas en setup/teardown se reportan como 'error', igual que pytest-json-report
+            record['outcome'] = 'error' if report.failed else report.outcome
+
+        if report.when == 'teardown':
+            self._emit(self._pending.pop(nodeid))
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        """Emite los registros incompletos y cierra el stream"""
+        self.exitcode = int(exitstatus)
+        for record in self._pending.values():
+            self._emit(record)
+        self._pending.clear()
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _emit(self, record: Dict[str, Any]):
+        """Escribe un registro en el stream y avisa de inmediato si falló"""
+        outcome = record['outcome']
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
+
+        if self._stream is not None:
+            self._stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._stream.flush()
+
+        if outcome in ('failed', 'error'):
+            longrepr = next(
+                (record[when]['longrepr'] for when in ('call', 'setup', 'teardown')
+                 if record.get(when, {}).get('longrepr')),
+                ''
+            )
+            lines = longrepr.strip().splitlines()
+            print(f"\n✗ {record['nodeid']}: {lines[-1] if lines else outcome}")
+
+
+def strip_group_suffix(nodeid: str) -> str:
+    """
+    Elimina el sufijo "@grupo" que pytest-xdist agrega al nodeid con --dist loadgroup
+
+    Args:
+        nodeid: Nodeid reportado por pytest
+
+    Returns:
+        Nodeid original del test
+    """
+    if nodeid.rfind("@") > nodeid.rfind("]"):
+        return nodeid.rsplit("@", 1)[0]
+    return nodeid
+
+
+def iter_test_records(test_results: Union[Dict[str, Any], str, Path, Iterable[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+    """
+    Itera los registros de tests sin cargarlos todos en memoria
+
+    Args:
+        test_results: Dict con formato pytest-json-report, ruta a un archivo
+            NDJSON o iterable de registros
+
+    Returns:
+        Iterador de registros de tests
+    """
+    if isinstance(test_results, dict):
+        yield from test_results.get('tests', [])
+    elif isinstance(test_results, (str, Path)):
+        with open(test_results, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        yield from test_results
+
+
+def iter_stored_results(paths: Iterable[Union[str, Path]]) -> Iterator[Dict[str, Any]]:
+    """
+    Combina los resultados guardados de una o varias ejecuciones
+
+    Acepta streams NDJSON (de ResultsCollector o .nutripae/last_results.ndjson)
+    y reportes .json de pytest-json-report. Sirve para unir los resultados de
+    ejecuciones por partes o de otros hosts: si un test aparece en varios
+    archivos se conserva el registro del último.
+
+    Args:
+        paths: Archivos de resultados en orden de prioridad creciente
+
+    Returns:
+        Iterador de registros de tests, uno por nodeid
+
+    Raises:
+        FileNotFoundError: Si algún archivo no existe
+    """
+    records: Dict[str, Dict[str, Any]] = {}
+    for path in paths:
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"No se encontró el archivo de resultados: {path}")
+        for record in iter_test_records(_load_results_file(path)):
+            nodeid = strip_group_suffix(record.get('nodeid', ''))
+            records.pop(nodeid, None)
+            records[nodeid] = record
+    yield from records.values()
+
+
+def _load_results_file(path: Path) -> Union[Dict[str, Any], Path]:
+    """Carga un reporte .json completo; los streams NDJSON se leen de forma incremental"""
+    if path.suffix == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return path
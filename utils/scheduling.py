@@ -0,0 +1,87 @@
+"""
+Plugin de pytest que ordena los tests según su duración histórica
+
+Se carga con ``-p utils.scheduling``. En cada worker de pytest-xdist ordena las
+unidades de trabajo (grupo xdist o archivo) de la más larga a la más corta, de
+modo que el scheduler de xdist las reparte como longest-processing-time-first.
+El orden interno de cada unidad se conserva porque los tests de un mismo
+archivo dependen entre sí (ids creados en tests anteriores).
+
+Las duraciones se buscan por nodeid sin el sufijo @grupo de xdist: los
+test_id se repiten entre servicios y solo se adjuntan al reporte para mostrarlos.
+"""
+import heapq
+from statistics import median
+from typing import Dict, List, Tuple
+
+import pytest
+
+from .results_collector import strip_group_suffix
+from .test_history import TestHistory
+
+_durations_key = pytest.StashKey[Dict[str, float]]()
+
+
+def get_item_test_id(item) -> str:
+    """Retorna el test_id definido con @add_test_info o el nodeid del test"""
+    marker = item.get_closest_marker("test_info")
+    test_id = marker.kwargs.get("test_id") if marker is not None else None
+    return test_id or strip_group_suffix(item.nodeid)
+
+
+def get_work_unit(item) -> str:
+    """Retorna la unidad de trabajo de xdist: nombre del grupo o archivo del test"""
+    marker = item.get_closest_marker("xdist_group")
+    if marker is not None:
+        return marker.args[0] if marker.args else marker.kwargs["name"]
+    return item.nodeid.split("::")[0]
+
+
+def lpt_schedule(durations: Dict[str, float], workers: int) -> List[Tuple[float, List[str]]]:
+    """
+    Asigna unidades de trabajo a workers con longest-processing-time-first
+
+    Args:
+        durations: Dict {unidad: duración esperada}
+        workers: Número de workers disponibles
+
+    Returns:
+        Lista (carga total, unidades) por worker
+    """
+    heap = [(0.0, index, []) for index in range(max(workers, 1))]
+    for unit, duration in sorted(durations.items(), key=lambda entry: -entry[1]):
+        load, index, units = heapq.heappop(heap)
+        units.append(unit)
+        heapq.heappush(heap, (load + duration, index, units))
+    return [(load, units) for load, _, units in sorted(heap, key=lambda entry: entry[1])]
+
+
+def pytest_configure(config):
+    """Carga las duraciones esperadas desde el historial"""
+    config.stash[_durations_key] = TestHistory().expected_durations()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    """Ordena las unidades de trabajo de mayor a menor duración esperada"""
+    durations = config.stash[_durations_key]
+    if not hasattr(config, "workerinput") or not durations:
+        return
+
+    default = median(durations.values())
+    units: Dict[str, List] = {}
+    totals: Dict[str, float] = {}
+    for item in items:
+        unit = get_work_unit(item)
+        units.setdefault(unit, []).append(item)
+        totals[unit] = totals.get(unit, 0.0) + durations.get(strip_group_suffix(item.nodeid), default)
+
+    ordered_units = sorted(units, key=lambda unit: -totals[unit])
+    items[:] = [item for unit in ordered_units for item in units[unit]]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Adjunta el test_id al reporte para mostrarlo en el historial y los reportes"""
+    outcome = yield
+    outcome.get_result().test_id = get_item_test_id(item)
@@ -0,0 +1,86 @@
+"""
+Catálogo de servicios de NutriPAE y sus directorios de tests
+"""
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Cada servicio se ejecuta como un grupo independiente (mismo worker en modo paralelo)
+SERVICE_TEST_PATHS: Dict[str, str] = {
+    "auth": "tests/auth/",
+    "cobertura": "tests/cobertura/",
+    "compras": "tests/compras/",
+    "menus": "tests/menus/",
+    "ui-menus": "tests/ui/menus",
+    "ui-rh": "tests/ui/rh",
+    "rh": "tests/rh",
+    "ui-cobertura": "tests/ui/cobertura-ui",
+}
+
+# Variable de tests/config.Settings con la URL base que usa cada servicio
+SERVICE_BASE_URL_SETTINGS: Dict[str, str] = {
+    "auth": "BASE_AUTH_BACKEND_URL",
+    "cobertura": "BASE_COVERAGE_BACKEND_URL",
+    "compras": "BASE_COMPRAS_BACKEND_URL",
+    "menus": "BASE_MENUS_BACKEND_URL",
+    "ui-menus": "BASE_FRONTEND_URL",
+    "ui-rh": "BASE_FRONTEND_URL",
+    "rh": "BASE_RH_BACKEND_URL",
+    "ui-cobertura": "BASE_FRONTEND_URL",
+}
+
+# Endpoints de salud (relativos a la URL base) que exponen algunos servicios
+SERVICE_HEALTH_ENDPOINTS: Dict[str, List[str]] = {
+    "compras": ["/health", "/health/database"],
+    "menus": ["/health", "/health/database"],
+}
+
+# Todos los servicios necesitan el token del servicio de autenticación
+SERVICE_DEPENDENCIES: Dict[str, List[str]] = {
+    service: ["auth"] for service in SERVICE_TEST_PATHS if service != "auth"
+}
+
+
+def get_service_base_url(service: str) -> str:
+    """Obtiene la URL base configurada para un servicio"""
+    from tests.config import settings
+
+    return getattr(settings, SERVICE_BASE_URL_SETTINGS[service]).rstrip("/")
+
+
+def get_service_for_path(path: str) -> Optional[str]:
+    """
+    Obtiene el servicio al que pertenece un archivo o nodeid de test
+
+    Args:
+        path: Ruta relativa al proyecto (ej: "tests/compras/test_providers_api.py::test_x")
+
+    Returns:
+        Nombre del servicio o None si la ruta no pertenece a ningún servicio
+    """
+    parts = PurePosixPath(path.split("::")[0].replace("\\", "/")).parts
+    best_match = None
+    best_length = 0
+
+    for service, service_path in SERVICE_TEST_PATHS.items():
+        service_parts = PurePosixPath(service_path).parts
+        if parts[:len(service_parts)] == service_parts and len(service_parts) > best_length:
+            best_match = service
+            best_length = len(service_parts)
+
+    return best_match
+
+
+def get_service_for_item(item) -> Optional[str]:
+    """
+    Obtiene el servicio de un item de pytest a partir de su archivo
+
+    A diferencia del nodeid, la ruta del archivo no depende del rootdir que
+    elija pytest (ej: tests/compras/pytest.ini al ejecutar solo compras).
+    """
+    try:
+        relative_path = Path(item.path).resolve().relative_to(PROJECT_ROOT)
+    except ValueError:
+        return None
+    return get_service_for_path(relative_path.as_posix())
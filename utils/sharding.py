@@ -0,0 +1,20 @@
+"""
+Plugin de pytest que agrupa los tests por servicio para pytest-xdist
+
+Se carga en cada worker con ``-p utils.sharding`` junto con ``--dist loadgroup``,
+de modo que todos los tests de un servicio corren en el mismo worker y los
+fixtures con scope de módulo (ej: departamento → municipio → institución → sede
+en cobertura) se conservan.
+"""
+import pytest
+
+from .services import get_service_for_item
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, config, items):
+    """Marca cada test con el grupo xdist de su servicio"""
+    for item in items:
+        service = get_service_for_item(item)
+        if service:
+            item.add_marker(pytest.mark.xdist_group(name=service))
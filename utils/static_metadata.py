@@ -0,0 +1,182 @@
+"""
+Extracción estática de metadata de tests
+
+Lee los argumentos de ``@add_test_info(...)`` y los docstrings estructurados
+directamente del AST de cada archivo de tests, sin importarlo: no se ejecuta
+código de módulo ni se cargan dependencias como Selenium. Los resultados se
+guardan en disco por ruta y mtime del archivo, de modo que solo se vuelven a
+analizar los archivos modificados.
+"""
+import ast
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+STATIC_METADATA_CACHE = Path(".nutripae") / "static_metadata.json"
+
+METADATA_DECORATOR = "add_test_info"
+METADATA_FIELDS = ("description", "expected_result", "module", "test_id")
+
+# {ruta: {'mtime': int, 'tests': {función: metadata}}}
+_cache: Optional[Dict[str, Dict[str, Any]]] = None
+_dirty = False
+
+
+def parse_structured_docstring(docstring: str) -> Dict[str, str]:
+    """
+    Parsea un docstring estructurado
+
+    La primera línea es la descripción; las líneas ``Expected:``, ``Module:`` e
+    ``ID:`` aportan el resto de los campos.
+
+    Args:
+        docstring: Docstring ya normalizado (sin indentación común)
+
+    Returns:
+        Dict con los campos encontrados
+    """
+    lines = docstring.strip().split('\n')
+    metadata = {'description': lines[0].strip()}
+
+    for line in lines[1:]:
+        line = line.strip()
+        if line.startswith('Expected:'):
+            metadata['expected_result'] = line.replace('Expected:', '').strip()
+        elif line.startswith('Module:'):
+            metadata['module'] = line.replace('Module:', '').strip()
+        elif line.startswith('ID:'):
+            metadata['test_id'] = line.replace('ID:', '').strip()
+
+    return metadata
+
+
+def _decorator_name(node: ast.expr) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _literal(node: ast.expr):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return None
+
+
+def extract_function_metadata(node) -> Optional[Dict[str, Any]]:
+    """Metadata de una función: argumentos de @add_test_info o, si no tiene, su docstring"""
+    for decorator in node.decorator_list:
+        if isinstance(decorator, ast.Call) and _decorator_name(decorator.func) == METADATA_DECORATOR:
+            metadata = dict.fromkeys(METADATA_FIELDS)
+            for field, arg in zip(METADATA_FIELDS, decorator.args):
+                metadata[field] = _literal(arg)
+            for keyword in decorator.keywords:
+                if keyword.arg in metadata:
+                    metadata[keyword.arg] = _literal(keyword.value)
+            return metadata
+
+    docstring = ast.get_docstring(node)
+    if docstring:
+        return parse_structured_docstring(docstring)
+    return None
+
+
+def iter_test_functions(tree: ast.Module, prefix: str = ""):
+    """
+    Recorre las funciones de test que pytest recolecta de un módulo
+
+    Incluye las funciones ``test*`` del módulo y las de las clases ``Test*``
+    (también anidadas).
+
+    Args:
+        tree: AST del módulo
+        prefix: Prefijo de nodeid de las clases contenedoras (uso interno)
+
+    Yields:
+        Tuplas (nombre calificado "Clase::función", nodo de la función)
+    """
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test"):
+            yield f"{prefix}{node.name}", node
+        elif isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+            yield from iter_test_functions(node, f"{prefix}{node.name}::")
+
+
+def parse_file(path) -> ast.Module:
+    """Parsea un archivo Python sin importarlo"""
+    with open(path, "rb") as f:
+        return ast.parse(f.read(), filename=str(path))
+
+
+def extract_file_metadata(path) -> Dict[str, Dict[str, Any]]:
+    """
+    Analiza un archivo de tests sin importarlo
+
+    Args:
+        path: Ruta del archivo de tests
+
+    Returns:
+        Dict {nombre de función: metadata} con las funciones de test del archivo,
+        incluidas las definidas dentro de clases
+    """
+    tests = {}
+    for _, node in iter_test_functions(parse_file(path)):
+        metadata = extract_function_metadata(node)
+        if metadata is not None:
+            tests[node.name] = metadata
+    return tests
+
+
+def _load_cache() -> Dict[str, Dict[str, Any]]:
+    global _cache
+    if _cache is None:
+        _cache = {}
+        if STATIC_METADATA_CACHE.exists():
+            try:
+                with open(STATIC_METADATA_CACHE, "r", encoding="utf-8") as f:
+                    _cache = json.load(f)
+            except (IOError, json.JSONDecodeError):
+                _cache = {}
+    return _cache
+
+
+def get_file_metadata(module_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Retorna la metadata estática de un archivo, usando el cache si su mtime no cambió
+
+    Args:
+        module_path: Ruta del archivo de tests (ej: "tests/compras/test_inventory_api.py")
+
+    Returns:
+        Dict {nombre de función: metadata}
+
+    Raises:
+        OSError: Si el archivo no existe
+        SyntaxError: Si el archivo no se puede parsear
+    """
+    global _dirty
+    cache = _load_cache()
+    mtime = os.stat(module_path).st_mtime_ns
+
+    entry = cache.get(module_path)
+    if entry is None or entry['mtime'] != mtime:
+        entry = {'mtime': mtime, 'tests': extract_file_metadata(module_path)}
+        cache[module_path] = entry
+        _dirty = True
+    return entry['tests']
+
+
+def save_static_metadata_cache():
+    """Guarda el cache en disco si se analizó algún archivo nuevo o modificado"""
+    global _dirty
+    if not _dirty:
+        return
+    STATIC_METADATA_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = STATIC_METADATA_CACHE.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(_cache, f, ensure_ascii=False)
+    os.replace(tmp_path, STATIC_METADATA_CACHE)
+    _dirty = False
@@ -0,0 +1,107 @@
+"""
+Historial persistente de duraciones y resultados de tests
+"""
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, Union
+
+HISTORY_DB = Path(".nutripae") / "test_history.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test_id TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    setup_duration REAL NOT NULL DEFAULT 0,
+    call_duration REAL NOT NULL DEFAULT 0,
+    teardown_duration REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, nodeid)
+);
+CREATE INDEX IF NOT EXISTS idx_results_test_id ON results(test_id);
+"""
+
+
+class TestHistory:
+    """
+    Almacén SQLite con las duraciones de setup, call y teardown de cada
+    ejecución, indexado por nodeid (sin el sufijo @grupo de xdist).
+
+    El test_id definido en @add_test_info se guarda solo para mostrarlo: no es
+    único entre servicios (ej. VAL-001 existe en compras y en menús).
+    """
+
+    __test__ = False  # Evita que pytest lo confunda con una clase de tests
+
+    def __init__(self, db_path: Union[str, Path] = HISTORY_DB):
+        self.db_path = Path(db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_path)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def record_run(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Guarda los resultados de una ejecución completa
+
+        Args:
+            records: Registros de tests (formato pytest-json-report). Si un
+                registro no tiene 'test_id' se guarda su nodeid en esa columna.
+
+        Returns:
+            ID de la ejecución registrada
+        """
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (started_at) VALUES (?)",
+                (datetime.now().isoformat(timespec="seconds"),)
+            )
+            run_id = cursor.lastrowid
+            connection.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        run_id,
+                        record.get("test_id") or record["nodeid"],
+                        record["nodeid"],
+                        record.get("outcome", "unknown"),
+                        record.get("setup", {}).get("duration", 0),
+                        record.get("call", {}).get("duration", 0),
+                        record.get("teardown", {}).get("duration", 0),
+                    )
+                    for record in records
+                )
+            )
+        return run_id
+
+    def expected_durations(self, last_runs: int = 5) -> Dict[str, float]:
+        """
+        Calcula la duración esperada (setup + call + teardown) de cada test
+
+        Args:
+            last_runs: Número de ejecuciones recientes a promediar
+
+        Returns:
+            Dict {nodeid: duración promedio en segundos}
+        """
+        if not self.db_path.exists():
+            return {}
+
+        with self._connect() as connection:
+            rows = connection.execute(
+                """
+                SELECT nodeid, AVG(setup_duration + call_duration + teardown_duration)
+                FROM results
+                WHERE run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)
+                GROUP BY nodeid
+                """,
+                (last_runs,)
+            ).fetchall()
+        return dict(rows)
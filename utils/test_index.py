@@ -0,0 +1,122 @@
+"""
+Índice persistente de tests: test_id, módulo y servicio → nodeid de pytest
+
+Se construye desde el AST de los archivos de tests (sin importarlos ni
+recolectar con pytest) y se actualiza de forma incremental: solo se vuelven a
+analizar los archivos cuyo hash cambió. Permite seleccionar tests por ID
+(``--id 'INV-MOV-0*'``), módulo (``--module Compras``) o servicio sin
+recolectar todo el árbol.
+"""
+import json
+import os
+import unicodedata
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional
+
+from .rerun_cache import STATE_DIR, compute_file_hashes
+from .services import get_service_for_path
+from .static_metadata import extract_function_metadata, iter_test_functions, parse_file
+
+TEST_INDEX_FILE = STATE_DIR / "test_index.json"
+
+
+def _index_file(path: str) -> List[Dict[str, Any]]:
+    """Tests de un archivo con su nodeid, test_id y módulo"""
+    entries = []
+    for qualified_name, node in iter_test_functions(parse_file(path)):
+        metadata = extract_function_metadata(node) or {}
+        entries.append({
+            'nodeid': f"{path}::{qualified_name}",
+            'test_id': metadata.get('test_id'),
+            'module': metadata.get('module'),
+        })
+    return entries
+
+
+def load_test_index() -> List[Dict[str, Any]]:
+    """
+    Carga el índice, re-analizando solo los archivos nuevos o modificados
+
+    Returns:
+        Lista de tests {'nodeid', 'test_id', 'module', 'service'}. Los tests
+        parametrizados aparecen una vez, con el nodeid de su función.
+    """
+    index = {}
+    if TEST_INDEX_FILE.exists():
+        try:
+            with open(TEST_INDEX_FILE, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (IOError, json.JSONDecodeError):
+            index = {}
+
+    current_hashes = {
+        path: digest for path, digest in compute_file_hashes().items()
+        if Path(path).name.startswith("test_") and get_service_for_path(path) is not None
+    }
+
+    changed = False
+    for path, digest in current_hashes.items():
+        entry = index.get(path)
+        if entry is None or entry['hash'] != digest:
+            index[path] = {'hash': digest, 'tests': _index_file(path)}
+            changed = True
+    for path in set(index) - set(current_hashes):
+        del index[path]
+        changed = True
+
+    if changed:
+        TEST_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = TEST_INDEX_FILE.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+        os.replace(tmp_path, TEST_INDEX_FILE)
+
+    return [
+        dict(test, service=get_service_for_path(path))
+        for path in sorted(index)
+        for test in index[path]['tests']
+    ]
+
+
+def _normalize(text: str) -> str:
+    """Compara sin distinguir mayúsculas ni tildes (ej: "menus" == "Menús")"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def select_tests(
+    ids: Optional[Iterable[str]] = None,
+    modules: Optional[Iterable[str]] = None,
+    services: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """
+    Selecciona nodeids desde el índice
+
+    Dentro de cada criterio basta que coincida un valor; si se indican varios
+    criterios el test debe cumplir todos.
+
+    Args:
+        ids: Patrones de test_id con comodines de shell (ej: "INV-MOV-0*")
+        modules: Nombres de módulo de la metadata (ej: "Compras")
+        services: Servicios de utils.services.SERVICE_TEST_PATHS (ej: "ui-menus")
+
+    Returns:
+        Lista de nodeids en el orden del índice (archivo y posición en el archivo)
+    """
+    id_patterns = [_normalize(pattern) for pattern in ids or []]
+    module_names = {_normalize(module) for module in modules or []}
+    service_names = set(services or [])
+
+    selected = []
+    for test in load_test_index():
+        if id_patterns and not (
+            test['test_id'] and any(fnmatchcase(_normalize(test['test_id']), pattern) for pattern in id_patterns)
+        ):
+            continue
+        if module_names and not (test['module'] and _normalize(test['module']) in module_names):
+            continue
+        if service_names and test['service'] not in service_names:
+            continue
+        selected.append(test['nodeid'])
+    return selected
@@ -1,17 +1,34 @@
 """
 Extractor de metadata de tests
 """
-import importlib
-import inspect
+import functools
 import json
 import os
 
+from .static_metadata import get_file_metadata
+from .test_records import TestRecord, TestRecordTable
+
+REQUIRED_METADATA_FIELDS = ('description', 'expected_result', 'module', 'test_id')
+
 
 class MetadataError(Exception):
     """Excepción para errores de metadata de tests"""
     pass
 
 
+class DuplicateTestIdError(MetadataError):
+    """test_id repetidos entre tests de un mismo servicio"""
+
+    def __init__(self, message, duplicates):
+        """
+        Args:
+            message: Descripción de los duplicados
+            duplicates: Dict {(servicio, test_id): [nodeid, ...]}
+        """
+        super().__init__(message)
+        self.duplicates = duplicates
+
+
 _metadata_registry = None
 
 def _load_metadata_registry():
@@ -29,6 +46,7 @@ def _load_metadata_registry():
     return _metadata_registry
 
 
+@functools.lru_cache(maxsize=None)
 def extract_test_metadata_from_source(module_path: str, function_name: str):
     """
     Extrae metadata desde el registro de metadata generado por pytest.
@@ -38,7 +56,7 @@ def extract_test_metadata_from_source(module_path: str, function_name: str):
         function_name: Nombre de la función de test
         
     Returns:
-        Dict con metadata del test
+        Dict con metadata del test (memoizado por módulo y función)
         
     Raises:
         MetadataError: Si no se puede extraer metadata completa
@@ -53,7 +71,7 @@ def extract_test_metadata_from_source(module_path: str, function_name: str):
         return _extract_from_docstring_fallback(module_path, function_name)
 
     # Validar que todos los campos obligatorios estén presentes
-    missing_fields = [field for field in ['description', 'expected_result', 'module', 'test_id'] if not metadata.get(field)]
+    missing_fields = [field for field in REQUIRED_METADATA_FIELDS if not metadata.get(field)]
     
     if missing_fields:
         raise MetadataError(
@@ -65,30 +83,18 @@ def extract_test_metadata_from_source(module_path: str, function_name: str):
 
 def _extract_from_docstring_fallback(module_path: str, function_name: str):
     """
-    Fallback para extraer metadata del docstring si el registro no está disponible.
+    Fallback para extraer metadata si el registro no está disponible.
+
+    Lee @add_test_info o el docstring estructurado desde el AST del archivo, sin
+    importarlo (ver utils/static_metadata.py).
     """
     try:
-        module_name = module_path.replace('/', '.').replace('-', '_').replace('.py', '')
-        module = importlib.import_module(module_name)
-        test_function = getattr(module, function_name, None)
+        metadata = get_file_metadata(module_path).get(function_name)
         
-        if not test_function or not inspect.getdoc(test_function):
-            raise MetadataError(f"No se encontró docstring para {function_name} en {module_path}")
+        if not metadata:
+            raise MetadataError(f"No se encontró @add_test_info ni docstring para {function_name} en {module_path}")
 
-        docstring = inspect.getdoc(test_function)
-        lines = docstring.strip().split('\n')
-        metadata = {'description': lines[0].strip()}
-        
-        for line in lines[1:]:
-            line = line.strip()
-            if line.startswith('Expected:'):
-                metadata['expected_result'] = line.replace('Expected:', '').strip()
-            elif line.startswith('Module:'):
-                metadata['module'] = line.replace('Module:', '').strip()
-            elif line.startswith('ID:'):
-                metadata['test_id'] = line.replace('ID:', '').strip()
-
-        missing_fields = [field for field in ['description', 'expected_result', 'module', 'test_id'] if not metadata.get(field)]
+        missing_fields = [field for field in REQUIRED_METADATA_FIELDS if not metadata.get(field)]
         if missing_fields:
             raise MetadataError(
                 f"Test {function_name} en {module_path} no tiene los campos obligatorios en el docstring: {', '.join(missing_fields)}."
@@ -136,26 +142,31 @@ def parse_test_info(test):
         test: Resultado de test desde pytest JSON
         
     Returns:
-        Dict con información procesada del test
+        TestRecord con información procesada del test
         
     Raises:
         MetadataError: Si no se puede extraer metadata completa
     """
-    # Extraer nombre del test
-    test_name = test.get('nodeid', '').split('::')[-1] if '::' in test.get('nodeid', '') else test.get('nodeid', '')
+    nodeid = test.get('nodeid', '')
+    parts = nodeid.split('::')
     
-    # Extraer módulo
-    module_path = test.get('nodeid', '').split('::')[0] if '::' in test.get('nodeid', '') else ''
+    # Extraer nombre del test y módulo
+    test_name = parts[-1]
+    module_path = parts[0] if len(parts) > 1 else ''
     
     if not test_name:
-        raise MetadataError(f"No se pudo extraer nombre del test de: {test.get('nodeid', 'nodeid desconocido')}")
+        raise MetadataError(f"No se pudo extraer nombre del test de: {nodeid or 'nodeid desconocido'}")
     
     if not module_path:
-        raise MetadataError(f"No se pudo extraer ruta del módulo de: {test.get('nodeid', 'nodeid desconocido')}")
+        raise MetadataError(f"No se pudo extraer ruta del módulo de: {nodeid or 'nodeid desconocido'}")
     
-    # Extraer metadata del código fuente (obligatorio)
+    # La metadata guardada con el resultado (marker test_info) no requiere el
+    # código fuente; si falta, se extrae del código (los tests parametrizados
+    # comparten la metadata de su función)
+    source_metadata = test.get('test_info') or {}
     try:
-        source_metadata = extract_test_metadata_from_source(module_path, test_name)
+        if not all(source_metadata.get(field) for field in REQUIRED_METADATA_FIELDS):
+            source_metadata = extract_test_metadata_from_source(module_path, test_name.split('[')[0])
     except MetadataError:
         # Re-lanzar la excepción con contexto adicional
         raise MetadataError(
@@ -164,31 +175,38 @@ def parse_test_info(test):
             f"con todos los campos obligatorios: description, expected_result, module, test_id"
         )
     
-    # Usar metadata del código fuente
-    description = source_metadata['description']
-    expected_result = source_metadata['expected_result']
-    module_name = source_metadata['module']
-    test_id = source_metadata['test_id']
-    
-    # Resultado del test
-    outcome = test.get('outcome', 'unknown')
-    
-    # Resultado actual del test
-    actual_result = extract_actual_result(test)
-    
     # Duración real del test
     duration = test.get('call', {}).get('duration', 0)
     
-    return {
-        'name': test_name,
-        'module': module_name,
-        'description': description,
-        'expected_result': expected_result,
-        'actual_result': actual_result,
-        'outcome': outcome,
-        'duration': round(duration, 3),
-        'test_id': test_id
-    }
+    return TestRecord(
+        nodeid=nodeid,
+        name=test_name,
+        module=source_metadata['module'],
+        description=source_metadata['description'],
+        expected_result=source_metadata['expected_result'],
+        actual_result=extract_actual_result(test),
+        outcome=test.get('outcome', 'unknown'),
+        duration=round(duration, 3),
+        test_id=source_metadata['test_id'],
+        http_requests=extract_http_requests(test),
+    )
+
+
+def extract_http_requests(test):
+    """
+    Extrae las peticiones HTTP registradas en cada fase del test
+
+    Args:
+        test: Resultado de test desde pytest JSON
+
+    Returns:
+        Lista de peticiones, cada una con la fase en que se hizo ('when')
+    """
+    return [
+        {**request, 'when': when}
+        for when in ('setup', 'call', 'teardown')
+        for request in test.get(when, {}).get('http_requests', ())
+    ]
 
 
 def extract_actual_result(test):
@@ -211,6 +229,8 @@ def extract_actual_result(test):
         return f"Test falló: {longrepr}"
     elif test.get('outcome') == 'skipped':
         return 'Test fue omitido'
+    elif test.get('outcome') == 'unavailable':
+        return f"Servicio no disponible: {test.get('unavailable_service', 'desconocido')}"
     else:
         return 'Estado desconocido'
 
@@ -220,24 +240,21 @@ def validate_all_tests_have_metadata(test_results):
     Valida que todos los tests tengan metadata completa
     
     Args:
-        test_results: Resultados de pytest JSON
+        test_results: Resultados de pytest (dict JSON, ruta NDJSON, iterable de
+            registros o TestRecordTable ya construida)
+        
+    Returns:
+        TestRecordTable con los tests procesados, para reutilizarla sin volver a parsear
         
     Raises:
         MetadataError: Si algún test no tiene metadata completa
     """
-    missing_metadata_tests = []
+    table = test_results if isinstance(test_results, TestRecordTable) else TestRecordTable.from_results(test_results)
     
-    for test in test_results.get('tests', []):
-        test_name = test.get('nodeid', '').split('::')[-1] if '::' in test.get('nodeid', '') else test.get('nodeid', '')
-        module_path = test.get('nodeid', '').split('::')[0] if '::' in test.get('nodeid', '') else ''
-        
-        try:
-            parse_test_info(test)
-        except MetadataError as e:
-            missing_metadata_tests.append(f"{test_name} ({module_path}): {str(e)}")
-    
-    if missing_metadata_tests:
+    if table.errors:
         error_msg = "Los siguientes tests no tienen metadata completa:\n\n"
-        error_msg += "\n".join(f"• {test}" for test in missing_metadata_tests)
+        error_msg += "\n".join(f"• {test}" for test in table.errors)
         error_msg += "\n\nPor favor, agrega @test_info o docstring estructurado a todos los tests."
-        raise MetadataError(error_msg) 
\ No newline at end of file
+        raise MetadataError(error_msg)
+    
+    return table
@@ -0,0 +1,115 @@
+"""
+Tabla compacta de tests procesados, indexada por módulo y test_id
+"""
+from collections import Counter
+from typing import Dict, Any, Iterator, List
+
+
+class TestRecord:
+    """
+    Información procesada de un test. Usa __slots__ para que tablas con decenas
+    de miles de tests ocupen poca memoria, y admite acceso tipo dict
+    (test['outcome']) para mantener compatibilidad con el código del PDF.
+    """
+
+    __test__ = False  # Evita que pytest lo confunda con una clase de tests
+    __slots__ = (
+        'nodeid', 'name', 'module', 'description', 'expected_result',
+        'actual_result', 'outcome', 'duration', 'test_id', 'http_requests',
+    )
+
+    def __init__(self, nodeid, name, module, description, expected_result,
+                 actual_result, outcome, duration, test_id, http_requests=()):
+        self.nodeid = nodeid
+        self.name = name
+        self.module = module
+        self.description = description
+        self.expected_result = expected_result
+        self.actual_result = actual_result
+        self.outcome = outcome
+        self.duration = duration
+        self.test_id = test_id
+        # Peticiones HTTP del test y sus fixtures (dicts con method, host, path, status, bytes, elapsed y when)
+        self.http_requests = http_requests
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        """Equivalente a dict.get"""
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte el registro a dict"""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class TestRecordTable:
+    """
+    Resultados procesados en una sola pasada: cada registro de pytest se parsea
+    una vez y la validación, agrupación, orden y estadísticas leen de esta tabla.
+    """
+
+    __test__ = False
+
+    def __init__(self):
+        self.records: List[TestRecord] = []
+        self.by_module: Dict[str, List[TestRecord]] = {}
+        self.by_test_id: Dict[str, List[TestRecord]] = {}
+        self.errors: List[str] = []
+
+    @classmethod
+    def from_results(cls, test_results) -> "TestRecordTable":
+        """
+        Construye la tabla consumiendo los resultados de forma incremental
+
+        Args:
+            test_results: Resultados de pytest (dict JSON, ruta NDJSON o iterable de registros)
+
+        Returns:
+            Tabla con los tests procesados y los errores de metadata encontrados
+        """
+        from .results_collector import iter_test_records
+        from .static_metadata import save_static_metadata_cache
+        from .test_metadata_extractor import MetadataError, parse_test_info
+
+        table = cls()
+        for test in iter_test_records(test_results):
+            try:
+                table.add(parse_test_info(test))
+            except MetadataError as e:
+                module_path, _, test_name = test.get('nodeid', '').rpartition('::')
+                table.errors.append(f"{test_name} ({module_path}): {e}")
+        save_static_metadata_cache()
+        return table
+
+    def add(self, record: TestRecord):
+        """Agrega un registro y actualiza los índices"""
+        self.records.append(record)
+        self.by_module.setdefault(record.module, []).append(record)
+        self.by_test_id.setdefault(record.test_id, []).append(record)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[TestRecord]:
+        return iter(self.records)
+
+    def modules(self) -> Dict[str, List[TestRecord]]:
+        """
+        Retorna los tests agrupados por módulo
+
+        Returns:
+            Dict con módulos en orden alfabético y tests ordenados por nombre
+        """
+        return {
+            module_name: sorted(self.by_module[module_name], key=lambda record: record.name)
+            for module_name in sorted(self.by_module)
+        }
+
+    def counts(self) -> Counter:
+        """Cantidad de tests por resultado (passed, failed, ...)"""
+        return Counter(record.outcome for record in self.records)
@@ -2,39 +2,84 @@
 Ejecutor de tests para todos los servicios
 """
 
-import subprocess
-import json
-import sys
 from pathlib import Path
-from typing import Dict, Any
-from .test_metadata_extractor import MetadataError, validate_all_tests_have_metadata
-
-
-def run_all_tests():
+from typing import Dict, List, Optional
+
+import pytest
+
+from .results_collector import ResultsCollector, RESULTS_FILE, iter_test_records
+from .metadata_check import MetadataValidator
+from .preflight import probe_services
+from .rerun_cache import merge_results, plan_fast_rerun, save_run_state
+from .scheduling import lpt_schedule
+from .services import SERVICE_TEST_PATHS, get_service_for_path
+from .test_history import TestHistory
+from .test_index import select_tests
+from .test_metadata_extractor import DuplicateTestIdError, MetadataError, validate_all_tests_have_metadata
+from .test_records import TestRecordTable
+
+
+def run_all_tests(
+    parallel: bool = False,
+    workers: Optional[int] = None,
+    preflight: bool = True,
+    fast_rerun: bool = False,
+    test_ids: Optional[List[str]] = None,
+    modules: Optional[List[str]] = None,
+    services: Optional[List[str]] = None,
+    cassettes: Optional[str] = None,
+    replay_speed: float = 1.0,
+    fake_backends: Optional[str] = None,
+):
     """
     Ejecuta todos los tests de todos los servicios y captura los resultados
 
+    Los tests se ejecutan en el mismo proceso con pytest.main y cada resultado
+    se emite como una línea NDJSON apenas termina el test.
+
+    En modo paralelo cada servicio es un grupo de pytest-xdist: sus tests corren
+    en un mismo worker (conservando los fixtures de módulo) y los resultados de
+    todos los workers llegan al mismo stream.
+
+    Args:
+        parallel: Ejecutar los servicios en paralelo con pytest-xdist
+        workers: Número de workers (por defecto uno por servicio)
+        preflight: Verificar antes los servicios y omitir las suites de los que no respondan
+        fast_rerun: Ejecutar solo los tests que fallaron la última vez y los de
+            archivos modificados, combinando con los resultados guardados del resto
+        test_ids: Ejecutar solo los tests cuyo test_id coincide con alguno de
+            estos patrones (ej: "INV-MOV-0*"), según el índice de tests
+        modules: Ejecutar solo los tests de estos módulos (ej: "Compras")
+        services: Ejecutar solo los tests de estos servicios (ej: "ui-menus")
+        cassettes: "record" para grabar las peticiones HTTP en cassettes o
+            "replay" para reproducirlas sin backends (ver utils/cassettes.py)
+        replay_speed: Factor sobre la latencia grabada al reproducir
+        fake_backends: "inprocess" o "ports" para ejecutar contra los backends
+            simulados en memoria (ver utils/fake_backends)
+
     Returns:
-        Dict con los resultados de pytest JSON
+        TestRecordTable con los tests procesados una sola vez (el stream NDJSON
+        queda en RESULTS_FILE)
 
     Raises:
         TestMetadataError: Si algún test no tiene metadata completa
-        RuntimeError: Si hay errores al ejecutar pytest
+        RuntimeError: Si hay errores al ejecutar pytest o la selección no
+            coincide con ningún test
+        ValueError: Si se combina fast_rerun con una selección de tests
     """
+    if test_ids or modules or services:
+        if fast_rerun:
+            raise ValueError("La re-ejecución rápida no se puede combinar con una selección de tests")
+        return _run_selected_tests(
+            parallel, workers, preflight, test_ids, modules, services,
+            cassettes=cassettes, replay_speed=replay_speed, fake_backends=fake_backends,
+        )
+
     print("Ejecutando tests de todos los servicios...")
     print("=" * 50)
 
     # Ejecutar tests de todos los servicios
-    test_paths = [
-        "tests/auth/",
-        "tests/cobertura/",
-        "tests/compras/",
-        "tests/menus/",
-        "tests/ui/menus",
-        "tests/ui/rh",
-        "tests/rh",
-        "tests/ui/cobertura-ui",
-    ]
+    test_paths = list(SERVICE_TEST_PATHS.values())
 
     # Filtrar solo las rutas que existen
     existing_paths = []
@@ -48,111 +93,259 @@ def run_all_tests():
     if not existing_paths:
         raise RuntimeError("No se encontraron directorios de tests")
 
-    print(f"\nEjecutando pytest en: {', '.join(existing_paths)}")
-    print("-" * 50)
+    targets = existing_paths
+    rerun_files = None
+    if fast_rerun:
+        plan = plan_fast_rerun(existing_paths)
+        if plan is None:
+            print("\nRe-ejecución rápida no disponible: se ejecutará la suite completa")
+        else:
+            targets, rerun_files = plan
+            print(f"\nRe-ejecución rápida: {len(targets)} objetivos (tests fallidos y archivos modificados)")
 
-    # Ejecutar tests con reporte JSON
-    cmd = (
-        ["poetry", "run", "pytest"]
-        + existing_paths
-        + ["--json-report", "--json-report-file=test_results.json", "-v", "--tb=short"]
-    )
+    if targets:
+        _execute_pytest(targets, parallel, workers, preflight, cassettes, replay_speed, fake_backends)
+    else:
+        print("\nNo hay tests fallidos ni archivos modificados: se reutilizan los resultados anteriores")
+        Path(RESULTS_FILE).write_text("")
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    test_results = Path(RESULTS_FILE)
+    if rerun_files is not None:
+        merge_results(test_results, rerun_files, test_results)
+    # Los resultados reproducidos o contra backends simulados no son los de los
+    # servicios reales: no deben alimentar la próxima re-ejecución rápida
+    if not _is_simulated(cassettes, fake_backends):
+        save_run_state(test_results)
 
-    print("Salida de pytest:")
-    print(result.stdout)
-    if result.stderr:
-        print("Errores/Advertencias:")
-        print(result.stderr)
+    return _summarize_results(test_results)
 
-    # Cargar resultados JSON
-    try:
-        with open("test_results.json", "r") as f:
-            test_results = json.load(f)
-    except FileNotFoundError:
-        raise RuntimeError("Error: No se pudo generar el archivo de resultados JSON")
-    except json.JSONDecodeError as e:
-        raise RuntimeError(f"Error al parsear JSON de resultados: {e}")
 
+def _run_selected_tests(parallel, workers, preflight, test_ids, modules, services,
+                        cassettes=None, replay_speed=1.0, fake_backends=None):
+    """
+    Ejecuta solo los tests seleccionados por test_id, módulo o servicio
+
+    Los nodeids se obtienen del índice persistente (utils/test_index.py), por lo
+    que pytest solo recolecta los archivos seleccionados. El estado de
+    re-ejecución rápida no se actualiza porque los resultados son parciales.
+    """
+    targets = select_tests(ids=test_ids, modules=modules, services=services)
+    if not targets:
+        raise RuntimeError("Ningún test coincide con la selección (--id / --module / --service)")
+
+    print(f"Ejecutando {len(targets)} tests seleccionados...")
+    print("=" * 50)
+    _execute_pytest(targets, parallel, workers, preflight, cassettes, replay_speed, fake_backends)
+    return _summarize_results(Path(RESULTS_FILE))
+
+
+def _summarize_results(test_results: Path):
+    """Valida la metadata de los resultados y muestra un resumen rápido"""
     # Validar que todos los tests tengan metadata completa
     print("\n" + "=" * 50)
     print("Validando metadata de tests...")
     try:
-        validate_all_tests_have_metadata(test_results)
+        table = validate_all_tests_have_metadata(test_results)
         print("✓ Todos los tests tienen metadata completa")
     except MetadataError as e:
         print("✗ Error de metadata:")
         print(str(e))
         raise
 
-    # Estadísticas rápidas
-    total_tests = len(test_results.get("tests", []))
-    passed_tests = sum(
-        1 for test in test_results.get("tests", []) if test.get("outcome") == "passed"
-    )
-    failed_tests = sum(
-        1 for test in test_results.get("tests", []) if test.get("outcome") == "failed"
-    )
-    skipped_tests = sum(
-        1 for test in test_results.get("tests", []) if test.get("outcome") == "skipped"
-    )
+    # Estadísticas rápidas desde la tabla ya procesada
+    counts = table.counts()
+    total_tests = sum(counts.values())
+    passed_tests = counts["passed"]
+    failed_tests = counts["failed"]
+    skipped_tests = counts["skipped"]
+    unavailable_tests = counts["unavailable"]
 
     print(f"\n📊 Resumen rápido:")
     print(f"   Total: {total_tests}")
     print(f"   Pasaron: {passed_tests}")
     print(f"   Fallaron: {failed_tests}")
     print(f"   Omitidos: {skipped_tests}")
+    print(f"   Servicio no disponible: {unavailable_tests}")
 
     if failed_tests > 0:
         print(
             f"\n⚠ Hay {failed_tests} tests fallidos, pero el reporte se generará de todas formas"
         )
 
-    return test_results
+    return table
+
 
+def _is_simulated(cassettes: Optional[str], fake_backends: Optional[str]) -> bool:
+    """Si la ejecución no consulta los backends reales (cassettes reproducidos o backends simulados)"""
+    return cassettes == "replay" or bool(fake_backends)
 
-def organize_tests_by_module(test_results: Dict[str, Any]) -> Dict[str, list]:
+
+def _execute_pytest(targets, parallel: bool, workers: Optional[int], preflight: bool,
+                    cassettes: Optional[str] = None, replay_speed: float = 1.0,
+                    fake_backends: Optional[str] = None):
     """
-    Organiza los tests por módulo en orden alfabético
+    Ejecuta pytest en el mismo proceso sobre las rutas o nodeids indicados
 
-    Args:
-        test_results: Resultados de pytest JSON
+    Los resultados se escriben en RESULTS_FILE y se guardan en el historial
+    (salvo al reproducir cassettes o usar los backends simulados, cuyas
+    duraciones no son las de los backends reales). En esos modos tampoco se
+    actualiza el cache lastfailed de pytest.
+    """
+    # -c fija el rootdir en la raíz del proyecto aunque solo se ejecute un servicio
+    pytest_args = list(targets) + [
+        "-c", "pytest.ini", "-v", "--tb=short",
+        "-p", "utils.scheduling", "-p", "utils.circuit_breaker",
+    ]
+
+    if cassettes:
+        pytest_args += ["-p", "utils.cassettes", "--cassette-mode", cassettes, "--replay-speed", str(replay_speed)]
+        if cassettes == "replay":
+            # Los backends no se consultan al reproducir
+            preflight = False
+
+    if fake_backends:
+        pytest_args += ["-p", "utils.fake_backends.plugin", "--fake-backends", fake_backends]
+        preflight = False
+
+    if _is_simulated(cassettes, fake_backends):
+        # Sin cacheprovider el lastfailed de la ejecución real no se sobrescribe
+        pytest_args += ["-p", "no:cacheprovider"]
+
+    if preflight:
+        unavailable = _run_preflight(targets)
+        if unavailable:
+            pytest_args += ["-p", "utils.preflight", "--skip-services", ",".join(unavailable)]
+
+    print(f"\nEjecutando pytest en: {', '.join(targets)}")
+    print("-" * 50)
+
+    # Ejecutar tests en el mismo proceso recolectando los resultados
+    if parallel:
+        services = {get_service_for_path(target) for target in targets}
+        num_workers = workers or len(services)
+        print(f"Modo paralelo: {num_workers} workers, un grupo por servicio")
+        _print_schedule_plan(targets, num_workers)
+        # --no-loadscope-reorder respeta el orden longest-first de utils.scheduling
+        pytest_args += [
+            "-p", "utils.sharding", "-n", str(num_workers),
+            "--dist", "loadgroup", "--no-loadscope-reorder",
+        ]
+
+    collector = ResultsCollector(RESULTS_FILE)
+    exitcode = pytest.main(pytest_args, plugins=[collector])
+
+    if exitcode in (pytest.ExitCode.INTERRUPTED, pytest.ExitCode.INTERNAL_ERROR, pytest.ExitCode.USAGE_ERROR):
+        raise RuntimeError(f"Error al ejecutar pytest (código de salida: {int(exitcode)})")
+
+    if not _is_simulated(cassettes, fake_backends):
+        TestHistory().record_run(iter_test_records(collector.output_path))
+
+
+def validate_metadata_only() -> int:
+    """
+    Valida la metadata de todos los tests sin ejecutarlos
+
+    Solo recolecta los tests (pytest --collect-only), por lo que no accede a
+    los servicios y termina en segundos.
 
     Returns:
-        Dict con tests organizados por módulo
+        Número de tests validados
+
+    Raises:
+        DuplicateTestIdError: Si el único problema son test_id repetidos
+            dentro de un servicio
+        MetadataError: Si algún test no tiene metadata completa o algún
+            archivo no se pudo recolectar (incluye también los duplicados)
+        RuntimeError: Si no se encuentran directorios de tests
     """
-    from .test_metadata_extractor import parse_test_info
+    test_paths = [path for path in SERVICE_TEST_PATHS.values() if Path(path).exists()]
+    if not test_paths:
+        raise RuntimeError("No se encontraron directorios de tests")
 
-    modules = {}
+    print("Validando metadata en tiempo de colección (sin ejecutar tests)...")
+    validator = MetadataValidator()
+    # -qqq compensa el -v de addopts: se muestra solo la cantidad de tests por archivo
+    pytest.main(test_paths + ["-c", "pytest.ini", "--collect-only", "-qqq"], plugins=[validator])
 
-    for test in test_results.get("tests", []):
-        try:
-            test_info = parse_test_info(test)
-            module_name = test_info["module"]
+    problems = validator.format_problems()
+    if validator.has_metadata_errors():
+        raise MetadataError(problems)
+    if problems:
+        raise DuplicateTestIdError(problems, validator.get_duplicates())
 
-            if module_name not in modules:
-                modules[module_name] = []
+    print(f"✓ {validator.total} tests con metadata completa y test_id únicos por servicio")
+    return validator.total
 
-            modules[module_name].append(test_info)
-        except MetadataError as e:
-            print(f"Error procesando test: {e}")
-            raise
 
-    # Ordenar alfabéticamente por módulo
-    sorted_modules = {}
-    for module_name in sorted(modules.keys()):
-        # También ordenar tests dentro de cada módulo
-        sorted_modules[module_name] = sorted(
-            modules[module_name], key=lambda x: x["name"]
-        )
+def _run_preflight(test_paths) -> list:
+    """
+    Verifica en paralelo los servicios de las rutas a ejecutar
+
+    Returns:
+        Lista de servicios no disponibles cuyas suites deben omitirse
+    """
+    services = [get_service_for_path(path) for path in test_paths]
+    print("\nVerificando disponibilidad de servicios...")
+    status = probe_services(service for service in services if service)
+
+    unavailable = []
+    for service in sorted(status):
+        service_status = status[service]
+        if not service_status['available']:
+            print(f"✗ {service}: no disponible ({service_status['reason']})")
+            unavailable.append(service)
+        elif not service_status['healthy']:
+            print(f"⚠ {service}: responde pero reporta problemas de salud")
+        else:
+            print(f"✓ {service}: disponible")
+
+    return [service for service in unavailable if service in services]
+
+
+def _print_schedule_plan(test_paths, workers: int):
+    """Muestra la asignación longest-first de servicios a workers según el historial"""
+    durations = TestHistory().expected_durations()
+    if not durations:
+        print("Sin historial de duraciones: se usará el orden por defecto")
+        return
+
+    services = {get_service_for_path(path) for path in test_paths}
+    service_totals = {service: 0.0 for service in services if service}
+    for nodeid, duration in durations.items():
+        service = get_service_for_path(nodeid)
+        if service in service_totals:
+            service_totals[service] += duration
+
+    plan = lpt_schedule(service_totals, workers)
+    print("Plan de ejecución (duración esperada según historial):")
+    for index, (load, assigned) in enumerate(plan):
+        if assigned:
+            print(f"   worker {index}: {load:.1f}s → {', '.join(assigned)}")
+    print(f"   Tiempo total estimado: {max(load for load, _ in plan):.1f}s")
+
+
+def organize_tests_by_module(test_results) -> Dict[str, list]:
+    """
+    Organiza los tests por módulo en orden alfabético
+
+    Args:
+        test_results: TestRecordTable retornada por run_all_tests, o resultados de
+            pytest (dict JSON, ruta NDJSON o iterable de registros)
+
+    Returns:
+        Dict con tests organizados por módulo
+    """
+    if not isinstance(test_results, TestRecordTable):
+        test_results = validate_all_tests_have_metadata(test_results)
 
-    return sorted_modules
+    return test_results.modules()
 
 
 def cleanup_temp_files():
     """Limpia archivos temporales generados por pytest"""
-    temp_files = ["test_results.json", ".pytest_cache"]
+    # .pytest_cache se conserva: contiene el cache lastfailed usado por --lf/--ff
+    # y por el modo de re-ejecución rápida
+    temp_files = [RESULTS_FILE]
 
     for file_path in temp_files:
         path = Path(file_path)